@@ -0,0 +1,94 @@
+# Alien Symbolic Interpreter - headless engine package
+
+from .core import (
+    symbols,
+    symbol_values,
+    make_handler,
+    PURE,
+    CONTEXTUAL,
+    STOCHASTIC,
+    value_classes,
+    classify_value_function,
+    symbol_class,
+    register_symbol,
+    phenomena,
+    signals,
+    check_phenomenon,
+    phenomenon_index,
+    register_phenomenon,
+    register_signal,
+    add_lazy_loader,
+    ensure_loaded,
+    search_phenomena,
+    structural_index,
+    prefix_index,
+    complete_phenomena,
+    MANDALA_CONNECTIONS,
+    MandalaLayout,
+    mandala_layout,
+    SYMBOL,
+    VALUE,
+    CONST,
+    CACHED,
+    OPERATOR,
+    TRANSITION,
+    ASSIGN,
+    PlanStep,
+    TransitionSpan,
+    CompiledExpression,
+    tokenize,
+    compile_expression,
+    clear_compiled_cache,
+    compile_generation,
+    use_memoization,
+    clear_memo,
+    memo_stats,
+    use_profiler,
+    execute_plan,
+    render_output,
+    interpret,
+    interpret_result,
+    symbol_dependencies,
+    dependency_graph,
+    evaluation_order,
+    output_plan,
+    evaluate_outputs,
+    decode_expression,
+    decode_signal,
+    use_random,
+)
+from .matching import Catalog, CatalogIndex, PhenomenonIndex, PrefixIndex, StructuralIndex, add_phenomenon, canonical_form, normalize_equation
+from .parser import (
+    Token,
+    Symbol,
+    Literal,
+    Group,
+    Sequence,
+    BinaryOp,
+    lex,
+    parse_expression,
+    walk,
+)
+from .context import SymbolContext, symbol_id, symbol_ids
+from .ensemble import EnsembleResult, run_ensemble
+from .incremental import IncrementalEvaluator
+from .results import (
+    Interpretation,
+    SymbolEvent,
+    OperatorEvent,
+    TransitionEvent,
+    render_event,
+    render_text,
+    event_dict,
+)
+from .metrics import (
+    Profiler,
+    enable_profiling,
+    disable_profiling,
+    current_profiler,
+    span,
+    prometheus_text,
+    write_metrics,
+)
+from .catalog_cache import load_catalog, save_catalog, warm_start
+from .packs import discover_packs, load_pack, register_pack, symbol_names
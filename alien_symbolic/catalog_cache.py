@@ -0,0 +1,151 @@
+# On-disk catalog cache
+# With large symbol packs most of the startup time goes into reading the packs and, on
+# the first phenomenon lookup, parsing every equation into the matching indexes. The
+# cache keeps all of that in one pickle file under <data dir>/cache:
+#
+#   - the contents of every registered pack (no JSON/TOML parsing)
+#   - the normalized-equation, structural and prefix indexes of the phenomena catalog
+#   - the compiled plans of every signal expression, as skeletons (core.plan_skeleton)
+#
+# The file starts with a small header listing the sources it was built from (the engine
+# modules and the pack files, in registration order) with their mtime, size and SHA-256.
+# A source whose mtime or size changed is hashed again, so a touched but unchanged file
+# keeps the cache valid; any other difference, a new CACHE_VERSION or another Python
+# version rebuilds it. The header also keeps a digest of the phenomena catalog the
+# indexes were built from: a phenomenon registered in code before warm_start() (not in
+# any source file) makes the cache a miss instead of installing indexes without it.
+#
+#   warm_start()   # after registering packs: load the cache, or build and save it
+
+import hashlib
+import os
+import pickle
+import sys
+
+from . import core, matching, packs, parser
+from .paths import data_dir
+
+CACHE_VERSION = 2
+CACHE_FILE = "catalog.cache"
+
+def cache_path():
+    return os.path.join(data_dir("cache"), CACHE_FILE)
+
+def _source_paths():
+    # Módulos que definem o catálogo embutido e o formato das chaves, depois os pacotes
+    modules = [core.__file__, matching.__file__, parser.__file__, packs.__file__]
+    return modules + list(packs.packs.values())
+
+def _digest(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def _catalog_digest():
+    return hashlib.sha256(repr(sorted(core.phenomena.items())).encode("utf-8")).hexdigest()
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size, _digest(path))
+
+def _header():
+    return {
+        "version": CACHE_VERSION,
+        "python": tuple(sys.version_info[:2]),
+        "sources": [_fingerprint(path) for path in _source_paths()],
+    }
+
+def _is_current(header):
+    if header.get("version") != CACHE_VERSION or header.get("python") != tuple(sys.version_info[:2]):
+        return False
+    sources = header.get("sources", [])
+    if [source[0] for source in sources] != _source_paths():
+        return False
+    for path, mtime_ns, size, digest in sources:
+        try:
+            stat = os.stat(path)
+            if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size) and _digest(path) != digest:
+                return False
+        except OSError:
+            return False
+    return True
+
+def load_catalog(path=None):
+    # Installs the cached catalog if it matches the registered packs; True if it did.
+    # Must run before the packs are loaded (ensure_loaded()). A cache that cannot be
+    # read, including an unusable data directory, is a miss.
+    try:
+        path = path or cache_path()
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if not _is_current(header):
+                return False
+            body = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+        return False
+    if core._pending_loaders:
+        packs.preload_packs(body["packs"])
+    core.ensure_loaded()
+    if header.get("catalog") != _catalog_digest():
+        return False
+    core.phenomenon_index.load_state(body["phenomenon_index"])
+    core.install_indexes(body["structural_index"], body["prefix_index"])
+    core.preload_plans(body["plans"])
+    return True
+
+def _plans():
+    plans = {}
+    for expressions in core.signals.values():
+        for expression in expressions:
+            if expression not in plans:
+                try:
+                    plans[expression] = core.plan_skeleton(core.compile_expression(expression))
+                except Exception:
+                    pass  # Fica para ser compilada (e reportar o erro) quando usada
+    return plans
+
+def save_catalog(path=None):
+    # Builds every index and signal plan for the current catalog and writes the cache
+    path = path or cache_path()
+    header = _header()
+    core.ensure_loaded()
+    header["catalog"] = _catalog_digest()
+    body = {
+        "packs": {pack_path: packs.read_pack(pack_path) for pack_path in packs.packs.values()},
+        "phenomenon_index": core.phenomenon_index.state(),
+        "structural_index": core.structural_index().state(),
+        "prefix_index": core.prefix_index().state(),
+        "plans": _plans(),
+    }
+    try:
+        data = pickle.dumps(body, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Valor de símbolo que não pode ser gravado: o cache vai sem os planos
+        body["plans"] = {}
+        data = pickle.dumps(body, pickle.HIGHEST_PROTOCOL)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            f.write(data)
+        os.replace(temporary, path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+def warm_start(path=None):
+    # Loads the cache, or builds and saves it when missing or stale. Returns True if the
+    # cache was used. The cache is only an optimization: when it cannot be read or
+    # written the catalog is loaded as usual.
+    if load_catalog(path):
+        return True
+    # Fora do try: erros nos pacotes continuam sendo reportados
+    core.ensure_loaded()
+    try:
+        save_catalog(path)
+    except OSError:
+        pass  # Sem cache gravável, só se perde o tempo de montá-lo
+    return False
@@ -0,0 +1,112 @@
+# Batch command-line runner
+# Reads expressions (one per line) from files or stdin, interprets each one with a fresh
+# context and streams one JSON object per line to stdout. Input and output are processed
+# line by line, so arbitrarily large symbol logs run in constant memory.
+
+import argparse
+import io
+import json
+import sys
+from collections import deque
+
+from .catalog_cache import warm_start
+from .core import ensure_loaded
+from .metrics import enable_profiling, write_metrics
+from .packs import register_pack
+from .parallel import decode_expressions_parallel
+
+FLUSH_EVERY = 1000
+
+def iter_expressions(paths, stdin=None):
+    # Gera (origem, número da linha, expressão), ignorando linhas em branco
+    for path in paths or ["-"]:
+        if path == "-":
+            stream = stdin or io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+            source = "<stdin>"
+            close = False
+        else:
+            stream = open(path, "r", encoding="utf-8", errors="replace")
+            source = path
+            close = True
+        try:
+            for line_number, line in enumerate(stream, 1):
+                expression = line.strip()
+                if expression:
+                    yield source, line_number, expression
+        finally:
+            if close:
+                stream.close()
+
+def run_batch(paths, out, stdin=None, seed=None, workers=1, search=False, outputs=None, events=False):
+    # Metadados (origem, linha) dos itens em processamento, na ordem de entrada
+    in_flight = deque()
+
+    def expressions():
+        for source, line_number, expression in iter_expressions(paths, stdin):
+            in_flight.append((source, line_number))
+            yield expression
+
+    count = 0
+    for result in decode_expressions_parallel(expressions(), seed=seed, workers=workers, search=search, outputs=outputs, events=events):
+        source, line_number = in_flight.popleft()
+        record = {"source": source, "line": line_number}
+        record.update(result)
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+        if count % FLUSH_EVERY == 0:
+            out.flush()
+    out.flush()
+    return count
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m alien_symbolic",
+        description="Interpret symbolic expressions (one per line) and write JSON Lines to stdout.",
+    )
+    parser.add_argument("files", nargs="*", help="input files with one expression per line ('-' or none for stdin)")
+    parser.add_argument("--seed", type=int, help="base seed for reproducible output (each expression gets its own derived seed)")
+    parser.add_argument("--search", action="store_true", help="also list every phenomenon the expression contains or is part of")
+    parser.add_argument("--output", action="append", metavar="SYMBOL", help="only evaluate this symbol and what it depends on; may be repeated")
+    parser.add_argument("--events", action="store_true", help="write typed events (symbol, operator, transition) instead of the result text")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes (0 = one per CPU core)")
+    parser.add_argument("--pack", action="append", default=[], metavar="PATH", help="load a symbol pack (JSON or TOML); may be repeated")
+    parser.add_argument("--metrics", metavar="PATH", help="profile symbols and write metrics to PATH when done (JSON for *.json, Prometheus text otherwise); needs --workers 1")
+    parser.add_argument("--no-catalog-cache", action="store_true", help="load the symbol packs and build the catalog indexes without the on-disk cache")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.metrics:
+        # Os workers teriam cada um o seu profiler; só o processo principal é medido
+        if args.workers != 1:
+            parser.error("--metrics needs --workers 1")
+        enable_profiling()
+    try:
+        for path in args.pack:
+            register_pack(path)
+        # Carregado antes de iniciar os workers; cada worker registra os mesmos pacotes
+        if args.no_catalog_cache:
+            ensure_loaded()
+        else:
+            warm_start()
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot load symbol pack: {e}")
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n", write_through=False)
+    try:
+        run_batch(args.files, out, seed=args.seed, workers=args.workers, search=args.search, outputs=args.output, events=args.events)
+    except BrokenPipeError:
+        # Saída fechada (ex.: "| head"); encerrar silenciosamente
+        sys.stderr.close()
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        try:
+            out.detach()
+        except Exception:
+            pass
+    if args.metrics:
+        write_metrics(args.metrics)
+    return 0
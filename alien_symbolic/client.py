@@ -0,0 +1,182 @@
+# Client and load generator for the local decoding service (alien_symbolic.server)
+#
+#   with DecodeClient(port=8765) as client:
+#       print(client.interpret("Ψ + ∅ → ꩜", seed=7))
+#
+#   python -m alien_symbolic.client --requests 20000 --connections 8 --depth 16
+#
+# The load generator opens several keep-alive connections, keeps up to depth requests
+# in flight on each one and reports throughput and latency percentiles.
+
+import argparse
+import asyncio
+import itertools
+import json
+import socket
+import sys
+import time
+from collections import namedtuple
+
+from .core import phenomena, signals
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+LoadReport = namedtuple("LoadReport", [
+    "requests", "errors", "elapsed", "requests_per_second",
+    "latency_p50", "latency_p95", "latency_p99", "latency_max",
+])
+
+class DecodeClient:
+    # Blocking client over one keep-alive connection; path selects a Unix socket
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, timeout=None):
+        if path is not None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            self._sock.connect(path)
+        else:
+            self._sock = socket.create_connection((host, port), timeout)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile("rwb")
+        self._ids = itertools.count(1)
+
+    def request(self, op, **fields):
+        # Returns the response dict; errors are in response["error"]
+        fields["op"] = op
+        fields.setdefault("id", next(self._ids))
+        self._file.write((json.dumps(fields, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("connection closed by the server")
+        return json.loads(line)
+
+    def interpret(self, expression, seed=None, search=False, events=False):
+        return self.request("interpret", expression=expression, seed=seed, search=search, events=events)
+
+    def phenomenon(self, name=None, expression=None, search=False):
+        return self.request("phenomenon", name=name, expression=expression, search=search)
+
+    def signal(self, name=None, expressions=None, seed=None):
+        return self.request("signal", name=name, expressions=expressions, seed=seed)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def workload(op="interpret"):
+    # Requisições de exemplo tiradas dos catálogos, repetidas indefinidamente
+    expressions = [equation for equation, _ in phenomena.values()]
+    expressions += [expression for exprs in signals.values() for expression in exprs]
+    requests = {
+        "interpret": [{"op": "interpret", "expression": e} for e in expressions],
+        "phenomenon": [{"op": "phenomenon", "expression": e} for e in expressions],
+        "signal": [{"op": "signal", "name": name} for name in signals],
+    }
+    if op == "mixed":
+        return itertools.cycle(requests["interpret"] + requests["phenomenon"] + requests["signal"])
+    return itertools.cycle(requests[op])
+
+async def _connection_load(host, port, path, requests, count, depth, latencies, errors):
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sent_at = {}
+    window = asyncio.Semaphore(depth)
+
+    async def send():
+        for i in range(count):
+            await window.acquire()
+            request = dict(next(requests), id=i)
+            sent_at[i] = time.perf_counter()
+            writer.write((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+
+    sender = asyncio.ensure_future(send())
+    try:
+        for _ in range(count):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("connection closed by the server")
+            response = json.loads(line)
+            latencies.append(time.perf_counter() - sent_at.pop(response["id"]))
+            if "error" in response:
+                errors.append(response["error"])
+            window.release()
+        await sender
+    finally:
+        sender.cancel()
+        writer.close()
+
+def _percentile(values, p):
+    return values[min(len(values) - 1, int(p * len(values)))] if values else 0.0
+
+async def load_test(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, requests=10000, connections=4, depth=8, op="interpret"):
+    # Sends requests spread over connections; returns a LoadReport
+    source = workload(op)
+    latencies = []
+    errors = []
+    per_connection = [requests // connections + (i < requests % connections) for i in range(connections)]
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _connection_load(host, port, path, source, count, depth, latencies, errors)
+        for count in per_connection if count
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return LoadReport(
+        len(latencies),
+        len(errors),
+        elapsed,
+        len(latencies) / elapsed if elapsed else 0.0,
+        _percentile(latencies, 0.5),
+        _percentile(latencies, 0.95),
+        _percentile(latencies, 0.99),
+        latencies[-1] if latencies else 0.0,
+    )
+
+def format_report(report):
+    return (
+        f"{report.requests} requests ({report.errors} errors) in {report.elapsed:.2f}s: "
+        f"{report.requests_per_second:.0f} req/s; latency p50 {report.latency_p50 * 1000:.3f} ms, "
+        f"p95 {report.latency_p95 * 1000:.3f} ms, p99 {report.latency_p99 * 1000:.3f} ms, "
+        f"max {report.latency_max * 1000:.3f} ms"
+    )
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m alien_symbolic.client",
+        description="Load generator for the alien_symbolic decoding service.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead of TCP")
+    parser.add_argument("--requests", type=int, default=10000, help="total requests to send")
+    parser.add_argument("--connections", type=int, default=4, help="concurrent keep-alive connections")
+    parser.add_argument("--depth", type=int, default=8, help="requests in flight per connection")
+    parser.add_argument("--op", choices=("interpret", "phenomenon", "signal", "mixed"), default="interpret")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        report = loop.run_until_complete(load_test(args.host, args.port, args.unix, args.requests, args.connections, args.depth, args.op))
+    except OSError as e:
+        print(f"cannot reach the server: {e}", file=sys.stderr)
+        return 1
+    finally:
+        loop.close()
+    print(json.dumps(report._asdict()) if args.json else format_report(report))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
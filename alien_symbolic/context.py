@@ -0,0 +1,126 @@
+# Evaluation context
+# SymbolContext keeps symbol results in a flat list indexed by symbol id, with a small
+# dict only for non-symbol keys (transition targets such as "● × ꩜"). It behaves like
+# the dict contexts used so far (get, [], update, in, items), and snapshot()/restore()
+# copy just the value list, so a signal's context can be forked cheaply.
+
+# Ids are assigned once per symbol name and never reused
+symbol_ids = {}
+
+_UNSET = object()
+
+def symbol_id(name):
+    slot = symbol_ids.get(name)
+    if slot is None:
+        slot = symbol_ids[name] = len(symbol_ids)
+    return slot
+
+class SymbolContext:
+    __slots__ = ("_values", "_extra")
+
+    def __init__(self, initial=None):
+        self._values = [_UNSET] * len(symbol_ids)
+        self._extra = None
+        if initial:
+            self.update(initial)
+
+    def _grow(self):
+        # Símbolos registrados depois da criação do contexto
+        self._values.extend([_UNSET] * (len(symbol_ids) - len(self._values)))
+
+    def __setitem__(self, key, value):
+        slot = symbol_ids.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if slot >= len(self._values):
+            self._grow()
+        self._values[slot] = value
+
+    def get(self, key, default=None):
+        slot = symbol_ids.get(key)
+        if slot is None:
+            if self._extra is None:
+                return default
+            return self._extra.get(key, default)
+        if slot >= len(self._values):
+            return default
+        value = self._values[slot]
+        return default if value is _UNSET else value
+
+    def __getitem__(self, key):
+        value = self.get(key, _UNSET)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        slot = symbol_ids.get(key)
+        if slot is None:
+            del self._extra[key]
+        else:
+            self._values[slot] = _UNSET
+
+    def __contains__(self, key):
+        return self.get(key, _UNSET) is not _UNSET
+
+    def update(self, other=(), **kwargs):
+        items = other.items() if hasattr(other, "items") else other
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def items(self):
+        names = list(symbol_ids)
+        for slot, value in enumerate(self._values):
+            if value is not _UNSET:
+                yield names[slot], value
+        if self._extra:
+            yield from self._extra.items()
+
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return sum(1 for value in self._values if value is not _UNSET) + (len(self._extra) if self._extra else 0)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (SymbolContext, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SymbolContext({self.to_dict()!r})"
+
+    def clear(self):
+        self._values = [_UNSET] * len(symbol_ids)
+        self._extra = None
+
+    def snapshot(self):
+        # Valores são tratados como imutáveis; copiar a lista é suficiente
+        return (tuple(self._values), dict(self._extra) if self._extra else None)
+
+    def restore(self, snapshot):
+        values, extra = snapshot
+        self._values = list(values)
+        self._extra = dict(extra) if extra else None
+
+    def fork(self):
+        forked = SymbolContext.__new__(SymbolContext)
+        forked._values = list(self._values)
+        forked._extra = dict(self._extra) if self._extra else None
+        return forked
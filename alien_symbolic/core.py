@@ -0,0 +1,777 @@
+# Alien Symbolic Interpreter - headless core
+# Symbol table, phenomenon and signal catalogs, and the expression compiler/interpreter.
+# Nothing here depends on tkinter, so batch workers can import it on display-less servers.
+
+import math
+import random
+from collections import namedtuple
+from functools import lru_cache
+from time import perf_counter
+
+from .context import SymbolContext, symbol_id, symbol_ids
+from .matching import Catalog, PhenomenonIndex, PrefixIndex, StructuralIndex, add_phenomenon
+from .memo import MISSING, MemoCache, freeze
+from .parser import BinaryOp, Symbol, lex, parse_tokens, to_source, walk
+from .results import Interpretation, OperatorEvent, SymbolEvent, TransitionEvent
+
+# Source of randomness for the stochastic symbols. Defaults to the global random module;
+# use_random() swaps in a dedicated random.Random so a task can be replayed exactly.
+_rng = random
+
+def use_random(rng):
+    global _rng
+    previous = _rng
+    _rng = rng if rng is not None else random
+    return previous
+
+# Symbol value functions: each one computes the symbol's result, reading earlier results
+# from the context where needed
+def _possibilities(ctx):
+    return [f"State {i}: Energy Level {_rng.randint(1, 100)}" for i in range(max(2, _rng.randint(2, 5)))]
+
+def _collapse(ctx):
+    return f"State Collapsed to {_rng.choice(ctx.get('∴', ['Unknown State']))}"
+
+def _entangle(ctx):
+    states = ctx.get('∴', ['Unknown State 1', 'Unknown State 2'])
+    if len(states) >= 2:
+        return f"Entangled Pair Linked: {states[0]} ↔ {states[1]}"
+    return "Entangled Pair Not Formed (Insufficient States)"
+
+def _network(ctx):
+    return f"Network Transmission: {ctx.get('⧗', 'No Entanglement')}"
+
+def _reality(ctx):
+    return f"Reality Formed: {ctx.get('✧', 'No Collapse Observed')}"
+
+symbol_values = {
+    "●": lambda ctx: "Universe Initialized (Big Bang Triggered)",
+    "◐": lambda ctx: "Duality Formed (Half-State Observed)",
+    "∴": _possibilities,
+    "✧": _collapse,
+    "Ψ": lambda ctx: "Quantum Potential Activated",
+    "∅": lambda ctx: "Void State (No Energy)",
+    "꩜": lambda ctx: "Dimensional Fold Opened (Spacetime Warped)",
+    "⧗": _entangle,
+    "⇌": lambda ctx: "Oscillation Active (Energy Fluctuating)",
+    "⬠": _network,
+    "⇧": lambda ctx: "Expanding (Universe Growing)",
+    "Ω": _reality,
+    "⇀": lambda ctx: "Subtle Motion (Neutrino-Like Movement)",
+    "ϕ": lambda ctx: "Spiral Growth (Galactic Formation)",
+    "∞": lambda ctx: "Infinite Potential (Unbounded Energy)",
+}
+
+# Symbol classes for memoization: PURE value functions always return the same value,
+# CONTEXTUAL ones depend only on the context keys they read, STOCHASTIC ones draw
+# random numbers (or are unknown, e.g. user-supplied functions)
+PURE = "pure"
+CONTEXTUAL = "contextual"
+STOCHASTIC = "stochastic"
+
+# value function -> (class, context keys read)
+value_classes = {fn: (PURE, ()) for name, fn in symbol_values.items() if name not in ("∴", "✧", "⧗", "⬠", "Ω")}
+value_classes.update({
+    _possibilities: (STOCHASTIC, ()),
+    _collapse: (STOCHASTIC, ("∴",)),
+    _entangle: (CONTEXTUAL, ("∴",)),
+    _network: (CONTEXTUAL, ("⧗",)),
+    _reality: (CONTEXTUAL, ("✧",)),
+})
+
+def classify_value_function(value_function, kind, reads=()):
+    # Declares how a (custom) value function may be memoized
+    value_classes[value_function] = (kind, tuple(reads))
+    clear_compiled_cache()
+
+def symbol_class(name):
+    value_function = getattr(symbols.get(name), "value_function", None)
+    return value_classes.get(value_function, (STOCHASTIC, ()))[0]
+
+def make_handler(name, value_function):
+    # Handler with direct assignment (no temporary dict per call); the value function is
+    # kept so compiled plans can store the result without going through the handler
+    def handler(ctx):
+        ctx[name] = value_function(ctx)
+    handler.value_function = value_function
+    return handler
+
+# Symbol-function mapping (with simulated behaviors)
+symbols = {name: make_handler(name, fn) for name, fn in symbol_values.items()}
+for _name in symbols:
+    symbol_id(_name)
+
+def register_symbol(name, value_function, kind=STOCHASTIC, reads=()):
+    # Adds or replaces a symbol; kind/reads declare how it may be memoized
+    symbol_values[name] = value_function
+    value_classes[value_function] = (kind, tuple(reads))
+    symbols[name] = make_handler(name, value_function)
+    clear_compiled_cache()
+
+# Phenomena symbolic dictionary
+phenomena = Catalog({
+    "Quantum Superposition": ("∴ + ◐ = Ψ", "Multiple possibilities coexist in a partial state until forming a quantum state."),
+    "Wave Function Collapse": ("Ψ × ✧ = Ω", "A quantum state collapses through observation, generating reality."),
+    "Quantum Entanglement": ("(∴ ∞ ∴) = ⧗", "Possibilities united infinitely form a mirrored system."),
+    "Quantum Tunneling": ("Ψ + ∅ → ꩜", "Potential crosses the void, creating a dimensional transition."),
+    "Wormhole": ("☍ + ✦⇌✦ = ꩜", "Reflected oppositions connect through a fold in spacetime."),
+    "Singularity (Black Hole)": ("● × ∅ = ꩜", "Totality collapses into nothingness, generating a dimensional fold."),
+    "Hawking Radiation": ("꩜ ⇌ (✧ + ∅)", "The fold oscillates between collapse and void, releasing energy."),
+    "Cosmic Inflation": ("∅ + ϕ = ⇧ × ∞", "From the void, growth drives expansion into infinity."),
+    "Black Hole Collision": ("( ꩜ + ꩜ ) → ⬠ ⇌ ⇧", "Two folds merge, vibrating in a network and expanding."),
+    "Holographic Principle": ("● ⇌ ⬠ = Ω", "Totality is reflected in a network, forming reality."),
+    "Casimir Effect": ("∅ × (◐ + ◐) = ⇂", "The void between nearby dualities generates compression."),
+    "Galaxy Formation": ("ϕ × ⬠ = ✧ × ⇧", "Growth in a network collapses locally and expands globally."),
+    "Neutrinos": ("∴ ⇌ ∞ = ⇀", "Possibilities oscillate infinitely, moving subtly."),
+    "Big Bang": ("∅ → ● × ꩜", "From nothing, a totality folds into itself."),
+    "Unification of Forces": ("(▲ + ⬠ + ⇧ + ✧) = ●", "Force, network, expansion, and collapse converge into unity."),
+    "Exotic Matter": ("∅ ⇌ ⇂ = ꩜", "The void under inverted compression folds space."),
+    "Quantum Decoherence": ("Ψ × ⬠ = Ω + ∅", "A quantum state interacts with a network, collapsing and dissipating."),
+    "Strings (String Theory)": ("∞ ⇌ ⇧ = ⧗ × ϕ", "Infinite vibrations in expansion form spiraling systems."),
+    "Event Horizon": ("● ⇌ ꩜ = ◐", "Totality splits at a fold, hiding half."),
+    "Inflaton Field Fluctuations": ("∅ × ϕ ⇌ ⇧ = ∴", "The void in a spiral oscillates with expansion, generating possibilities."),
+    "Information Paradox": ("(● + ✧) ⇌ ꩜ = ⬠", "Totality and collapse enter a fold, emerging as a network."),
+    "Unruh Effect": ("⇀ × ∅ = ✧", "Motion in the void manifests perceived collapses."),
+    "Universe Topology": ("● ⇌ ꩜ × ϕ = ∞", "Totality folds and grows in a spiral, extending infinitely."),
+})
+
+# Symbolic signal definitions
+signals = {
+    "FRB 121102": ["∴", "∞ ⇌ ⇧ = ⧗ × ϕ"],
+    "Wow!": ["● ⇌ ✧"],
+    "BLC1": ["◐ ⇌ ⬠"],
+    "GRB": ["✧ × ꩜"]
+}
+
+# Normalized-equation index over the phenomena catalog
+phenomenon_index = PhenomenonIndex(phenomena)
+# Structural index (commutative +/×, sub-expressions), built on first use
+_structural_index = None
+
+def structural_index():
+    global _structural_index
+    if _structural_index is None:
+        _structural_index = StructuralIndex(phenomena)
+    return _structural_index
+
+# Equations by token prefix, for completion hints while an expression is being built
+_prefix_index = None
+
+def prefix_index():
+    global _prefix_index
+    if _prefix_index is None:
+        _prefix_index = PrefixIndex(phenomena)
+    return _prefix_index
+
+def install_indexes(structural_state=None, prefix_state=None):
+    # Structural and prefix indexes from states saved for the current catalog (see
+    # catalog_cache.py), instead of building them on first use
+    global _structural_index, _prefix_index
+    if structural_state is not None:
+        _structural_index = StructuralIndex.from_state(phenomena, structural_state)
+    if prefix_state is not None:
+        _prefix_index = PrefixIndex.from_state(phenomena, prefix_state)
+
+# Symbol packs (see packs.py) register a loader here and are only read on first use:
+# compiling an expression, looking up a phenomenon or calling ensure_loaded()
+_pending_loaders = []
+
+def add_lazy_loader(loader):
+    _pending_loaders.append(loader)
+    clear_compiled_cache()
+
+def ensure_loaded():
+    while _pending_loaders:
+        _pending_loaders.pop(0)()
+
+def register_signal(name, expressions):
+    signals[name] = list(expressions)
+
+def register_phenomenon(name, equation, meaning):
+    add_phenomenon(phenomena, name, equation, meaning, (phenomenon_index, _structural_index, _prefix_index))
+
+def check_phenomenon(expression):
+    if _profiler is not None:
+        return _profiler.timed("check_phenomenon", _match_phenomenon, expression)
+    return _match_phenomenon(expression)
+
+def _match_phenomenon(expression):
+    if _pending_loaders:
+        ensure_loaded()
+    pheno, meaning = phenomenon_index.lookup(expression)
+    if pheno is None:
+        # Sem igualdade textual: tentar a forma canônica (ex.: "◐ + ∴ = Ψ")
+        pheno, meaning = structural_index().match(expression)
+    return pheno, meaning
+
+def search_phenomena(expression):
+    # All phenomena equal to, contained in or containing the expression: (name, kind, meaning)
+    if _pending_loaders:
+        ensure_loaded()
+    return structural_index().search(expression)
+
+def complete_phenomena(tokens, limit=None):
+    # Phenomena whose equation starts with tokens: [(name, equation)], shortest first
+    if _pending_loaders:
+        ensure_loaded()
+    return prefix_index().completions(tokens, limit)
+
+# Mandala geometry (symbols on a circle, connections and background stars)
+MANDALA_CONNECTIONS = [
+    ("Ω", "⇧"),
+    ("∴", "⧗"),
+    ("Ψ", "✧"),
+    ("꩜", "⬠"),
+    ("⇌", "⇀"),
+    ("◐", "∅"),
+    ("●", "∞"),
+    ("ϕ", "⇧"),
+]
+
+MandalaLayout = namedtuple("MandalaLayout", ["stars", "symbol_coords", "connections"])
+
+def mandala_layout(size=500, radius=150, star_count=50, rng=None):
+    rng = rng or _rng
+    stars = [(rng.randint(0, size), rng.randint(0, size)) for _ in range(star_count)]
+    center = size / 2
+    symbol_list = list(symbols.keys())
+    symbol_coords = {}
+    for i, symbol in enumerate(symbol_list):
+        angle = 2 * math.pi * i / len(symbol_list)
+        symbol_coords[symbol] = (center + radius * math.cos(angle), center + radius * math.sin(angle))
+    connections = [(a, b) for a, b in MANDALA_CONNECTIONS if a in symbol_coords and b in symbol_coords]
+    return MandalaLayout(stars, symbol_coords, connections)
+
+# Compiled expression plans
+# Each expression is parsed once into an AST (see parser.py) and flattened into an
+# immutable plan: one step per token in source order, plus ASSIGN steps where a
+# transition's target sub-expression ends. In-order evaluation of the AST is exactly
+# source order, so execute_plan() walks the tree structurally with a single flat loop.
+SYMBOL = "symbol"
+VALUE = "value"
+CONST = "const"
+CACHED = "cached"
+OPERATOR = "operator"
+TRANSITION = "transition"
+ASSIGN = "assign"
+
+# kind is one of SYMBOL/VALUE/CONST/CACHED/OPERATOR/TRANSITION/ASSIGN; payload is the
+# symbol handler (SYMBOL), a (symbol id, value function) pair (VALUE), (symbol id, value,
+# rendered text) for a pure symbol evaluated at compile time (CONST), (symbol id, value
+# function, keys read) for a contextual symbol (CACHED), None for operators, or the
+# transition number for TRANSITION/ASSIGN
+PlanStep = namedtuple("PlanStep", ["kind", "token", "payload"])
+# origin/target are (start, end) token index ranges of the two operands of "→",
+# *_key their normalized text
+TransitionSpan = namedtuple("TransitionSpan", ["origin", "target", "origin_key", "target_key"])
+# layout lists what appears in the output, in source order: a token index (>= 0) or ~n
+# for transition n. As in the first versions, the first token of a transition's target
+# is only shown inside the transition line. inputs are the context keys the plan reads
+# before writing them, and writes the (key, symbol id or None) pairs it writes, for plans
+# without stochastic or custom symbols; both are None otherwise.
+CompiledExpression = namedtuple("CompiledExpression", ["source", "tokens", "ast", "steps", "transitions", "layout", "inputs", "writes"])
+
+COMPILE_CACHE_SIZE = 1024
+# Memo tables: whole deterministic plans keyed by their inputs, and contextual symbol
+# values keyed by the values they read
+PLAN_MEMO_SIZE = 4096
+VALUE_MEMO_SIZE = 4096
+plan_memo = MemoCache(PLAN_MEMO_SIZE)
+value_memo = MemoCache(VALUE_MEMO_SIZE)
+_memoize = True
+
+def use_memoization(enabled):
+    global _memoize
+    previous = _memoize
+    _memoize = bool(enabled)
+    return previous
+
+def clear_memo():
+    plan_memo.clear()
+    value_memo.clear()
+
+# Profiling (see metrics.py): None while off, so the engine only pays a None check per
+# interpret() and check_phenomenon(). use_profiler() also swaps the plan runner for the
+# profiler's instrumented one.
+_profiler = None
+
+def use_profiler(profiler):
+    global _profiler, _runner
+    previous = _profiler
+    _profiler = profiler
+    _runner = _run_plan if profiler is None else profiler.run_plan
+    return previous
+
+def memo_stats():
+    return {"plans": plan_memo.stats(), "values": value_memo.stats()}
+
+def tokenize(expression):
+    return tuple(token.text for token in lex(expression))
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_expression(expression):
+    if _pending_loaders:
+        ensure_loaded()
+    if _skeletons:
+        skeleton = _skeletons.get(expression)
+        if skeleton is not None:
+            return _plan_from_skeleton(expression, skeleton)
+    started = perf_counter() if _profiler is not None else None
+    lexed = lex(expression)
+    tokens = tuple(token.text for token in lexed)
+    ast = parse_tokens(lexed, symbols)
+
+    symbol_tokens = set()
+    arrows = []
+    for node in walk(ast):
+        if isinstance(node, Symbol):
+            symbol_tokens.add(node.tokens[0])
+        elif isinstance(node, BinaryOp):
+            if node.op == "→":
+                arrows.append(node)
+            elif node.op == "⇌" and "⇌" in symbols:
+                symbol_tokens.add(node.left.tokens[1])
+    arrows.sort(key=lambda node: node.left.tokens[1])
+
+    transitions = []
+    transition_at = {}
+    hidden = set()
+    assign_after = {}
+    for number, node in enumerate(arrows):
+        transitions.append(TransitionSpan(
+            origin=node.left.tokens,
+            target=node.right.tokens,
+            origin_key=to_source(node.left, lexed),
+            target_key=to_source(node.right, lexed),
+        ))
+        transition_at[node.left.tokens[1]] = number
+        hidden.add(node.right.tokens[0])
+        # A atribuição acontece assim que o destino termina de ser avaliado
+        assign_after.setdefault(node.right.tokens[1] - 1, []).append(node)
+
+    steps = []
+    layout = []
+    for i, token in enumerate(tokens):
+        if i in transition_at:
+            steps.append(PlanStep(TRANSITION, token, transition_at[i]))
+            layout.append(~transition_at[i])
+            continue
+        if i in symbol_tokens:
+            handler = symbols[token]
+            value_function = getattr(handler, "value_function", None)
+            if value_function is None:
+                steps.append(PlanStep(SYMBOL, token, handler))
+            else:
+                kind, reads = value_classes.get(value_function, (STOCHASTIC, ()))
+                if kind is PURE:
+                    # Valor constante: calculado e formatado uma única vez
+                    value = value_function(SymbolContext())
+                    steps.append(PlanStep(CONST, token, (symbol_id(token), value, f"{token}: {value}")))
+                elif kind is CONTEXTUAL:
+                    steps.append(PlanStep(CACHED, token, (symbol_id(token), value_function, reads)))
+                else:
+                    steps.append(PlanStep(VALUE, token, (symbol_id(token), value_function)))
+        else:
+            steps.append(PlanStep(OPERATOR, token, None))
+        if i not in hidden:
+            layout.append(i)
+        # Transições internas terminam no mesmo token que as externas e são atribuídas antes
+        for node in sorted(assign_after.get(i, ()), key=lambda node: -node.tokens[0]):
+            steps.append(PlanStep(ASSIGN, None, transition_at[node.left.tokens[1]]))
+    steps = _uncache_random_reads(steps, transitions)
+    inputs, writes = _plan_dependencies(steps, transitions)
+    if started is not None:
+        _profiler.observe("compile", perf_counter() - started)
+    return CompiledExpression(expression, tokens, ast, tuple(steps), tuple(transitions), tuple(layout), inputs, writes)
+
+def _uncache_random_reads(steps, transitions):
+    # Um símbolo contextual que lê um valor sorteado nesta mesma expressão quase nunca
+    # repete a chave: avalia direto, sem passar pela tabela de memo
+    drawn = set()
+    drawn_origins = set()
+    result = []
+    for step in steps:
+        kind, token, payload = step
+        if kind is SYMBOL or kind is VALUE:
+            drawn.add(token)
+        elif kind is CACHED:
+            if drawn.intersection(payload[2]):
+                step = PlanStep(VALUE, token, payload[:2])
+                drawn.add(token)
+            else:
+                drawn.discard(token)
+        elif kind is CONST:
+            drawn.discard(token)
+        elif kind is TRANSITION:
+            if transitions[payload].origin_key in drawn:
+                drawn_origins.add(payload)
+        elif kind is ASSIGN:
+            target_key = transitions[payload].target_key
+            if payload in drawn_origins:
+                drawn.add(target_key)
+            else:
+                drawn.discard(target_key)
+        result.append(step)
+    return result
+
+def _plan_dependencies(steps, transitions):
+    # Chaves lidas antes de serem escritas e chaves escritas, na ordem dos passos
+    inputs = []
+    writes = []
+    for kind, token, payload in steps:
+        if kind is SYMBOL or kind is VALUE:
+            return None, None
+        if kind is CACHED:
+            inputs.extend(key for key in payload[2] if key not in writes and key not in inputs)
+            writes.append(token)
+        elif kind is CONST:
+            writes.append(token)
+        elif kind is TRANSITION:
+            key = transitions[payload].origin_key
+            if key not in writes and key not in inputs:
+                inputs.append(key)
+        elif kind is ASSIGN:
+            writes.append(transitions[payload].target_key)
+    return tuple(inputs), tuple((name, symbol_ids.get(name)) for name in dict.fromkeys(writes))
+
+# Plan skeletons: a compiled plan with symbol names in place of handlers and value
+# functions, so it can be saved (catalog_cache.py) and rebuilt without lexing, parsing
+# or classifying. Only valid for the symbol table the plan was compiled against.
+_skeletons = {}
+_step_kinds = {kind: kind for kind in (SYMBOL, VALUE, CONST, CACHED, OPERATOR, TRANSITION, ASSIGN)}
+
+def plan_skeleton(plan):
+    specs = []
+    for kind, token, payload in plan.steps:
+        if kind is CONST:
+            extra = payload[1:]
+        elif kind is TRANSITION or kind is ASSIGN:
+            extra = payload
+        else:
+            extra = None
+        specs.append((kind, token, extra))
+    writes = None if plan.writes is None else tuple(name for name, _ in plan.writes)
+    transitions = tuple(tuple(span) for span in plan.transitions)
+    return (plan.tokens, plan.ast, tuple(specs), transitions, plan.layout, plan.inputs, writes)
+
+def _plan_from_skeleton(expression, skeleton):
+    tokens, ast, specs, transitions, layout, inputs, writes = skeleton
+    steps = []
+    for kind, token, extra in specs:
+        kind = _step_kinds[kind]  # Strings lidas do disco não são os mesmos objetos
+        if kind is CONST:
+            payload = (symbol_id(token),) + tuple(extra)
+        elif kind is VALUE:
+            payload = (symbol_id(token), symbols[token].value_function)
+        elif kind is CACHED:
+            value_function = symbols[token].value_function
+            payload = (symbol_id(token), value_function, value_classes[value_function][1])
+        elif kind is SYMBOL:
+            payload = symbols[token]
+        else:
+            payload = extra
+        steps.append(PlanStep(kind, token, payload))
+    if writes is not None:
+        writes = tuple((name, symbol_ids.get(name)) for name in writes)
+    transitions = tuple(TransitionSpan(*span) for span in transitions)
+    return CompiledExpression(expression, tokens, ast, tuple(steps), transitions, layout, inputs, writes)
+
+def preload_plans(skeletons):
+    # expression -> plan_skeleton(), used by compile_expression() on a cache miss
+    _skeletons.update(skeletons)
+
+# Bumped by clear_compiled_cache(): caches of compiled plans outside this module (see
+# favorites.resolve) compare it to drop plans compiled against an older symbol table
+_compile_generation = 0
+
+def compile_generation():
+    return _compile_generation
+
+def clear_compiled_cache():
+    # Must be called after symbols are added or replaced, since plans hold resolved handlers
+    global _compile_generation
+    _compile_generation += 1
+    _skeletons.clear()
+    compile_expression.cache_clear()
+    output_plan.cache_clear()
+    clear_memo()
+
+def execute_plan(plan, context):
+    # Deterministic plans are memoized on the values of their inputs: a hit replays the
+    # plan's writes into the context and returns the stored output
+    inputs = plan.inputs
+    if inputs is None or not _memoize:
+        return _runner(plan, context)
+    if inputs:
+        try:
+            key = (plan.source,) + tuple(freeze(context.get(name, MISSING)) for name in inputs)
+            hit = plan_memo.get(key)
+        except TypeError:
+            return _runner(plan, context)  # Valor de entrada não hasheável
+    else:
+        key = plan.source
+        hit = plan_memo.get(key)
+    if hit is None:
+        output = _runner(plan, context)
+        plan_memo.put(key, (output, tuple(context.get(name) for name, _ in plan.writes)))
+        return output
+    output, values = hit
+    if type(context) is SymbolContext:
+        if len(context._values) < len(symbol_ids):
+            context._grow()
+        slots = context._values
+        for (name, slot), value in zip(plan.writes, values):
+            if slot is None:
+                context[name] = value
+            else:
+                slots[slot] = value
+    else:
+        for (name, _), value in zip(plan.writes, values):
+            context[name] = value
+    return output
+
+def _run_plan(plan, context):
+    # Single pass: every symbol handler runs exactly once, in source order. A transition
+    # captures its origin value when the arrow is reached (the origin is fully evaluated)
+    # and assigns it once its target has been evaluated.
+    rendered = []
+    values = [None] * len(plan.transitions)
+    if type(context) is SymbolContext:
+        # Resultados gravados direto na lista de valores, indexada pelo id do símbolo
+        if len(context._values) < len(symbol_ids):
+            context._grow()
+        store = context._values.__setitem__
+        by_slot = True
+    else:
+        store = context.__setitem__
+        by_slot = False
+    for kind, token, payload in plan.steps:
+        if kind is CONST:
+            slot, value, text = payload
+            store(slot if by_slot else token, value)
+            rendered.append(text)
+        elif kind is VALUE:
+            slot, value_function = payload
+            value = value_function(context)
+            store(slot if by_slot else token, value)
+            rendered.append(f"{token}: {value}")
+        elif kind is CACHED:
+            slot, value_function, reads = payload
+            hit = key = None
+            if _memoize:
+                try:
+                    key = (value_function,) + tuple(freeze(context.get(name, MISSING)) for name in reads)
+                    hit = value_memo.get(key)
+                except TypeError:
+                    key = None
+            if hit is None:
+                value = value_function(context)
+                hit = (value, f"{token}: {value}")
+                if key is not None:
+                    value_memo.put(key, hit)
+            store(slot if by_slot else token, hit[0])
+            rendered.append(hit[1])
+        elif kind is OPERATOR:
+            rendered.append(token)
+        elif kind is SYMBOL:
+            payload(context)
+            rendered.append(f"{token}: {context.get(token)}")
+        elif kind is TRANSITION:
+            values[payload] = context.get(plan.transitions[payload].origin_key, None)
+            rendered.append(token)
+        else:
+            # Realizar a transição
+            target_key = plan.transitions[payload].target_key
+            context[target_key] = values[payload]
+            values[payload] = context.get(target_key)
+    return render_output(plan, rendered, values)
+
+# Executor de planos usado por execute_plan (trocado pelo profiler)
+_runner = _run_plan
+
+def render_output(plan, rendered, values):
+    # rendered: text of each token step, in order; values: final value of each transition
+    if not plan.transitions:
+        return " ".join(rendered)
+    output = []
+    for item in plan.layout:
+        if item >= 0:
+            output.append(rendered[item])
+        else:
+            span = plan.transitions[~item]
+            origin_text = " ".join(rendered[span.origin[0]:span.origin[1]])
+            target_text = " ".join(rendered[span.target[0]:span.target[1]])
+            output.append(f"Transition: {origin_text} → {target_text} => {values[~item]}")
+    return " ".join(output)
+
+# Symbolic parser with context and conditionals
+def interpret(expression, context):
+    # context may be a SymbolContext or any dict-like mapping
+    if _profiler is not None:
+        return _profiler.interpret(expression, context)
+    if isinstance(expression, CompiledExpression):
+        return execute_plan(expression, context)
+    return execute_plan(compile_expression(expression), context)
+
+# Structured results (see results.py): the same single pass as _run_plan, collecting
+# typed events with the raw values instead of formatted text
+def _run_plan_events(plan, context):
+    transitions = plan.transitions
+    events = []  # Um evento por token, na ordem do código
+    add = events.append
+    values = [None] * len(transitions)
+    origin_values = [None] * len(transitions)
+    target_values = [None] * len(transitions)
+    if type(context) is SymbolContext:
+        if len(context._values) < len(symbol_ids):
+            context._grow()
+        store = context._values.__setitem__
+        by_slot = True
+    else:
+        store = context.__setitem__
+        by_slot = False
+    for kind, token, payload in plan.steps:
+        if kind is CONST:
+            value = payload[1]
+            store(payload[0] if by_slot else token, value)
+            add(SymbolEvent(token, value))
+        elif kind is VALUE or kind is CACHED:
+            value = payload[1](context)
+            store(payload[0] if by_slot else token, value)
+            add(SymbolEvent(token, value))
+        elif kind is OPERATOR:
+            add(OperatorEvent(token))
+        elif kind is SYMBOL:
+            payload(context)
+            add(SymbolEvent(token, context.get(token)))
+        elif kind is TRANSITION:
+            values[payload] = origin_values[payload] = context.get(transitions[payload].origin_key, None)
+            add(OperatorEvent(token))
+        else:
+            target_key = transitions[payload].target_key
+            target_values[payload] = context.get(target_key)
+            context[target_key] = values[payload]
+            values[payload] = context.get(target_key)
+    if not transitions:
+        return tuple(events)
+    output = []
+    for item in plan.layout:
+        if item >= 0:
+            output.append(events[item])
+        else:
+            span = transitions[~item]
+            output.append(TransitionEvent(
+                span.origin_key,
+                span.target_key,
+                tuple(events[span.origin[0]:span.origin[1]]),
+                tuple(events[span.target[0]:span.target[1]]),
+                origin_values[~item],
+                target_values[~item],
+                values[~item],
+            ))
+    return tuple(output)
+
+def interpret_result(expression, context=None):
+    # Like interpret(), but returns an Interpretation (typed events, rendered on demand)
+    plan = expression if isinstance(expression, CompiledExpression) else compile_expression(expression)
+    if context is None:
+        context = SymbolContext()
+    if _profiler is not None:
+        with _profiler.span("interpret", expression=plan.source):
+            return Interpretation(plan.source, _run_plan_events(plan, context))
+    return Interpretation(plan.source, _run_plan_events(plan, context))
+
+# Dependency-aware evaluation
+# The keys each value function reads (value_classes) form a graph over the symbol table:
+# ✧ and ⧗ read ∴, ⬠ reads ⧗, Ω reads ✧. evaluate_outputs() runs only the symbols the
+# requested outputs depend on, each once, dependencies first, instead of every token
+# left to right: "Ω ✧ ∴" asked for Ω evaluates ∴, ✧, Ω (and sees real values instead of
+# the "No Collapse Observed" default), and ● or ◐ are never computed.
+
+def symbol_dependencies(name):
+    # Symbols whose results name reads (custom handlers without declared reads: none)
+    value_function = getattr(symbols.get(name), "value_function", None)
+    reads = value_classes.get(value_function, (STOCHASTIC, ()))[1]
+    return tuple(key for key in reads if key in symbols)
+
+def dependency_graph():
+    return {name: symbol_dependencies(name) for name in symbols}
+
+def evaluation_order(outputs, available=None):
+    # Symbols to evaluate for outputs, dependencies first. Only symbols in available are
+    # evaluated (None: any symbol); the others are read from the context as they are.
+    order = []
+    state = {}  # name -> False while visiting, True when done
+    for output in outputs:
+        stack = [(output, False)]
+        while stack:
+            name, expanded = stack.pop()
+            if expanded:
+                state[name] = True
+                order.append(name)
+                continue
+            if state.get(name) is True:
+                continue
+            if state.get(name) is False:
+                raise ValueError(f"circular symbol dependency through {name}")
+            state[name] = False
+            stack.append((name, True))
+            for dependency in reversed(symbol_dependencies(name)):
+                if available is None or dependency in available:
+                    if state.get(dependency) is False:
+                        raise ValueError(f"circular symbol dependency through {dependency}")
+                    stack.append((dependency, False))
+    return order
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def output_plan(expression, outputs, pull=False):
+    # Ordered symbols to run for outputs of expression. pull=True also evaluates
+    # dependencies that do not appear in the expression.
+    plan = compile_expression(expression)
+    present = {token for kind, token, _ in plan.steps if kind in (SYMBOL, VALUE, CONST, CACHED)}
+    missing = [name for name in outputs if name not in present]
+    if missing:
+        raise ValueError(f"not in the expression: {', '.join(missing)}")
+    return tuple(evaluation_order(outputs, None if pull else present))
+
+def evaluate_outputs(expression, outputs, context=None, pull=False):
+    # Returns {output: value} for the requested output symbols of expression, running
+    # only what they need. Transitions are not applied: a transition target keeps the
+    # value of its own symbol, as the expression's symbols are evaluated independently
+    # of their position.
+    context = SymbolContext() if context is None else context
+    outputs = (outputs,) if isinstance(outputs, str) else tuple(outputs)
+    for name in output_plan(expression, outputs, pull):
+        symbols[name](context)
+    return {name: context.get(name) for name in outputs}
+
+# Headless decoding helpers (same steps as the GUI: interpret, then look up the phenomenon)
+def decode_expression(expression, context=None, search=False, outputs=None, events=False):
+    # outputs: only evaluate these symbols (evaluate_outputs) instead of interpreting
+    # the whole expression; the record then has "outputs" instead of "result". events:
+    # "events" (typed, see results.py) instead of the "result" text.
+    record = {"expression": expression}
+    try:
+        if outputs:
+            record["outputs"] = evaluate_outputs(expression, outputs, SymbolContext() if context is None else context)
+        elif events:
+            record["events"] = interpret_result(expression, context).to_dict()["events"]
+        else:
+            record["result"] = interpret(expression, SymbolContext() if context is None else context)
+    except Exception as e:
+        record["error"] = str(e)
+        return record
+    pheno, meaning = check_phenomenon(expression)
+    record["phenomenon"] = pheno
+    record["meaning"] = meaning
+    if search:
+        record["matches"] = [{"phenomenon": name, "match": kind} for name, kind, _ in search_phenomena(expression)]
+    return record
+
+def decode_signal(expressions, context=None):
+    # As expressões de um sinal compartilham o mesmo contexto, como em run_signal()
+    context = SymbolContext() if context is None else context
+    if _profiler is None:
+        return [decode_expression(expr, context) for expr in expressions]
+    with _profiler.span("signal", expressions=len(expressions)):
+        return [decode_expression(expr, context) for expr in expressions]
@@ -0,0 +1,229 @@
+# Monte Carlo ensemble evaluation
+# A single interpret() call is one sample of the stochastic symbols (∴ draws energy
+# levels, ✧ picks one of them, ⧗ and Ω read those results). run_ensemble() evaluates N
+# realizations of an expression at once and returns statistics about the final context
+# of each realization: how many states ∴ produced and their energy levels, which state
+# ✧ collapsed to, and how often ⧗ linked real states and Ω observed a collapse.
+#
+# Only the random draws are simulated, in batches (NumPy when available, otherwise a
+# plain Python sampler); no strings are formatted. Expressions with custom handlers, or
+# transitions that overwrite ∴, ✧, ⧗ or Ω, fall back to running interpret() N times.
+
+import random
+import re
+from collections import Counter, namedtuple
+
+from . import core
+from .context import SymbolContext
+
+# NumPy is optional and only imported by the first ensemble run, so importing the package
+# stays fast; without it the pure Python sampler is used instead
+np = None
+_numpy_checked = False
+
+def load_numpy():
+    # Returns the numpy module, or None if it is not installed
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+MAX_STATES = 5
+_STOCHASTIC_KEYS = ("∴", "✧", "⧗", "Ω")
+_STATE_RE = re.compile(r"State (\d+): Energy Level (\d+)")
+
+# state_counts, energy_levels, collapses and collapse_energy map an outcome to the number
+# of realizations (or states) that produced it; the rates are None when the expression
+# has no ⧗ / Ω. backend is "numpy", "python" or "interpret".
+EnsembleResult = namedtuple("EnsembleResult", [
+    "expression",
+    "realizations",
+    "state_counts",
+    "energy_levels",
+    "collapses",
+    "collapse_energy",
+    "entanglement_formed_rate",
+    "reality_formed_rate",
+    "backend",
+])
+
+def _events(plan):
+    # Sequência de eventos aleatórios/dependentes, ou None se for preciso cair no interpret()
+    builtin = {
+        core._possibilities: "∴",
+        core._collapse: "✧",
+        core._entangle: "⧗",
+        core._reality: "Ω",
+    }
+    if any(span.target_key in _STOCHASTIC_KEYS for span in plan.transitions):
+        return None
+    events = []
+    for kind, token, payload in plan.steps:
+        if kind is core.SYMBOL:
+            return None
+        if kind is core.VALUE or kind is core.CACHED:
+            event = builtin.get(payload[1])
+            if event is not None:
+                if event != token:
+                    return None
+                events.append(event)
+            elif token in _STOCHASTIC_KEYS:
+                return None
+        elif kind is core.CONST and token in _STOCHASTIC_KEYS:
+            return None
+    return events
+
+def _structural_rates(events):
+    # ⧗ liga estados reais se algum ∴ veio antes do último ⧗; Ω observa colapso se algum
+    # ✧ veio antes do último Ω. Não depende do sorteio, só da ordem dos símbolos.
+    entangled = reality = None
+    seen = set()
+    for event in events:
+        if event == "⧗":
+            entangled = "∴" in seen
+        elif event == "Ω":
+            reality = "✧" in seen
+        seen.add(event)
+    return entangled, reality
+
+def _sample_numpy(events, n, seed):
+    rng = np.random.default_rng(seed)
+    rows = np.arange(n)
+    counts = energies = None
+    collapse = None  # (state index, energy) arrays of the latest ✧, or "unknown"
+    for event in events:
+        if event == "∴":
+            counts = rng.integers(2, MAX_STATES + 1, n)
+            energies = rng.integers(1, 101, (n, MAX_STATES))
+        elif event == "✧":
+            if counts is None:
+                collapse = "unknown"
+            else:
+                index = (rng.random(n) * counts).astype(np.int64)
+                collapse = (index, energies[rows, index])
+
+    entangled, reality = _structural_rates(events)
+    state_counts = energy_levels = {}
+    if counts is not None:
+        state_counts = {int(k): int(v) for k, v in enumerate(np.bincount(counts, minlength=MAX_STATES + 1)) if v}
+        levels = energies[np.arange(MAX_STATES)[None, :] < counts[:, None]]
+        energy_levels = {int(k): int(v) for k, v in enumerate(np.bincount(levels, minlength=101)) if v}
+    collapses = collapse_energy = {}
+    if collapse == "unknown":
+        collapses = {"Unknown State": n}
+    elif collapse is not None:
+        index, energy = collapse
+        collapses = {f"State {k}": int(v) for k, v in enumerate(np.bincount(index, minlength=MAX_STATES)) if v}
+        collapse_energy = {int(k): int(v) for k, v in enumerate(np.bincount(energy, minlength=101)) if v}
+    return state_counts, energy_levels, collapses, collapse_energy, entangled, reality
+
+def _sample_python(events, n, seed):
+    rng = random.Random(seed)
+    randint = rng.randint
+    state_counts = Counter()
+    energy_levels = Counter()
+    collapses = Counter()
+    collapse_energy = Counter()
+    entangled, reality = _structural_rates(events)
+    for _ in range(n):
+        states = None
+        collapse = None
+        for event in events:
+            if event == "∴":
+                states = [randint(1, 100) for _ in range(randint(2, MAX_STATES))]
+            elif event == "✧":
+                if states is None:
+                    # Mesmo sorteio que core._collapse faz sobre ['Unknown State']: sem ele
+                    # os sorteios seguintes saem do passo com o interpret()
+                    collapse = (rng.choice(("Unknown State",)), None)
+                else:
+                    index = rng.randrange(len(states))
+                    collapse = (f"State {index}", states[index])
+        if states is not None:
+            state_counts[len(states)] += 1
+            energy_levels.update(states)
+        if collapse is not None:
+            collapses[collapse[0]] += 1
+            if collapse[1] is not None:
+                collapse_energy[collapse[1]] += 1
+    return dict(state_counts), dict(energy_levels), dict(collapses), dict(collapse_energy), entangled, reality
+
+def _sample_interpret(plan, n, seed):
+    # Caminho genérico: n execuções reais, estatísticas extraídas do contexto final
+    state_counts = Counter()
+    energy_levels = Counter()
+    collapses = Counter()
+    collapse_energy = Counter()
+    links = realities = 0
+    has_link = any(token == "⧗" for _, token, _ in plan.steps)
+    has_reality = any(token == "Ω" for _, token, _ in plan.steps)
+    previous = core.use_random(random.Random(seed))
+    try:
+        context = SymbolContext()
+        for _ in range(n):
+            context.clear()
+            core.execute_plan(plan, context)
+            states = context.get("∴")
+            if isinstance(states, list):
+                levels = [int(m.group(2)) for m in map(_STATE_RE.search, map(str, states)) if m]
+                state_counts[len(states)] += 1
+                energy_levels.update(levels)
+            collapsed = context.get("✧")
+            if isinstance(collapsed, str):
+                m = _STATE_RE.search(collapsed)
+                if m:
+                    collapses[f"State {m.group(1)}"] += 1
+                    collapse_energy[int(m.group(2))] += 1
+                else:
+                    collapses[collapsed.replace("State Collapsed to ", "")] += 1
+            if "Linked: State" in str(context.get("⧗", "")):
+                links += 1
+            if "No Collapse Observed" not in str(context.get("Ω", "No Collapse Observed")):
+                realities += 1
+    finally:
+        core.use_random(previous)
+    return (
+        dict(state_counts),
+        dict(energy_levels),
+        dict(collapses),
+        dict(collapse_energy),
+        links / n if has_link else None,
+        realities / n if has_reality else None,
+    )
+
+def run_ensemble(expression, n, seed=None, backend=None):
+    # backend: None picks NumPy when installed; "python" or "interpret" force a sampler
+    if n <= 0:
+        raise ValueError("n must be positive")
+    plan = expression if isinstance(expression, core.CompiledExpression) else core.compile_expression(expression)
+    events = _events(plan) if backend != "interpret" else None
+    if events is None:
+        backend = "interpret"
+        stats = _sample_interpret(plan, n, seed)
+    elif backend == "python" or load_numpy() is None:
+        backend = "python"
+        stats = _sample_python(events, n, seed)
+    else:
+        backend = "numpy"
+        stats = _sample_numpy(events, n, seed)
+    state_counts, energy_levels, collapses, collapse_energy, entangled, reality = stats
+    if isinstance(entangled, bool):
+        entangled = 1.0 if entangled else 0.0
+    if isinstance(reality, bool):
+        reality = 1.0 if reality else 0.0
+    return EnsembleResult(
+        plan.source,
+        n,
+        dict(sorted(state_counts.items())),
+        dict(sorted(energy_levels.items())),
+        dict(sorted(collapses.items())),
+        dict(sorted(collapse_energy.items())),
+        entangled,
+        reality,
+        backend,
+    )
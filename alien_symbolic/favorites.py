@@ -0,0 +1,129 @@
+# Favorites store
+# Favorite phenomena and signals are rows in a SQLite database in the user data
+# directory. Adding or removing a favorite is a single-row transaction, so a crash
+# never leaves a half-written file and two GUI instances see each other's changes
+# instead of overwriting them. A favorites.json from older versions is imported once.
+#
+# resolve() turns a phenomenon or signal name into the compiled plans of its
+# expressions and their detected phenomena, cached until the catalog or the symbol table
+# changes, so running a favorite again skips parsing and the phenomenon lookup.
+
+import json
+import os
+import sqlite3
+from collections import namedtuple
+
+from .core import check_phenomenon, compile_expression, compile_generation, phenomena, signals
+from .paths import data_dir
+
+CATEGORIES = ("phenomena", "signals")
+LEGACY_FILE = "favorites.json"
+# Rótulos usados no dropdown de favoritos
+_LABELS = {"phenomena": "Phenomenon: ", "signals": "Signal: "}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS favorites (
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (category, name)
+);
+"""
+
+# kind is "phenomenon" or "signal"; steps holds one (plan, phenomenon, meaning) per
+# expression, where phenomenon/meaning are the detected phenomenon (None if there is
+# none) or, for a phenomenon, the catalog entry itself.
+FavoritePayload = namedtuple("FavoritePayload", ["kind", "name", "steps"])
+
+def expression_step(expression):
+    return (compile_expression(expression),) + tuple(check_phenomenon(expression))
+
+_payloads = {}
+
+def resolve(kind, name):
+    # KeyError if the name is not in the catalog
+    if kind == "phenomenon":
+        entry = phenomena[name]
+    else:
+        entry = tuple(signals[name])
+    # A detecção depende do catálogo de fenômenos inteiro (qualquer escrita muda a versão)
+    # e os planos da tabela de símbolos (recompilados a cada clear_compiled_cache())
+    key = (entry, phenomena.version, compile_generation())
+    cached = _payloads.get((kind, name))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    if kind == "phenomenon":
+        eq, meaning = entry
+        steps = ((compile_expression(eq), name, meaning),)
+    else:
+        steps = tuple(expression_step(expression) for expression in entry)
+    payload = FavoritePayload(kind, name, steps)
+    _payloads[(kind, name)] = (key, payload)
+    return payload
+
+def parse_label(label):
+    # "Phenomenon: X" -> ("phenomenon", "X"); None for anything else
+    for category, prefix in _LABELS.items():
+        if label.startswith(prefix):
+            return ("phenomenon" if category == "phenomena" else "signal"), label[len(prefix):]
+    return None
+
+class FavoritesStore:
+    def __init__(self, path=None, legacy_path=LEGACY_FILE):
+        self.path = path or os.path.join(data_dir(), "favorites.sqlite3")
+        # timeout: espera outra instância terminar a escrita em vez de falhar
+        self._db = sqlite3.connect(self.path, timeout=10)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self._import_legacy(legacy_path)
+
+    def _import_legacy(self, legacy_path):
+        favorites = {}
+        if legacy_path and os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    favorites = json.load(f)
+            except (OSError, ValueError):
+                favorites = {}  # Arquivo antigo corrompido: começa vazio
+        with self._db:
+            for category in CATEGORIES:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO favorites (category, name) VALUES (?, ?)",
+                    [(category, name) for name in favorites.get(category, [])],
+                )
+            self._db.execute("PRAGMA user_version = 1")
+
+    def names(self, category):
+        # In the order they were added
+        rows = self._db.execute("SELECT name FROM favorites WHERE category = ? ORDER BY rowid", (category,))
+        return [name for name, in rows]
+
+    def to_dict(self):
+        return {category: self.names(category) for category in CATEGORIES}
+
+    def contains(self, category, name):
+        row = self._db.execute("SELECT 1 FROM favorites WHERE category = ? AND name = ?", (category, name)).fetchone()
+        return row is not None
+
+    def add(self, category, name):
+        with self._db:
+            self._db.execute("INSERT OR IGNORE INTO favorites (category, name) VALUES (?, ?)", (category, name))
+
+    def remove(self, category, name):
+        with self._db:
+            self._db.execute("DELETE FROM favorites WHERE category = ? AND name = ?", (category, name))
+
+    def toggle(self, category, name):
+        # Returns True if name is a favorite afterwards
+        with self._db:
+            removed = self._db.execute("DELETE FROM favorites WHERE category = ? AND name = ?", (category, name)).rowcount
+            if not removed:
+                self._db.execute("INSERT INTO favorites (category, name) VALUES (?, ?)", (category, name))
+        return not removed
+
+    def labels(self):
+        return [_LABELS[category] + name for category in CATEGORIES for name in self.names(category)]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,106 @@
+# Expression history store
+# Expressions run from the GUI are kept in a SQLite database in the user data directory,
+# one row per distinct expression (keyed by a hash of its text) with a usage count and
+# first/last run times. Lookups, prefix and substring search and paging are done by
+# SQLite, so the GUI only ever loads one page of history into the dropdown.
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+from .paths import data_dir
+
+PAGE_SIZE = 50
+
+# first_run and last_run are time.time() values
+HistoryEntry = namedtuple("HistoryEntry", ["expression", "uses", "first_run", "last_run"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    hash BLOB PRIMARY KEY,
+    expression TEXT NOT NULL,
+    uses INTEGER NOT NULL,
+    first_run REAL NOT NULL,
+    last_run REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_last_run ON history (last_run);
+CREATE INDEX IF NOT EXISTS history_expression ON history (expression);
+"""
+_COLUMNS = "expression, uses, first_run, last_run"
+
+def expression_hash(expression):
+    return hashlib.sha256(expression.encode("utf-8")).digest()[:16]
+
+def _prefix_bounds(prefix):
+    # Faixa [prefix, prefix + maior caractere) usa o índice de expression
+    return prefix, prefix + "\U0010ffff"
+
+class HistoryStore:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(data_dir(), "history.sqlite3")
+        self._db = sqlite3.connect(self.path)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")  # Outras instâncias podem ler durante a escrita
+        self._db.executescript(_SCHEMA)
+
+    def record(self, expression, when=None):
+        # Adds the expression or bumps its usage count and last run time
+        when = time.time() if when is None else when
+        with self._db:
+            self._db.execute(
+                "INSERT INTO history (hash, expression, uses, first_run, last_run) VALUES (?, ?, 1, ?, ?) "
+                "ON CONFLICT (hash) DO UPDATE SET uses = uses + 1, last_run = excluded.last_run",
+                (expression_hash(expression), expression, when, when),
+            )
+
+    def get(self, expression):
+        row = self._db.execute(f"SELECT {_COLUMNS} FROM history WHERE hash = ?", (expression_hash(expression),)).fetchone()
+        return HistoryEntry(*row) if row else None
+
+    def __contains__(self, expression):
+        return self.get(expression) is not None
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def recent(self, limit=PAGE_SIZE, offset=0):
+        # Most recently run first
+        rows = self._db.execute(
+            f"SELECT {_COLUMNS} FROM history ORDER BY last_run DESC, rowid DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+        return [HistoryEntry(*row) for row in rows]
+
+    def most_used(self, limit=PAGE_SIZE, offset=0):
+        rows = self._db.execute(
+            f"SELECT {_COLUMNS} FROM history ORDER BY uses DESC, last_run DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+        return [HistoryEntry(*row) for row in rows]
+
+    def search(self, query, limit=PAGE_SIZE, offset=0, prefix=False):
+        # prefix=True matches expressions starting with query, otherwise containing it
+        if not query:
+            return self.recent(limit, offset)
+        if prefix:
+            where, params = "expression >= ? AND expression < ?", _prefix_bounds(query)
+        else:
+            where, params = "instr(expression, ?) > 0", (query,)
+        rows = self._db.execute(
+            f"SELECT {_COLUMNS} FROM history WHERE {where} ORDER BY last_run DESC, rowid DESC LIMIT ? OFFSET ?",
+            params + (limit, offset),
+        )
+        return [HistoryEntry(*row) for row in rows]
+
+    def remove(self, expression):
+        with self._db:
+            self._db.execute("DELETE FROM history WHERE hash = ?", (expression_hash(expression),))
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM history")
+
+    def close(self):
+        self._db.close()
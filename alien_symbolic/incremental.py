@@ -0,0 +1,163 @@
+# Incremental evaluation for the expression builder
+# IncrementalEvaluator holds the tokens of an expression being built together with the
+# state of evaluating them: the context, the text of each token and an undo log of what
+# every plan step wrote. When a token is added the new expression is compiled (plans are
+# cached) and its steps are compared with the ones already run: the common prefix is
+# kept and only the steps after it are undone and run again. Appending a symbol runs
+# just that symbol; a transition whose target grows only redoes its assignment.
+# Removing the last token undoes its steps the same way. Stochastic symbols keep the
+# value they got when they were added, so the preview stays stable while building.
+#
+#   builder = IncrementalEvaluator()
+#   builder.append("∴")
+#   builder.append("→")
+#   builder.append("⧗")
+#   builder.output()   # same text interpret("∴ → ⧗", ...) gives for these values
+#   builder.pop()      # back to "∴ →", ∴ keeps its states
+
+from .context import SymbolContext
+from .core import (
+    ASSIGN,
+    CACHED,
+    CONST,
+    OPERATOR,
+    SYMBOL,
+    TRANSITION,
+    VALUE,
+    check_phenomenon,
+    compile_expression,
+    complete_phenomena,
+    render_output,
+)
+from .memo import MISSING
+
+def _signature(plan, step):
+    # Two steps with the same signature, after identical earlier steps, do the same thing
+    kind, token, payload = step
+    if kind is OPERATOR:
+        return (OPERATOR, token)
+    if kind is TRANSITION:
+        return (TRANSITION, payload, plan.transitions[payload].origin_key)
+    if kind is ASSIGN:
+        return (ASSIGN, payload, plan.transitions[payload].target_key)
+    return (SYMBOL, token)
+
+class IncrementalEvaluator:
+    def __init__(self, context=None):
+        self.context = SymbolContext() if context is None else context
+        self.tokens = []
+        self.plan = None
+        self.last_run = 0  # Steps run by the last change (the rest were kept)
+        self._signatures = []
+        self._undo = []  # per step: [(mapping, key, previous value)]
+        self._rendered = []  # text of each token, in order
+        self._renders = []  # per step: whether it added to _rendered
+        self._values = {}  # transition number -> value
+        self._output = ""
+
+    @property
+    def expression(self):
+        return " ".join(self.tokens)
+
+    def append(self, token):
+        self.tokens.append(token)
+        self._sync()
+        return self._output
+
+    def pop(self):
+        # Removes the last token and returns it
+        token = self.tokens.pop()
+        self._sync()
+        return token
+
+    def set_tokens(self, tokens):
+        self.tokens = list(tokens)
+        self._sync()
+        return self._output
+
+    def clear(self):
+        self._rollback(0)
+        self.tokens = []
+        self.plan = None
+        self.last_run = 0
+        self._output = ""
+
+    def output(self):
+        return self._output
+
+    def hints(self, limit=5):
+        # (exact phenomenon name or None, its meaning, [(name, equation)] the expression
+        # may still become by adding tokens)
+        if not self.tokens:
+            return None, None, []
+        pheno, meaning = check_phenomenon(self.expression)
+        completions = [(name, equation) for name, equation in complete_phenomena(self.tokens, limit + 1) if name != pheno]
+        return pheno, meaning, completions[:limit]
+
+    def _sync(self):
+        if not self.tokens:
+            self.clear()
+            return
+        plan = compile_expression(self.expression)
+        signatures = [_signature(plan, step) for step in plan.steps]
+        kept = 0
+        limit = min(len(signatures), len(self._signatures))
+        while kept < limit and signatures[kept] == self._signatures[kept]:
+            kept += 1
+        self._rollback(kept)
+        for step, signature in zip(plan.steps[kept:], signatures[kept:]):
+            self._run_step(plan, step)
+            self._signatures.append(signature)
+        self.plan = plan
+        self.last_run = len(signatures) - kept
+        values = [self._values.get(number) for number in range(len(plan.transitions))]
+        self._output = render_output(plan, self._rendered, values)
+
+    def _rollback(self, kept):
+        # Desfaz os passos a partir de kept, do último para o primeiro
+        while len(self._signatures) > kept:
+            self._signatures.pop()
+            for mapping, key, previous in reversed(self._undo.pop()):
+                if previous is MISSING:
+                    if key in mapping:
+                        del mapping[key]
+                else:
+                    mapping[key] = previous
+            if self._renders.pop():
+                self._rendered.pop()
+
+    def _write(self, undo, mapping, key, value):
+        undo.append((mapping, key, mapping.get(key, MISSING)))
+        mapping[key] = value
+
+    def _run_step(self, plan, step):
+        # Mesma semântica de core._run_plan, um passo por vez e com registro para desfazer
+        kind, token, payload = step
+        context = self.context
+        undo = []
+        text = None
+        if kind is CONST:
+            self._write(undo, context, token, payload[1])
+            text = payload[2]
+        elif kind is VALUE or kind is CACHED:
+            value = payload[1](context)
+            self._write(undo, context, token, value)
+            text = f"{token}: {value}"
+        elif kind is SYMBOL:
+            # Handler próprio: só a chave do símbolo é registrada para desfazer
+            undo.append((context, token, context.get(token, MISSING)))
+            payload(context)
+            text = f"{token}: {context.get(token)}"
+        elif kind is OPERATOR:
+            text = token
+        elif kind is TRANSITION:
+            self._write(undo, self._values, payload, context.get(plan.transitions[payload].origin_key, None))
+            text = token
+        else:
+            target_key = plan.transitions[payload].target_key
+            self._write(undo, context, target_key, self._values[payload])
+            self._write(undo, self._values, payload, context.get(target_key))
+        self._undo.append(undo)
+        self._renders.append(text is not None)
+        if text is not None:
+            self._rendered.append(text)
@@ -0,0 +1,99 @@
+# Background evaluation jobs
+# A job is a generator function run on a worker thread. Whatever it yields is queued
+# and picked up by the caller with drain() (the GUI polls from root.after), so nothing
+# outside the worker blocks on an evaluation. Jobs run one at a time in submission
+# order; cancel() stops a job at its next yield, or before it starts if still queued.
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class Job:
+    def __init__(self, name, total=None):
+        self.name = name
+        self.total = total  # Número de passos esperados, se conhecido
+        self.done = 0
+        self.error = None
+        self.stopped = False  # Cancelado antes de terminar
+        self.future = None
+        self._items = queue.SimpleQueue()
+        self._cancel = threading.Event()
+
+    def advance(self, steps=1):
+        self.done += steps
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        return self.future is not None and self.future.done()
+
+    @property
+    def started(self):
+        return self.future is not None and (self.future.running() or self.future.done())
+
+    def progress(self):
+        # Texto curto para a barra de status: "3/10" ou só "3"
+        return f"{self.done}/{self.total}" if self.total is not None else str(self.done)
+
+    def drain(self, limit=None):
+        items = []
+        while limit is None or len(items) < limit:
+            try:
+                items.append(self._items.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def pending(self):
+        return not self._items.empty()
+
+class JobRunner:
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alien-symbolic")
+        self._jobs = []
+
+    def submit(self, name, function, *args, total=None):
+        # function(job, *args) must return an iterable; each item is queued for drain()
+        job = Job(name, total)
+        job.future = self._executor.submit(self._run, job, function, args)
+        self._jobs = [j for j in self._jobs if not j.finished]
+        self._jobs.append(job)
+        return job
+
+    def cancel_all(self):
+        for job in self._jobs:
+            job.cancel()
+
+    def _run(self, job, function, args):
+        if job.cancelled:
+            job.stopped = True
+            return
+        items = None
+        try:
+            items = iter(function(job, *args))
+            while True:
+                if job.cancelled:
+                    job.stopped = True
+                    break
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                job._items.put(item)
+        except Exception as e:
+            job.error = e
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    def shutdown(self, wait=False):
+        # Jobs na fila terminam sem rodar; o atual para no próximo yield
+        self.cancel_all()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,306 @@
+# Phenomenon matching
+# Phenomenon equations are normalized once and kept in a dict keyed by the normalized
+# text, so matching an expression is a single hash lookup instead of a scan over the
+# whole catalog.
+
+import heapq
+from bisect import bisect_left, insort
+from functools import lru_cache
+from itertools import combinations
+
+from .parser import BinaryOp, Group, Sequence, lex, parse_expression
+
+def normalize_equation(expression):
+    # Mesma normalização usada desde a primeira versão: espaços são ignorados
+    return expression.replace(" ", "")
+
+class Catalog(dict):
+    # The phenomena catalog: name -> (equation, meaning). Every write through the dict
+    # methods bumps version, which is how the indexes below notice that the catalog
+    # changed, including an equation replaced under an existing name. Writes that go
+    # around these methods (dict.__setitem__(catalog, ...)) are not supported.
+    version = 0  # Atributo de classe: o pickle preenche os itens antes do __dict__
+
+    def __setitem__(self, name, entry):
+        dict.__setitem__(self, name, entry)
+        self.version += 1
+
+    def __delitem__(self, name):
+        dict.__delitem__(self, name)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, name, entry=None):
+        if name not in self:
+            self[name] = entry
+        return self[name]
+
+    def pop(self, *args):
+        self.version += 1
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.version += 1
+        return dict.popitem(self)
+
+    def clear(self):
+        dict.clear(self)
+        self.version += 1
+
+class CatalogIndex:
+    # Base of the indexes over a Catalog. An index remembers the catalog version it was
+    # built from and rebuilds itself on the next query once the catalog has moved on.
+    # Subclasses implement _reset() and _index(name, equation).
+    def __init__(self, catalog=None):
+        # catalog is shared, not copied; a plain dict is copied into a Catalog
+        if catalog is None:
+            catalog = Catalog()
+        elif not isinstance(catalog, Catalog):
+            catalog = Catalog(catalog)
+        self.catalog = catalog
+        self.rebuild()
+
+    def rebuild(self):
+        self._reset()
+        for name, (eq, meaning) in self.catalog.items():
+            self._index(name, eq)
+        self._version = self.catalog.version
+
+    def _check_fresh(self):
+        if self._version != self.catalog.version:
+            self.rebuild()
+
+    def add(self, name, equation, meaning):
+        add_phenomenon(self.catalog, name, equation, meaning, (self,))
+
+    def remove(self, name):
+        # Reindexado na próxima consulta
+        del self.catalog[name]
+
+    def _restored(self):
+        # After a saved state was installed: it describes the catalog as it is now
+        self._version = self.catalog.version
+        return self
+
+def add_phenomenon(catalog, name, equation, meaning, indexes=()):
+    # Writes one catalog entry. A new entry is added in place to the indexes that were up
+    # to date; a replaced one leaves them to rebuild on their next query.
+    fresh = [index for index in indexes if index is not None and index._version == catalog.version]
+    replacing = name in catalog
+    catalog[name] = (equation, meaning)
+    if not replacing:
+        for index in fresh:
+            index._index(name, equation)
+            index._version = catalog.version
+
+class PhenomenonIndex(CatalogIndex):
+    def _reset(self):
+        self._by_key = {}
+
+    def _index(self, name, equation):
+        # Em caso de equações equivalentes, vale a primeira do catálogo
+        self._by_key.setdefault(normalize_equation(equation), name)
+
+    def state(self):
+        # Precomputed index contents, for the on-disk catalog cache (catalog_cache.py)
+        self._check_fresh()
+        return self._by_key
+
+    def load_state(self, state):
+        self._by_key = state
+        self._restored()
+
+    def lookup(self, expression):
+        self._check_fresh()
+        name = self._by_key.get(normalize_equation(expression))
+        if name is None:
+            return None, None
+        return name, self.catalog[name][1]
+
+    def __len__(self):
+        return len(self.catalog)
+
+# Structural matching
+# Equations are parsed into an AST (see parser.py) and reduced to a canonical key:
+# parentheses disappear, chains of + and × are flattened and their operands sorted
+# (both are commutative), everything else keeps its order. Every sub-expression of
+# every phenomenon is indexed by its canonical key, so a query only touches the keys
+# of its own sub-expressions and never scans the catalog.
+
+_COMMUTATIVE = ("+", "×")
+# Subconjuntos de operandos comutativos indexados até este tamanho de cadeia
+MAX_COMMUTATIVE_OPERANDS = 6
+
+EXACT = "exact"
+CONTAINS = "contains"  # the expression contains the phenomenon
+CONTAINED = "contained"  # the phenomenon contains the expression
+
+def _unwrap(node):
+    while isinstance(node, Group) and node.body is not None:
+        node = node.body
+    return node
+
+def _children(node):
+    # Retorna (operador, filhos) de um nó composto; cadeias do mesmo operador comutativo
+    # são achatadas: a + (b + c) == a + b + c
+    if isinstance(node, Sequence):
+        return "seq", list(node.items)
+    op = node.op
+    if op not in _COMMUTATIVE:
+        return op, [node.left, node.right]
+    children = []
+    stack = [node.right, node.left]
+    while stack:
+        child = _unwrap(stack.pop())
+        if isinstance(child, BinaryOp) and child.op == op:
+            stack.append(child.right)
+            stack.append(child.left)
+        else:
+            children.append(child)
+    return op, children
+
+def _canonical(root, keys):
+    # Retorna a chave canônica de root e acumula em keys as chaves de todas as subexpressões.
+    # Pós-ordem com pilha explícita: cadeias longas não esgotam o limite de recursão.
+    results = []
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        node = _unwrap(node)
+        if isinstance(node, Group):
+            results.append("()")
+            continue
+        if not isinstance(node, (Sequence, BinaryOp)):
+            keys.add(node[0])
+            results.append(node[0])
+            continue
+        op, children = _children(node)
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children))
+            continue
+        child_keys = results[-len(children):]
+        del results[-len(children):]
+        if op in _COMMUTATIVE:
+            child_keys.sort()
+            if len(child_keys) <= MAX_COMMUTATIVE_OPERANDS:
+                for size in range(2, len(child_keys)):
+                    for subset in combinations(child_keys, size):
+                        keys.add(f"{op}({','.join(subset)})")
+        key = f"{op}({','.join(child_keys)})"
+        keys.add(key)
+        results.append(key)
+    return results[0]
+
+@lru_cache(maxsize=1024)
+def canonical_form(expression):
+    # Returns (canonical key, frozenset of sub-expression keys), or (None, empty) if empty
+    tree = parse_expression(expression)
+    if tree is None:
+        return None, frozenset()
+    keys = set()
+    key = _canonical(tree, keys)
+    return key, frozenset(keys)
+
+class StructuralIndex(CatalogIndex):
+    def _reset(self):
+        self._order = {}
+        self._by_full = {}  # canonical key of a whole equation -> names
+        self._by_sub = {}  # canonical key of any sub-expression -> names
+
+    def _index(self, name, equation):
+        self._order[name] = len(self._order)
+        key, sub_keys = canonical_form(equation)
+        if key is None:
+            return
+        self._by_full.setdefault(key, []).append(name)
+        for sub_key in sub_keys:
+            self._by_sub.setdefault(sub_key, []).append(name)
+
+    def state(self):
+        self._check_fresh()
+        return (self._order, self._by_full, self._by_sub)
+
+    @classmethod
+    def from_state(cls, catalog, state):
+        # Index over catalog from a state() saved earlier for the same catalog
+        index = cls.__new__(cls)
+        index.catalog = catalog
+        index._order, index._by_full, index._by_sub = state
+        return index._restored()
+
+    def match(self, expression):
+        # Phenomenon whose equation is structurally equal to expression, or (None, None)
+        self._check_fresh()
+        key, _ = canonical_form(expression)
+        names = self._by_full.get(key) if key is not None else None
+        if not names:
+            return None, None
+        return names[0], self.catalog[names[0]][1]
+
+    def search(self, expression):
+        # Returns (name, kind, meaning) for every phenomenon equal to, contained in or
+        # containing the expression, in catalog order
+        self._check_fresh()
+        key, sub_keys = canonical_form(expression)
+        if key is None:
+            return []
+        found = {}
+        for name in self._by_full.get(key, ()):
+            found[name] = EXACT
+        for sub_key in sub_keys:
+            for name in self._by_full.get(sub_key, ()):
+                found.setdefault(name, CONTAINS)
+        for name in self._by_sub.get(key, ()):
+            found.setdefault(name, CONTAINED)
+        names = sorted(found, key=self._order.__getitem__)
+        return [(name, found[name], self.catalog[name][1]) for name in names]
+
+# Completion hints
+# PrefixIndex keeps the catalog equations as token tuples in sorted order, so the
+# phenomena an expression being built can still turn into (their equation starts with
+# its tokens) are one bisect away instead of a scan over the catalog.
+
+class PrefixIndex(CatalogIndex):
+    def rebuild(self):
+        # Uma ordenação só, em vez de um insort por equação
+        self._entries = sorted(self._entry(name, eq) for name, (eq, meaning) in self.catalog.items())
+        self._version = self.catalog.version
+
+    def _entry(self, name, equation):
+        return (tuple(token.text for token in lex(equation)), name)
+
+    def _index(self, name, equation):
+        insort(self._entries, self._entry(name, equation))
+
+    def state(self):
+        self._check_fresh()
+        return self._entries
+
+    @classmethod
+    def from_state(cls, catalog, state):
+        index = cls.__new__(cls)
+        index.catalog = catalog
+        index._entries = state
+        return index._restored()
+
+    def completions(self, tokens, limit=None):
+        # (name, equation) of the phenomena whose equation starts with tokens, shortest first
+        self._check_fresh()
+        tokens = tuple(tokens)
+        entries = self._entries
+        start, end = bisect_left(entries, (tokens,)), len(entries)
+        if tokens:
+            # Primeira entrada cujo último token do prefixo já é outro (maior) texto
+            end = bisect_left(entries, (tokens[:-1] + (tokens[-1] + "\0",),), start)
+        matches = ((len(entries[i][0]), entries[i][1]) for i in range(start, end))
+        # Com limite, um heap do tamanho do limite em vez de ordenar todas as candidatas
+        found = sorted(matches) if limit is None else heapq.nsmallest(limit, matches)
+        return [(name, self.catalog[name][0]) for _, name in found]
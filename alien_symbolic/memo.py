@@ -0,0 +1,68 @@
+# Bounded memo tables
+# MemoCache is a small LRU mapping with hit/miss counters, used by the engine to reuse
+# results of deterministic symbols and whole deterministic expressions. Keys built from
+# context values go through freeze(), which turns lists into tuples; values that stay
+# unhashable make the lookup raise TypeError and the caller simply skips the cache.
+# The tables are shared by the GUI job threads and the stream pipeline threads, so every
+# access holds the cache's lock.
+
+import threading
+from collections import OrderedDict
+
+MISSING = object()  # Chave ausente do contexto (distinta de None)
+
+def freeze(value):
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+class MemoCache:
+    __slots__ = ("maxsize", "hits", "misses", "_data", "_lock")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        data = self._data
+        with self._lock:
+            try:
+                value = data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        data = self._data
+        with self._lock:
+            data[key] = value
+            data.move_to_end(key)
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._data)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "size": size,
+            "maxsize": self.maxsize,
+        }
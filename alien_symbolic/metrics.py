@@ -0,0 +1,329 @@
+# Profiling and runtime metrics (opt-in)
+# enable_profiling() installs a Profiler in the engine; until then nothing is measured
+# and the engine pays one "is None" check per interpret()/check_phenomenon() call, with
+# no per-symbol cost. While enabled it records:
+#
+#   - per-symbol call counts and latency histograms (every handler run on a plan memo
+#     miss; contextual symbols skip the value memo so their real cost is measured)
+#   - operation latency histograms: interpret, compile (cache misses), transition
+#     (arrow to assignment, i.e. evaluating the target), check_phenomenon, signal
+#   - a histogram of context sizes after each interpret()
+#   - tracing spans per expression and signal (the most recent SPAN_LIMIT), nested by
+#     thread: the expressions of a signal are children of its span
+#
+#   profiler = enable_profiling()
+#   ...
+#   write_metrics("metrics.prom")   # Prometheus text format (textfile collector)
+#   write_metrics("metrics.json")   # JSON snapshot
+#   disable_profiling()
+
+import itertools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque, namedtuple
+from contextlib import contextmanager, nullcontext
+
+from . import core
+
+# Upper bounds of the latency buckets, in seconds (Prometheus "le"), and of the context
+# size buckets, in keys
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 5e-3, 1e-2, 0.1, 1.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+SPAN_LIMIT = 1000
+METRIC_PREFIX = "alien_symbolic"
+
+# start is wall-clock time (time.time()); duration in seconds
+Span = namedtuple("Span", ["span_id", "parent_id", "name", "start", "duration", "attributes"])
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # O último balde é +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self):
+        # [(upper bound, observations <= bound)], ending with +Inf
+        running = 0
+        out = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            out.append((bound, running))
+        return out
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-quantile (an upper estimate)
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, running in self.cumulative():
+            if running >= rank:
+                return bound
+        return float("inf")
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": [["+Inf" if bound == float("inf") else bound, running] for bound, running in self.cumulative()],
+        }
+
+class Profiler:
+    def __init__(self, span_limit=SPAN_LIMIT):
+        self.started = time.time()
+        self.symbols = {}  # symbol -> Histogram (count = calls)
+        self.operations = {}  # operation -> Histogram
+        self.context_sizes = Histogram(SIZE_BUCKETS)
+        self.spans = deque(maxlen=span_limit)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.symbols = {}
+            self.operations = {}
+            self.context_sizes = Histogram(SIZE_BUCKETS)
+            self.spans.clear()
+
+    def observe(self, operation, seconds):
+        with self._lock:
+            histogram = self.operations.get(operation)
+            if histogram is None:
+                histogram = self.operations[operation] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+
+    def _observe_run(self, calls, transitions):
+        with self._lock:
+            for token, seconds in calls:
+                histogram = self.symbols.get(token)
+                if histogram is None:
+                    histogram = self.symbols[token] = Histogram(LATENCY_BUCKETS)
+                histogram.observe(seconds)
+            if transitions:
+                histogram = self.operations.get("transition")
+                if histogram is None:
+                    histogram = self.operations["transition"] = Histogram(LATENCY_BUCKETS)
+                for seconds in transitions:
+                    histogram.observe(seconds)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        # Times the block as a span (children: spans opened inside it on the same thread)
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        span_id = next(self._ids)
+        parent_id = stack[-1] if stack else None
+        stack.append(span_id)
+        start = time.time()
+        started = time.perf_counter()
+        try:
+            yield span_id
+        finally:
+            duration = time.perf_counter() - started
+            stack.pop()
+            self.spans.append(Span(span_id, parent_id, name, start, duration, attributes))
+            self.observe(name, duration)
+
+    def timed(self, operation, function, *args):
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.observe(operation, time.perf_counter() - started)
+
+    def interpret(self, expression, context):
+        # core.interpret() while profiling: one span per expression
+        plan = expression if isinstance(expression, core.CompiledExpression) else core.compile_expression(expression)
+        with self.span("interpret", expression=plan.source):
+            output = core.execute_plan(plan, context)
+        size = len(context)
+        with self._lock:
+            self.context_sizes.observe(size)
+        return output
+
+    def run_plan(self, plan, context):
+        # core._run_plan with each step timed; installed by core.use_profiler()
+        clock = time.perf_counter
+        transitions = plan.transitions
+        rendered = []
+        values = [None] * len(transitions)
+        arrow_at = [0.0] * len(transitions)
+        calls = []
+        transition_times = []
+        for kind, token, payload in plan.steps:
+            if kind is core.OPERATOR:
+                rendered.append(token)
+                continue
+            if kind is core.TRANSITION:
+                values[payload] = context.get(transitions[payload].origin_key, None)
+                arrow_at[payload] = clock()
+                rendered.append(token)
+                continue
+            if kind is core.ASSIGN:
+                target_key = transitions[payload].target_key
+                context[target_key] = values[payload]
+                values[payload] = context.get(target_key)
+                transition_times.append(clock() - arrow_at[payload])
+                continue
+            started = clock()
+            if kind is core.CONST:
+                value = payload[1]
+                context[token] = value
+                text = payload[2]
+            elif kind is core.SYMBOL:
+                payload(context)
+                text = f"{token}: {context.get(token)}"
+            else:
+                value = payload[1](context)
+                context[token] = value
+                text = f"{token}: {value}"
+            calls.append((token, clock() - started))
+            rendered.append(text)
+        self._observe_run(calls, transition_times)
+        return core.render_output(plan, rendered, values)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "started": self.started,
+                "symbols": {name: histogram.to_dict() for name, histogram in self.symbols.items()},
+                "operations": {name: histogram.to_dict() for name, histogram in self.operations.items()},
+                "context_size": self.context_sizes.to_dict(),
+                "spans": [span._asdict() for span in self.spans],
+            }
+
+# Módulo: um único profiler ativo por processo
+_profiler = None
+
+def enable_profiling(span_limit=SPAN_LIMIT):
+    # Starts measuring (keeps the current profiler if already enabled); returns it
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(span_limit)
+        core.use_profiler(_profiler)
+    return _profiler
+
+def disable_profiling():
+    # Stops measuring; returns the profiler with what it collected, or None
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    core.use_profiler(None)
+    return profiler
+
+def current_profiler():
+    return _profiler
+
+def span(name, **attributes):
+    # with span("signal", signal=name): ...  (does nothing while profiling is off)
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.span(name, **attributes)
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _bound(bound):
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+def _histogram_lines(name, label, histograms):
+    lines = []
+    for key, histogram in histograms:
+        labels = f'{label}="{_label(key)}",' if label else ""
+        for bound, running in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{labels}le="{_bound(bound)}"}} {running}')
+        labels = f'{{{label}="{_label(key)}"}}' if label else ""
+        lines.append(f"{name}_sum{labels} {histogram.total!r}")
+        lines.append(f"{name}_count{labels} {histogram.count}")
+    return lines
+
+def prometheus_text(profiler=None):
+    # Prometheus text exposition format (0.0.4)
+    profiler = profiler or _profiler
+    if profiler is None:
+        return ""
+    with profiler._lock:
+        symbols = sorted(profiler.symbols.items())
+        operations = sorted(profiler.operations.items())
+        sizes = profiler.context_sizes
+        lines = [
+            f"# HELP {METRIC_PREFIX}_symbol_calls_total Symbol handler calls.",
+            f"# TYPE {METRIC_PREFIX}_symbol_calls_total counter",
+        ]
+        lines += [f'{METRIC_PREFIX}_symbol_calls_total{{symbol="{_label(name)}"}} {histogram.count}' for name, histogram in symbols]
+        lines += [
+            f"# HELP {METRIC_PREFIX}_symbol_seconds Symbol handler latency.",
+            f"# TYPE {METRIC_PREFIX}_symbol_seconds histogram",
+        ]
+        lines += _histogram_lines(f"{METRIC_PREFIX}_symbol_seconds", "symbol", symbols)
+        lines += [
+            f"# HELP {METRIC_PREFIX}_operation_seconds Latency of interpret, compile, transitions, phenomenon lookups and signals.",
+            f"# TYPE {METRIC_PREFIX}_operation_seconds histogram",
+        ]
+        lines += _histogram_lines(f"{METRIC_PREFIX}_operation_seconds", "operation", operations)
+        lines += [
+            f"# HELP {METRIC_PREFIX}_context_size Context keys after each interpret().",
+            f"# TYPE {METRIC_PREFIX}_context_size histogram",
+        ]
+        lines += _histogram_lines(f"{METRIC_PREFIX}_context_size", None, [(None, sizes)])
+    return "\n".join(lines) + "\n"
+
+def write_metrics(path, profiler=None):
+    # JSON snapshot for *.json, Prometheus text otherwise. The file is replaced
+    # atomically, so a collector never reads a partial file.
+    profiler = profiler or _profiler
+    if profiler is None:
+        raise ValueError("profiling is not enabled")
+    if path.endswith(".json"):
+        text = json.dumps(profiler.snapshot(), ensure_ascii=False, indent=2) + "\n"
+    else:
+        text = prometheus_text(profiler)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    os.replace(temporary, path)
+
+def format_summary(profiler=None):
+    # Human-readable table for the GUI Stats tab
+    profiler = profiler or _profiler
+    if profiler is None:
+        return "Profiling is off."
+    with profiler._lock:
+        symbols = sorted(profiler.symbols.items(), key=lambda item: -item[1].total)
+        operations = sorted(profiler.operations.items())
+        sizes = profiler.context_sizes
+        spans = list(profiler.spans)[-10:]
+        lines = [f"Since {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(profiler.started))}", ""]
+        lines.append(f"{'Symbol':<12}{'calls':>9}{'total ms':>11}{'mean µs':>10}{'p95 ≤ µs':>10}")
+        for name, histogram in symbols:
+            lines.append(f"{name:<12}{histogram.count:>9}{histogram.total * 1e3:>11.3f}{histogram.mean() * 1e6:>10.1f}{histogram.quantile(0.95) * 1e6:>10.1f}")
+        if not symbols:
+            lines.append("(no symbols evaluated yet)")
+        lines += ["", f"{'Operation':<18}{'count':>9}{'total ms':>11}{'mean µs':>10}{'p95 ≤ µs':>10}"]
+        for name, histogram in operations:
+            lines.append(f"{name:<18}{histogram.count:>9}{histogram.total * 1e3:>11.3f}{histogram.mean() * 1e6:>10.1f}{histogram.quantile(0.95) * 1e6:>10.1f}")
+        if sizes.count:
+            lines += ["", f"Context size: mean {sizes.mean():.1f} keys, p95 ≤ {sizes.quantile(0.95):g}"]
+        if spans:
+            lines += ["", "Recent spans:"]
+            for span in spans:
+                indent = "  " if span.parent_id is not None else ""
+                label = span.attributes.get("expression") or span.attributes.get("signal") or ""
+                lines.append(f"{indent}{span.name} {label} {span.duration * 1e6:.0f} µs")
+    return "\n".join(lines)
@@ -0,0 +1,159 @@
+# Symbol packs
+# A pack is a JSON or TOML file adding symbols, phenomena and signals without editing
+# the source:
+#
+#   {
+#     "symbols": {
+#       "⟁": "Pyramid Resonance (Energy Focused)",
+#       "⟐": {"template": "Echo of {⧗}", "defaults": {"⧗": "Silence"}}
+#     },
+#     "phenomena": {"Resonant Fold": ["⟁ × ꩜", "Focused energy bends spacetime."]},
+#     "signals": {"Pulse 7": ["⟁", "⟁ ⇌ ⟐"]}
+#   }
+#
+# A symbol is a constant value (pure) or a template whose {fields} are read from the
+# context (contextual). Phenomena may also be {"equation": ..., "meaning": ...} tables,
+# which reads better in TOML.
+#
+# Every pack has a namespace (its file name without extension unless given): entries
+# are registered as "namespace:name", and symbols also under their bare name when no
+# earlier symbol has it. register_pack() only records the file; it is parsed and merged
+# into the symbol table and catalogs the first time an expression is compiled or a
+# phenomenon is looked up (or on ensure_loaded()).
+
+import json
+import os
+import string
+
+from . import core
+from .paths import data_dir
+
+PACK_EXTENSIONS = (".json", ".toml")
+PACKS_ENV = "ALIEN_SYMBOLIC_PACKS"
+
+# Packs registered so far: namespace -> path
+packs = {}
+# Qualified symbol names that also have a bare alias (hidden from symbol_names())
+_aliased = set()
+# Pack contents already read (by catalog_cache.py): path -> data, used once by load_pack()
+_preloaded = {}
+
+def qualify(namespace, name):
+    return f"{namespace}:{name}"
+
+def pack_namespace(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+def read_pack(path):
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(f"{path}: TOML packs need Python 3.11+ or the tomli package") from None
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _template_function(template, defaults):
+    # Valor contextual: campos {chave} lidos do contexto no momento da avaliação
+    parts = list(string.Formatter().parse(template))
+    reads = tuple(dict.fromkeys(field for _, field, _, _ in parts if field))
+
+    def value_function(ctx):
+        out = []
+        for literal, field, spec, _ in parts:
+            out.append(literal)
+            if field:
+                out.append(format(ctx.get(field, defaults.get(field, "Unknown")), spec or ""))
+        return "".join(out)
+    return value_function, reads
+
+def _constant_function(value):
+    return lambda ctx: value
+
+def _symbol_entry(path, name, entry):
+    if isinstance(entry, str):
+        return _constant_function(entry), core.PURE, ()
+    if isinstance(entry, dict) and "value" in entry:
+        return _constant_function(entry["value"]), core.PURE, ()
+    if isinstance(entry, dict) and "template" in entry:
+        value_function, reads = _template_function(entry["template"], entry.get("defaults", {}))
+        return value_function, (core.CONTEXTUAL if reads else core.PURE), reads
+    raise ValueError(f"{path}: symbol {name!r} needs a value or a template")
+
+def _phenomenon_entry(path, name, entry):
+    if isinstance(entry, dict):
+        return entry["equation"], entry.get("meaning", "")
+    if isinstance(entry, (list, tuple)) and len(entry) == 2:
+        return tuple(entry)
+    raise ValueError(f"{path}: phenomenon {name!r} needs an equation and a meaning")
+
+def load_pack(path, namespace):
+    # Merges one pack into the core tables (normally called lazily by ensure_loaded)
+    data = _preloaded.pop(path, None)
+    if data is None:
+        data = read_pack(path)
+    for name, entry in data.get("symbols", {}).items():
+        value_function, kind, reads = _symbol_entry(path, name, entry)
+        qualified = qualify(namespace, name)
+        names = [qualified]
+        if name not in core.symbols:
+            names.append(name)
+            _aliased.add(qualified)
+        core.value_classes[value_function] = (kind, reads)
+        for symbol_name in names:
+            # Ids de símbolo são atribuídos na primeira compilação que os usa
+            core.symbol_values[symbol_name] = value_function
+            core.symbols[symbol_name] = core.make_handler(symbol_name, value_function)
+    # Catálogos atualizados em bloco; os índices se reconstroem na próxima consulta
+    core.phenomena.update(
+        (qualify(namespace, name), _phenomenon_entry(path, name, entry))
+        for name, entry in data.get("phenomena", {}).items()
+    )
+    core.signals.update(
+        (qualify(namespace, name), list(expressions))
+        for name, expressions in data.get("signals", {}).items()
+    )
+    core.clear_compiled_cache()
+
+def register_pack(path, namespace=None):
+    # Records the pack; nothing is read until first use. Returns the namespace.
+    namespace = namespace or pack_namespace(path)
+    if namespace in packs:
+        raise ValueError(f"symbol pack namespace already registered: {namespace}")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    packs[namespace] = path
+    core.add_lazy_loader(lambda: load_pack(path, namespace))
+    return namespace
+
+def preload_packs(data_by_path):
+    # Contents for registered packs, so loading them does not read the files again
+    _preloaded.update(data_by_path)
+
+def pack_paths(paths):
+    # Pack files among paths; directories are listed (not recursively), in name order
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(PACK_EXTENSIONS):
+                    yield os.path.join(path, name)
+        elif path.endswith(PACK_EXTENSIONS):
+            yield path
+
+def discover_packs(paths=None):
+    # Registers the packs in paths, by default the "packs" folder of the user data
+    # directory plus the ALIEN_SYMBOLIC_PACKS list (os.pathsep separated)
+    if paths is None:
+        paths = [data_dir("packs")]
+        paths += [p for p in os.environ.get(PACKS_ENV, "").split(os.pathsep) if p]
+    return [register_pack(path) for path in pack_paths(paths) if pack_namespace(path) not in packs]
+
+def symbol_names():
+    # Symbols to show to the user: qualified pack names only when there is no bare alias
+    core.ensure_loaded()
+    return [name for name in core.symbols if name not in _aliased]
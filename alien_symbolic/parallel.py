@@ -0,0 +1,84 @@
+# Multi-process decoding engine
+# Expressions and signals are sharded in batches across a process pool and the results
+# are yielded in input order. Every task runs with its own random.Random seeded from
+# (seed, task index), so the output of ∴ and ✧ does not depend on the number of workers
+# or on how tasks are distributed between them. Worker processes register the same symbol
+# packs as the main process, so pack symbols and phenomena resolve under any start method
+# (fork, forkserver or spawn).
+
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .core import decode_expression, decode_signal, ensure_loaded, signals, use_random
+from .packs import pack_namespace, packs, register_pack
+
+BATCH_SIZE = 256
+
+def task_random(seed, index):
+    # Semente estável por tarefa (strings são semeadas via SHA-512, independente de PYTHONHASHSEED)
+    return random.Random(f"{seed}:{index}")
+
+def init_worker(pack_paths):
+    # Pool initializer: pack_paths holds paths or (namespace, path) pairs. Com fork os
+    # pacotes já vêm registrados do processo principal
+    for item in pack_paths:
+        namespace, path = item if isinstance(item, tuple) else (pack_namespace(item), item)
+        if namespace not in packs:
+            register_pack(path, namespace)
+    ensure_loaded()
+
+def _run_task(kind, payload, seed, index, search=False, outputs=None, events=False):
+    previous = use_random(task_random(seed, index))
+    try:
+        if kind == "signal":
+            name, expressions = payload
+            return {"signal": name, "expressions": decode_signal(expressions)}
+        return decode_expression(payload, search=search, outputs=outputs, events=events)
+    finally:
+        use_random(previous)
+
+def _run_batch(kind, batch, seed, search=False, outputs=None, events=False):
+    return [_run_task(kind, payload, seed, index, search, outputs, events) for index, payload in batch]
+
+def _batches(items, size):
+    iterator = enumerate(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _decode(kind, items, seed, workers, batch_size, search=False, outputs=None, events=False, mp_context=None):
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for batch in _batches(items, batch_size):
+            yield from _run_batch(kind, batch, seed, search, outputs, events)
+        return
+
+    # Janela limitada de lotes em voo: a entrada é consumida sob demanda
+    max_in_flight = workers * 2
+    pack_paths = tuple(packs.items())
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=init_worker, initargs=(pack_paths,)) as pool:
+        pending = deque()
+        for batch in _batches(items, batch_size):
+            pending.append(pool.submit(_run_batch, kind, batch, seed, search, outputs, events))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def decode_expressions_parallel(expressions, seed=None, workers=None, batch_size=BATCH_SIZE, search=False, outputs=None, events=False, mp_context=None):
+    # Yields one decode_expression() record per input expression, in input order.
+    # mp_context: multiprocessing context for the pool (default: the platform's)
+    return _decode("expression", expressions, seed, workers, batch_size, search, outputs, events, mp_context)
+
+def decode_signals_parallel(names, seed=None, workers=None, batch_size=BATCH_SIZE, catalog=None, mp_context=None):
+    # names may be signal names from the catalog or (name, expressions) pairs
+    catalog = signals if catalog is None else catalog
+    payloads = ((item, tuple(catalog[item])) if isinstance(item, str) else (item[0], tuple(item[1])) for item in names)
+    return _decode("signal", payloads, seed, workers, batch_size, mp_context=mp_context)
@@ -0,0 +1,163 @@
+# Expression parser
+# Turns an expression into a typed AST with operator precedence, grouping and source
+# spans. Operators from weakest to strongest binding:
+#
+#   =   equation          (left associative)
+#   →   transition        (right associative)
+#   ⇌   oscillation       (left associative; also a symbol on its own)
+#   +   combination       (left associative)
+#   ×   interaction       (left associative)
+#       juxtaposition     ("∴ ∞ ∴" is a Sequence)
+#
+# Parentheses and operators are split off even when glued to symbols ("(∴", "✦⇌✦").
+# The parser never rejects input: an operator without operands, a stray ")" or an
+# unclosed "(" is kept as a Literal / open Group, so every expression the interpreter
+# accepted before still evaluates.
+
+import re
+from collections import namedtuple
+
+OPERATORS = ("=", "→", "⇌", "+", "×")
+PARENS = ("(", ")")
+_SPLIT_CHARS = "".join(OPERATORS + PARENS)
+_TOKEN_RE = re.compile(f"[{_SPLIT_CHARS}]|[^\\s{_SPLIT_CHARS}]+")
+# Níveis de precedência, do mais fraco para o mais forte
+_LEVELS = ("=", "→", "⇌", "+", "×")
+_RIGHT_ASSOCIATIVE = ("→",)
+
+# text is the token, start/end its character offsets in the source
+Token = namedtuple("Token", ["text", "start", "end"])
+
+# Every node carries span (start, end character offsets) and tokens (first, end) token
+# indices, end exclusive in both.
+Symbol = namedtuple("Symbol", ["name", "span", "tokens"])
+Literal = namedtuple("Literal", ["text", "span", "tokens"])
+Group = namedtuple("Group", ["body", "closed", "span", "tokens"])
+Sequence = namedtuple("Sequence", ["items", "span", "tokens"])
+BinaryOp = namedtuple("BinaryOp", ["op", "left", "right", "span", "tokens"])
+
+def lex(expression):
+    return tuple(Token(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(expression))
+
+def _binary(op, left, right):
+    return BinaryOp(op, left, right, (left.span[0], right.span[1]), (left.tokens[0], right.tokens[1]))
+
+def _starts_operand(text):
+    return text not in PARENS[1:] and (text not in OPERATORS or text == "⇌")
+
+class _Parser:
+    def __init__(self, tokens, known_symbols):
+        self.tokens = tokens
+        self.known_symbols = known_symbols
+        self.pos = 0
+        self.depth = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i].text if i < len(self.tokens) else None
+
+    def is_binary(self, op):
+        # Só é operador binário se houver um operando logo depois
+        following = self.peek(1)
+        return self.peek() == op and following is not None and _starts_operand(following)
+
+    def leaf(self, node_type, text):
+        token = self.tokens[self.pos]
+        node = node_type(text, (token.start, token.end), (self.pos, self.pos + 1))
+        self.pos += 1
+        return node
+
+    def atom(self):
+        text = self.peek()
+        if text == "(":
+            open_index = self.pos
+            self.pos += 1
+            self.depth += 1
+            body = self.expression() if self.peek() not in (None, ")") else None
+            self.depth -= 1
+            closed = self.peek() == ")"
+            if closed:
+                self.pos += 1
+            end_token = self.tokens[self.pos - 1]
+            return Group(body, closed, (self.tokens[open_index].start, end_token.end), (open_index, self.pos))
+        if text in OPERATORS and text != "⇌" or text == ")":
+            return self.leaf(Literal, text)
+        if self.known_symbols is None or text in self.known_symbols:
+            return self.leaf(Symbol, text)
+        return self.leaf(Literal, text)
+
+    def sequence(self):
+        items = [self.atom()]
+        while True:
+            text = self.peek()
+            if text is None or text == ")" and self.depth > 0:
+                break
+            if text in OPERATORS and self.is_binary(text):
+                break
+            items.append(self.atom())
+        if len(items) == 1:
+            return items[0]
+        return Sequence(tuple(items), (items[0].span[0], items[-1].span[1]), (items[0].tokens[0], items[-1].tokens[1]))
+
+    def binary(self, level):
+        if level == len(_LEVELS):
+            return self.sequence()
+        op = _LEVELS[level]
+        operands = [self.binary(level + 1)]
+        while self.is_binary(op):
+            self.pos += 1
+            operands.append(self.binary(level + 1))
+        # Cadeias são montadas iterativamente, sem recursão proporcional ao tamanho
+        if op in _RIGHT_ASSOCIATIVE:
+            node = operands.pop()
+            while operands:
+                left = operands.pop()
+                node = _binary(op, left, node)
+        else:
+            node = operands[0]
+            for right in operands[1:]:
+                node = _binary(op, node, right)
+        return node
+
+    def expression(self):
+        return self.binary(0)
+
+def parse_tokens(tokens, known_symbols=None):
+    # known_symbols: container of symbol names; other atoms become Literal nodes.
+    # With None every non-operator atom is a Symbol.
+    if not tokens:
+        return None
+    parser = _Parser(tokens, known_symbols)
+    node = parser.expression()
+    while parser.pos < len(tokens):
+        # Sobras no nível mais externo (ex.: ")" avulso seguido de operador) viram sequência
+        rest = parser.expression()
+        items = (node.items if isinstance(node, Sequence) else (node,)) + (rest,)
+        node = Sequence(items, (items[0].span[0], items[-1].span[1]), (items[0].tokens[0], items[-1].tokens[1]))
+    return node
+
+def parse_expression(expression, known_symbols=None):
+    return parse_tokens(lex(expression), known_symbols)
+
+def walk(node):
+    # Pre-order traversal of every node in the tree
+    if node is None:
+        return
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, BinaryOp):
+            stack.append(node.right)
+            stack.append(node.left)
+        elif isinstance(node, Sequence):
+            stack.extend(reversed(node.items))
+        elif isinstance(node, Group) and node.body is not None:
+            stack.append(node.body)
+
+def to_source(node, tokens):
+    # Normalized text of a node: its tokens joined by single spaces
+    if node is None:
+        return ""
+    first, end = node.tokens
+    return " ".join(token.text for token in tokens[first:end])
@@ -0,0 +1,22 @@
+# Per-user data directory
+# Session logs, history and favorites written by the GUI live under ~/.alien_symbolic.
+# Another directory can be chosen with set_data_dir() (the GUI's --data-dir option) or
+# the ALIEN_SYMBOLIC_DATA_DIR environment variable, in that order of precedence.
+
+import os
+
+DATA_DIR_ENV = "ALIEN_SYMBOLIC_DATA_DIR"
+
+_data_dir = None
+
+def set_data_dir(path):
+    # None volta ao padrão (variável de ambiente ou ~/.alien_symbolic)
+    global _data_dir
+    _data_dir = path
+
+def data_dir(*parts):
+    # Cria o diretório se ainda não existir
+    base = _data_dir or os.environ.get(DATA_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".alien_symbolic")
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,117 @@
+# Structured interpretation results
+# interpret_result() (core.py) returns an Interpretation: the expression and an ordered
+# tuple of typed events, in the order interpret() prints them, with the raw values left
+# as they are. Nothing is formatted until someone asks: render_text() gives exactly the
+# string interpret() returns, and event_dict() a JSON-ready form, so consumers read
+# values instead of parsing "symbol: value" text.
+#
+#   result = interpret_result("∴ → ⧗")
+#   result.events[0]     # TransitionEvent(origin_key="∴", target_key="⧗", ...)
+#   result.values()      # {"∴": [...], "⧗": "Entangled Pair Linked: ..."}
+#   str(result)          # same text as interpret()
+
+from collections import namedtuple
+
+SYMBOL_EVENT = "symbol"
+OPERATOR_EVENT = "operator"
+TRANSITION_EVENT = "transition"
+
+# A symbol activation and the value it produced
+SymbolEvent = namedtuple("SymbolEvent", ["symbol", "value"])
+# An operator, parenthesis or unknown token, shown as is
+OperatorEvent = namedtuple("OperatorEvent", ["operator"])
+# A transition: origin/target are the SymbolEvent/OperatorEvent tuples of the two
+# operands (*_key their normalized text), origin_value the origin's value when the arrow
+# was reached, target_value the target's value just before the assignment and result
+# the value assigned to the target
+TransitionEvent = namedtuple("TransitionEvent", ["origin_key", "target_key", "origin", "target", "origin_value", "target_value", "result"])
+
+EVENT_TYPES = {SymbolEvent: SYMBOL_EVENT, OperatorEvent: OPERATOR_EVENT, TransitionEvent: TRANSITION_EVENT}
+
+def render_event(event, cache=None):
+    # cache: id(event) -> text, shared across one rendering (transition operands are
+    # the same event objects as the tokens shown around them)
+    kind = type(event)
+    if kind is SymbolEvent:
+        return f"{event.symbol}: {event.value}"
+    if kind is OperatorEvent:
+        return event.operator
+    if cache is None:
+        cache = {}
+    parts = []
+    for operand in (event.origin, event.target):
+        try:
+            parts.append(" ".join(map(cache.__getitem__, map(id, operand))))
+        except KeyError:
+            for item in operand:
+                if id(item) not in cache:
+                    cache[id(item)] = render_event(item, cache)
+            parts.append(" ".join(map(cache.__getitem__, map(id, operand))))
+    return f"Transition: {parts[0]} → {parts[1]} => {event.result}"
+
+def render_text(events):
+    # The interpret() string
+    cache = {}
+    texts = []
+    for event in events:
+        text = render_event(event, cache)
+        if type(event) is not TransitionEvent:
+            cache[id(event)] = text
+        texts.append(text)
+    return " ".join(texts)
+
+def event_dict(event):
+    kind = type(event)
+    if kind is SymbolEvent:
+        return {"type": SYMBOL_EVENT, "symbol": event.symbol, "value": event.value}
+    if kind is OperatorEvent:
+        return {"type": OPERATOR_EVENT, "operator": event.operator}
+    return {
+        "type": TRANSITION_EVENT,
+        "origin_key": event.origin_key,
+        "target_key": event.target_key,
+        "origin": [event_dict(item) for item in event.origin],
+        "target": [event_dict(item) for item in event.target],
+        "origin_value": event.origin_value,
+        "target_value": event.target_value,
+        "result": event.result,
+    }
+
+def _symbol_events(events):
+    # Ativações em ordem, incluindo as que só aparecem dentro de uma transição
+    for event in events:
+        kind = type(event)
+        if kind is SymbolEvent:
+            yield event
+        elif kind is TransitionEvent:
+            yield from _symbol_events(event.origin)
+            yield from _symbol_events(event.target)
+
+class Interpretation(namedtuple("Interpretation", ["expression", "events"])):
+    __slots__ = ()
+
+    def text(self):
+        return render_text(self.events)
+
+    __str__ = text
+
+    def activations(self):
+        # Every SymbolEvent once, in output order (transition operands included)
+        seen = set()
+        out = []
+        for event in _symbol_events(self.events):
+            # Operandos de transições aninhadas aparecem em mais de um evento
+            if id(event) not in seen:
+                seen.add(id(event))
+                out.append(event)
+        return out
+
+    def values(self):
+        # symbol -> value of its last activation
+        return {event.symbol: event.value for event in self.activations()}
+
+    def transitions(self):
+        return [event for event in self.events if type(event) is TransitionEvent]
+
+    def to_dict(self):
+        return {"expression": self.expression, "events": [event_dict(event) for event in self.events]}
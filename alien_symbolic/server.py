@@ -0,0 +1,350 @@
+# Local decoding service
+# An asyncio server speaking a JSON line protocol over TCP (localhost by default) or a
+# Unix socket. Each request is one JSON object per line and gets one JSON object per
+# line back, in request order; a connection stays open for any number of requests and
+# clients may send several before reading the responses (pipelining).
+#
+#   {"id": 1, "op": "interpret", "expression": "Ψ + ∅ → ꩜", "seed": 7}
+#   {"id": 6, "op": "interpret", "expression": "∴ → ⧗", "events": true}
+#   {"id": 2, "op": "phenomenon", "name": "Wormhole"}
+#   {"id": 3, "op": "phenomenon", "expression": "◐ + ∴ = Ψ", "search": true}
+#   {"id": 4, "op": "signal", "name": "FRB 121102"}
+#   {"id": 5, "op": "signal", "expressions": ["●", "∴ + ◐"]}
+#
+# Responses echo "id" and carry either the result fields or "error". Requests from all
+# connections go through one bounded queue; a batcher takes everything queued (up to
+# batch_size) and decodes it in one call, either on the event loop (workers=0, the
+# lowest latency) or in a process pool, so the per-request overhead is amortized when
+# the server is busy. alien_symbolic.client is a matching client and load generator.
+#
+#   python -m alien_symbolic.server --port 8765
+#   python -m alien_symbolic.server --unix /tmp/alien.sock --workers 4
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .catalog_cache import warm_start
+from .context import SymbolContext
+from .core import (
+    check_phenomenon,
+    decode_expression,
+    decode_signal,
+    ensure_loaded,
+    phenomena,
+    search_phenomena,
+    signals,
+    use_random,
+)
+from .metrics import enable_profiling, write_metrics
+from .packs import register_pack
+from .parallel import init_worker
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BATCH_SIZE = 64
+QUEUE_SIZE = 4096  # Requisições em espera antes de os clientes serem freados
+PIPELINE_DEPTH = 1024  # Requisições sem resposta por conexão
+MAX_LINE = 1 << 20
+WRITE_BUFFER_LIMIT = 1 << 16
+METRICS_INTERVAL = 10.0  # Segundos entre gravações do arquivo de métricas
+
+class RequestError(Exception):
+    pass
+
+def _seeded(request):
+    seed = request.get("seed")
+    return use_random(random.Random(seed)) if seed is not None else None
+
+def _interpret(request):
+    expression = request.get("expression")
+    if not isinstance(expression, str):
+        raise RequestError("interpret needs an expression")
+    return decode_expression(expression, SymbolContext(), bool(request.get("search")), events=bool(request.get("events")))
+
+def _phenomenon(request):
+    name = request.get("name")
+    if name is not None:
+        if name not in phenomena:
+            raise RequestError(f"unknown phenomenon: {name}")
+        equation, meaning = phenomena[name]
+        return {"phenomenon": name, "equation": equation, "meaning": meaning}
+    expression = request.get("expression")
+    if not isinstance(expression, str):
+        raise RequestError("phenomenon needs a name or an expression")
+    pheno, meaning = check_phenomenon(expression)
+    response = {"expression": expression, "phenomenon": pheno, "meaning": meaning}
+    if request.get("search"):
+        response["matches"] = [{"phenomenon": name, "match": kind} for name, kind, _ in search_phenomena(expression)]
+    return response
+
+def _signal(request):
+    name = request.get("name")
+    if name is not None:
+        if name not in signals:
+            raise RequestError(f"unknown signal: {name}")
+        expressions = signals[name]
+    else:
+        expressions = request.get("expressions")
+        if not isinstance(expressions, list) or not all(isinstance(e, str) for e in expressions):
+            raise RequestError("signal needs a name or a list of expressions")
+    return {"signal": name, "expressions": decode_signal(expressions)}
+
+OPERATIONS = {
+    "interpret": _interpret,
+    "phenomenon": _phenomenon,
+    "signal": _signal,
+    "ping": lambda request: {},
+}
+
+def handle_request(request):
+    # One request dict -> one response dict (never raises)
+    response = {"id": request.get("id")} if isinstance(request, dict) else {"id": None}
+    try:
+        if not isinstance(request, dict):
+            raise RequestError("request must be a JSON object")
+        operation = OPERATIONS.get(request.get("op"))
+        if operation is None:
+            raise RequestError(f"unknown op: {request.get('op')!r}")
+        previous = _seeded(request)
+        try:
+            response.update(operation(request))
+        finally:
+            if previous is not None:
+                use_random(previous)
+    except Exception as e:
+        response["error"] = str(e)
+    return response
+
+def handle_batch(requests):
+    # Executado no processo do pool (ou no loop, com workers=0)
+    return [handle_request(request) for request in requests]
+
+def _remove_stale_socket(path):
+    # Um servidor encerrado à força deixa o arquivo do socket para trás
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+    except OSError:
+        pass
+    else:
+        raise OSError(f"another server is listening on {path}")
+    finally:
+        probe.close()
+
+class DecodeServer:
+    def __init__(self, workers=0, batch_size=BATCH_SIZE, queue_size=QUEUE_SIZE, pack_paths=()):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.pack_paths = tuple(pack_paths)
+        self.requests = 0
+        self.batches = 0
+        self._queue = None
+        self._pool = None
+        self._batcher = None
+        self._in_flight = None
+        self._servers = []
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        # path: listen on a Unix socket instead of host:port. Returns the asyncio server.
+        if self._queue is None:
+            ensure_loaded()
+            self._queue = asyncio.Queue(self.queue_size)
+            if self.workers:
+                self._pool = ProcessPoolExecutor(self.workers, initializer=init_worker, initargs=(self.pack_paths,))
+                self._in_flight = asyncio.Semaphore(self.workers * 2)
+            self._batcher = asyncio.ensure_future(self._run_batches())
+        if path is not None:
+            _remove_stale_socket(path)
+            server = await asyncio.start_unix_server(self._serve, path, limit=MAX_LINE)
+        else:
+            server = await asyncio.start_server(self._serve, host, port, limit=MAX_LINE)
+        self._servers.append((server, path))
+        return server
+
+    async def close(self):
+        for server, path in self._servers:
+            server.close()
+            await server.wait_closed()
+            if path is not None and os.path.exists(path):
+                os.unlink(path)
+        self._servers = []
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self._queue = None
+
+    async def submit(self, request):
+        # Enqueues one request; returns a future for its response
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((request, future))
+        return future
+
+    async def decode(self, request):
+        # One request from inside the event loop, without a connection
+        return await (await self.submit(request))
+
+    def _resolve(self, batch, responses):
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _run_pooled(self, batch):
+        try:
+            loop = asyncio.get_event_loop()
+            responses = await loop.run_in_executor(self._pool, handle_batch, [request for request, _ in batch])
+        except Exception as e:
+            responses = [{"id": request.get("id") if isinstance(request, dict) else None, "error": str(e)} for request, _ in batch]
+        finally:
+            self._in_flight.release()
+        self._resolve(batch, responses)
+
+    async def _run_batches(self):
+        queue = self._queue
+        while True:
+            # Tudo o que já está na fila vai no mesmo lote
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self.requests += len(batch)
+            self.batches += 1
+            if self._pool is None:
+                self._resolve(batch, handle_batch([request for request, _ in batch]))
+                # Cede o loop para que as conexões leiam mais requisições
+                await asyncio.sleep(0)
+            else:
+                await self._in_flight.acquire()
+                asyncio.ensure_future(self._run_pooled(batch))
+
+    async def _write_responses(self, writer, pending):
+        # Respostas na ordem das requisições da conexão
+        while True:
+            future = await pending.get()
+            if future is None:
+                return
+            writer.write((json.dumps(await future, ensure_ascii=False) + "\n").encode("utf-8"))
+            # drain() só quando não há mais respostas prontas ou o buffer já está grande
+            if pending.empty() or writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                await writer.drain()
+
+    async def _serve(self, reader, writer):
+        # Limitada: com muitas respostas por enviar, a conexão para de ler requisições
+        pending = asyncio.Queue(PIPELINE_DEPTH)
+        responder = asyncio.ensure_future(self._write_responses(writer, pending))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):  # ValueError: linha maior que MAX_LINE
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    future = asyncio.get_event_loop().create_future()
+                    future.set_result({"id": None, "error": f"invalid JSON: {e}"})
+                else:
+                    future = await self.submit(request)
+                await pending.put(future)
+            await pending.put(None)
+            await responder
+        except ConnectionError:
+            pass
+        finally:
+            responder.cancel()
+            writer.close()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+        }
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m alien_symbolic.server",
+        description="Serve interpret, phenomenon lookup and signal simulation over a JSON line protocol.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default {DEFAULT_PORT})")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes for decoding (default 0: decode on the event loop)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="maximum requests decoded together")
+    parser.add_argument("--pack", action="append", default=[], metavar="PATH", help="load a symbol pack (JSON or TOML); may be repeated")
+    parser.add_argument("--no-catalog-cache", action="store_true", help="load the symbol packs and build the catalog indexes without the on-disk cache")
+    parser.add_argument("--metrics", metavar="PATH", help=f"profile symbols and rewrite metrics to PATH every {METRICS_INTERVAL:g}s (JSON for *.json, Prometheus text otherwise); needs --workers 0")
+    return parser
+
+async def export_metrics(path):
+    while True:
+        await asyncio.sleep(METRICS_INTERVAL)
+        write_metrics(path)
+
+async def serve(server, args):
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Listening on {where} ({args.workers or 'no'} worker processes)", file=sys.stderr)
+    if args.metrics:
+        asyncio.ensure_future(export_metrics(args.metrics))
+    await listener.serve_forever() if hasattr(listener, "serve_forever") else asyncio.Event().wait()
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.metrics:
+        # Com workers cada processo teria o seu profiler; só o loop principal é medido
+        if args.workers:
+            parser.error("--metrics needs --workers 0")
+        enable_profiling()
+    try:
+        for path in args.pack:
+            register_pack(path)
+        if args.no_catalog_cache:
+            ensure_loaded()
+        else:
+            warm_start()
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot load symbol pack: {e}")
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server = DecodeServer(args.workers, args.batch_size, pack_paths=args.pack)
+    try:
+        loop.run_until_complete(serve(server, args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"cannot listen: {e}", file=sys.stderr)
+        return 1
+    finally:
+        loop.run_until_complete(server.close())
+        loop.close()
+        if args.metrics:
+            write_metrics(args.metrics)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
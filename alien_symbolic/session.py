@@ -0,0 +1,165 @@
+# Session log
+# Every evaluation run from the GUI is appended to a JSON Lines file as one record:
+#
+#   timestamp, tab, run, kind, source, expression, result, phenomenon, meaning, error
+#
+# kind is "expression", "signal" (one record per expression of the signal, source is the
+# signal name), "stream" (one record per decoded window of a live stream, source is the
+# stream source) or "phenomenon" (source is the phenomenon name). Records of one button
+# press share a run number. The log is never rewritten, so exports stream from it in
+# chunks and still contain output that was cleared from the tabs.
+#
+# record_lines() / run_header() render a record as (text, tag) lines; the output tabs
+# and the text export use the same rendering.
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+
+from .paths import data_dir
+
+FIELDS = ("timestamp", "tab", "run", "kind", "source", "expression", "result", "phenomenon", "meaning", "error")
+FORMATS = ("text", "jsonl", "csv")
+EXPORT_CHUNK = 1000  # Registros por escrita no arquivo exportado
+SEPARATOR = ("---\n", "separator")
+
+def run_header(record):
+    if record["kind"] == "signal":
+        return [(f"[{record['timestamp']}] >>> Simulating Signal: {record['source']}\n", None)]
+    if record["kind"] == "stream":
+        return [(f"[{record['timestamp']}] >>> Streaming: {record['source']}\n", None)]
+    return []
+
+def record_lines(record):
+    kind = record["kind"]
+    error = record.get("error")
+    if kind == "phenomenon":
+        lines = [
+            (f"[{record['timestamp']}] >>> Phenomenon: {record['source']}\n", "phenomenon"),
+            (f"Equation: {record['expression']}\n", "equation"),
+        ]
+        if error is not None:
+            lines.append((f"Error: {error}\n", "error"))
+        else:
+            lines.append((f"Interpretation: {record['result']}\n", "result"))
+        lines.append((f"Meaning: {record['meaning']}\n", "result"))
+        return lines
+
+    if kind in ("signal", "stream"):
+        lines = [(f"Expression: {record['expression']}\n", "equation")]
+    else:
+        lines = [(f"[{record['timestamp']}] >>> {record['expression']}\n", "equation")]
+    if error is not None:
+        lines.append((f"Error: {error}\n", "error"))
+    else:
+        lines.append((f"{record['result']}\n", "result"))
+        if record.get("phenomenon"):
+            lines.append((f"Phenomenon Detected: {record['phenomenon']}\n", "phenomenon"))
+            lines.append((f"Meaning: {record['meaning']}\n", "result"))
+    return lines
+
+def _text_chunks(records):
+    # Cabeçalho quando começa um run, separador quando ele termina
+    run = None
+    started = False
+    for record in records:
+        lines = []
+        if not started or record["run"] != run:
+            if started:
+                lines.append(SEPARATOR)
+            lines += run_header(record)
+            run = record["run"]
+            started = True
+        lines += record_lines(record)
+        yield "".join(text for text, _ in lines)
+    if started:
+        yield SEPARATOR[0]
+
+def _jsonl_chunks(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+def _chunked(pieces, size):
+    chunk = []
+    for piece in pieces:
+        chunk.append(piece)
+        if len(chunk) >= size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+def export_records(records, out, fmt="text", chunk_size=EXPORT_CHUNK):
+    # Streams records to the text file out; returns the number of records written
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format: {fmt}")
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        rows = []
+        for record in counted():
+            rows.append(record)
+            if len(rows) >= chunk_size:
+                writer.writerows(rows)
+                rows = []
+        writer.writerows(rows)
+        return count
+    pieces = _text_chunks(counted()) if fmt == "text" else _jsonl_chunks(counted())
+    for chunk in _chunked(pieces, chunk_size):
+        out.write(chunk)
+    return count
+
+def format_for_path(path):
+    # Formato de exportação a partir da extensão do arquivo
+    extension = os.path.splitext(path)[1].lower()
+    return {".jsonl": "jsonl", ".json": "jsonl", ".csv": "csv"}.get(extension, "text")
+
+class SessionLog:
+    def __init__(self, path=None):
+        if path is None:
+            name = f"session-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl"
+            path = os.path.join(data_dir("sessions"), name)
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+        self._run = 0
+
+    def new_run(self):
+        with self._lock:
+            self._run += 1
+            return self._run
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def records(self, tab=None):
+        # Leitura independente do arquivo; pode rodar enquanto outra thread escreve
+        with self._lock:
+            self._file.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # Registro ainda sendo escrito
+                record = json.loads(line)
+                if tab is None or record.get("tab") == tab:
+                    yield record
+
+    def export(self, out, fmt="text", tab=None, chunk_size=EXPORT_CHUNK):
+        return export_records(self.records(tab), out, fmt, chunk_size)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,417 @@
+# Streaming signal ingestion
+# Live symbol streams (a local socket, a named pipe, stdin or a file being appended to)
+# are decoded by a pipeline of generator stages:
+#
+#   source lines -> tokenize() -> windows() -> interpret() + phenomenon detection -> sink
+#
+# The source/tokenize/window stages run on a reader thread and decoding on a decoder
+# thread; they are connected by bounded queues. When the sink falls behind, the queues
+# fill up and the reader stops reading, so a socket sender is slowed down by TCP instead
+# of the pipeline buffering without limit. StreamPipeline.stats() reports throughput and
+# per-window latency (from the arrival of a window's last token to its hand-off to the
+# sink).
+#
+# Sources are given as strings: "-" (stdin), "tail:PATH" (follow a growing file),
+# "tcp:HOST:PORT" / "unix:PATH" (connect), "listen:HOST:PORT" / "unix-listen:PATH"
+# (accept connections one after another), or any other path (a file or named pipe).
+#
+#   python -m alien_symbolic.stream tcp:127.0.0.1:9000 --window 5 > decoded.jsonl
+
+import argparse
+import codecs
+import io
+import json
+import os
+import queue
+import random
+import socket
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
+from .context import SymbolContext
+from .core import decode_expression, ensure_loaded, use_random
+from .metrics import enable_profiling, write_metrics
+from .parser import lex
+
+QUEUE_SIZE = 256  # Janelas em espera entre os estágios
+IDLE_TIMEOUT = 0.1  # Segundos entre verificações de parada quando não chega nada
+TAIL_INTERVAL = 0.1
+LATENCY_SAMPLES = 1024  # Últimas latências mantidas para os percentis
+RECV_SIZE = 65536
+
+# tokens is a tuple of symbol/operator strings; ready is the time.perf_counter() at which
+# the window's last token arrived
+Window = namedtuple("Window", ["index", "tokens", "expression", "ready"])
+# record is a decode_expression() dict; latency in seconds
+StreamResult = namedtuple("StreamResult", ["window", "record", "latency"])
+StreamStats = namedtuple("StreamStats", [
+    "windows", "tokens", "elapsed", "windows_per_second", "tokens_per_second",
+    "latency_mean", "latency_p50", "latency_p95", "latency_max", "stalls",
+])
+
+def _stopped(stop):
+    return stop is not None and stop.is_set()
+
+# Sources: generators of text lines (without the line break)
+
+def stream_lines(stream, stop=None):
+    # File-like objects: regular files, named pipes, stdin
+    for line in stream:
+        if _stopped(stop):
+            return
+        yield line.rstrip("\r\n")
+
+def tail_lines(path, stop=None, from_start=False, interval=TAIL_INTERVAL):
+    # Like tail -f: waits for new lines until stop is set
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        partial = ""
+        while not _stopped(stop):
+            chunk = f.readline()
+            if not chunk:
+                time.sleep(interval)
+                continue
+            partial += chunk
+            if partial.endswith("\n"):
+                yield partial.rstrip("\r\n")
+                partial = ""
+
+def _socket_chunks(conn, stop):
+    conn.settimeout(IDLE_TIMEOUT)
+    while not _stopped(stop):
+        try:
+            data = conn.recv(RECV_SIZE)
+        except socket.timeout:
+            continue
+        if not data:
+            return
+        yield data
+
+def _connection_lines(conn, stop):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    partial = ""
+    with conn:
+        for data in _socket_chunks(conn, stop):
+            lines = (partial + decoder.decode(data)).split("\n")
+            partial = lines.pop()
+            for line in lines:
+                yield line.rstrip("\r")
+    partial += decoder.decode(b"", final=True)
+    if partial and not _stopped(stop):
+        yield partial.rstrip("\r")
+
+def _address(family, address):
+    if family == socket.AF_UNIX:
+        return address
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+def socket_lines(address, stop=None, listen=False, family=socket.AF_INET):
+    # address is "HOST:PORT" (or a path with family=AF_UNIX). listen=True serves one
+    # connection at a time until stop is set, otherwise the stream ends with the connection.
+    address = _address(family, address)
+    if not listen:
+        conn = socket.socket(family, socket.SOCK_STREAM)
+        conn.connect(address)
+        yield from _connection_lines(conn, stop)
+        return
+    server = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        if family != socket.AF_UNIX:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(address)
+        server.listen(1)
+        server.settimeout(IDLE_TIMEOUT)
+        while not _stopped(stop):
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            yield from _connection_lines(conn, stop)
+    finally:
+        server.close()
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+
+def open_source(spec, stop=None):
+    # Lines of the source described by spec (see the top of this module)
+    kind, _, rest = spec.partition(":")
+    if spec == "-":
+        return stream_lines(io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace"), stop)
+    if kind == "tail":
+        return tail_lines(rest, stop)
+    if kind in ("tcp", "listen"):
+        return socket_lines(rest, stop, listen=kind == "listen")
+    if kind in ("unix", "unix-listen") and hasattr(socket, "AF_UNIX"):
+        return socket_lines(rest, stop, listen=kind == "unix-listen", family=socket.AF_UNIX)
+
+    def file_lines():
+        # Named pipes block on open() until a writer connects
+        with open(spec, "r", encoding="utf-8", errors="replace") as f:
+            yield from stream_lines(f, stop)
+    return file_lines()
+
+# Pipeline stages
+
+def tokenize(lines):
+    # (tokens, arrival time) per non-empty line
+    for line in lines:
+        tokens = tuple(token.text for token in lex(line))
+        if tokens:
+            yield tokens, time.perf_counter()
+
+def windows(token_lines, size=0, step=None):
+    # size=0: every line is one window (one expression per line). Otherwise a window of
+    # size tokens every step tokens (step defaults to size: no overlap), across lines.
+    index = 0
+    if not size:
+        for tokens, arrival in token_lines:
+            yield Window(index, tokens, " ".join(tokens), arrival)
+            index += 1
+        return
+    step = step or size
+    buffer = deque()
+    skip = 0  # Tokens ainda a descartar quando step > size
+    for tokens, arrival in token_lines:
+        buffer.extend(tokens)
+        while True:
+            while skip and buffer:
+                buffer.popleft()
+                skip -= 1
+            if len(buffer) < size:
+                break
+            window = tuple(buffer[i] for i in range(size))
+            yield Window(index, window, " ".join(window), arrival)
+            index += 1
+            skip = step
+
+def decode_windows(items, context=None, search=False):
+    # A fresh context per window unless one is given (then shared, as in a signal)
+    for window in items:
+        record = decode_expression(window.expression, SymbolContext() if context is None else context, search)
+        yield window, record
+
+_END = object()
+
+class StreamPipeline:
+    def __init__(self, lines, size=0, step=None, queue_size=QUEUE_SIZE, context=None, search=False):
+        # lines is a source generator, or a spec string for open_source()
+        self._stop = threading.Event()
+        self.lines = open_source(lines, self._stop) if isinstance(lines, str) else lines
+        self.size = size
+        self.step = step
+        self.context = context
+        self.search = search
+        self._windows = queue.Queue(queue_size)
+        self._results = queue.Queue(queue_size)
+        self._threads = []
+        self.error = None
+        # Contadores: cada um tem um único thread escritor
+        self.tokens = 0
+        self.windows = 0
+        self.stalls = 0  # Vezes que o leitor encontrou a fila cheia
+        self.started = None
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self):
+        if self._threads:
+            return self
+        ensure_loaded()
+        self.started = time.perf_counter()
+        for target in (self._read, self._decode):
+            thread = threading.Thread(target=target, name=f"alien-symbolic-stream-{target.__name__[1:]}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def _put(self, q, item):
+        # Bloqueia enquanto a fila estiver cheia (backpressure), mas respeita stop()
+        try:
+            q.put_nowait(item)
+            return True
+        except queue.Full:
+            if q is self._windows:
+                self.stalls += 1
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=IDLE_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, q):
+        while True:
+            try:
+                return q.get(timeout=IDLE_TIMEOUT)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return _END
+
+    def _counted(self, token_lines):
+        for tokens, arrival in token_lines:
+            self.tokens += len(tokens)
+            yield tokens, arrival
+
+    def _read(self):
+        try:
+            for window in windows(self._counted(tokenize(self.lines)), self.size, self.step):
+                if not self._put(self._windows, window):
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            close = getattr(self.lines, "close", None)
+            if close is not None:
+                close()
+            self._put(self._windows, _END)
+
+    def _queued_windows(self):
+        while True:
+            window = self._get(self._windows)
+            if window is _END:
+                return
+            yield window
+
+    def _decode(self):
+        try:
+            for item in decode_windows(self._queued_windows(), self.context, self.search):
+                if not self._put(self._results, item):
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            self._put(self._results, _END)
+
+    def results(self, should_stop=None):
+        # Yields StreamResult in window order until the source ends or stop() is called.
+        # should_stop() is checked while waiting, so a caller can stop an idle stream.
+        self.start()
+        try:
+            while True:
+                try:
+                    item = self._results.get(timeout=IDLE_TIMEOUT)
+                except queue.Empty:
+                    if should_stop is not None and should_stop():
+                        return
+                    if self._stop.is_set() and not any(t.is_alive() for t in self._threads):
+                        return
+                    continue
+                if item is _END:
+                    break
+                window, record = item
+                latency = time.perf_counter() - window.ready
+                self.windows += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                self._latencies.append(latency)
+                yield StreamResult(window, record, latency)
+                if should_stop is not None and should_stop():
+                    return
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.stop()
+
+    def run(self, sink, should_stop=None):
+        # Headless: calls sink(result) for every window; returns the final stats
+        for result in self.results(should_stop):
+            sink(result)
+        return self.stats()
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.started if self.started is not None else 0.0
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+        return StreamStats(
+            self.windows,
+            self.tokens,
+            elapsed,
+            self.windows / elapsed if elapsed else 0.0,
+            self.tokens / elapsed if elapsed else 0.0,
+            self._latency_total / self.windows if self.windows else 0.0,
+            percentile(0.5),
+            percentile(0.95),
+            self._latency_max,
+            self.stalls,
+        )
+
+def format_stats(stats):
+    return (
+        f"{stats.windows} windows, {stats.tokens} tokens in {stats.elapsed:.1f}s "
+        f"({stats.windows_per_second:.1f} windows/s, {stats.tokens_per_second:.1f} tokens/s); "
+        f"latency mean {stats.latency_mean * 1000:.2f} ms, p50 {stats.latency_p50 * 1000:.2f} ms, "
+        f"p95 {stats.latency_p95 * 1000:.2f} ms, max {stats.latency_max * 1000:.2f} ms; "
+        f"{stats.stalls} backpressure stalls"
+    )
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m alien_symbolic.stream",
+        description="Decode a live symbol stream in windows and write JSON Lines to stdout.",
+    )
+    parser.add_argument("source", help="'-' (stdin), tail:PATH, tcp:HOST:PORT, listen:HOST:PORT, unix:PATH, unix-listen:PATH, or a file / named pipe")
+    parser.add_argument("--window", type=int, default=0, help="tokens per window (default 0: one expression per line)")
+    parser.add_argument("--step", type=int, help="tokens between window starts (default: the window size)")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE, help="windows buffered between stages before the reader waits")
+    parser.add_argument("--seed", type=int, help="seed for reproducible output of the random symbols")
+    parser.add_argument("--search", action="store_true", help="also list every phenomenon related to each window")
+    parser.add_argument("--stats-every", type=float, default=0, metavar="SECONDS", help="also report throughput and latency to stderr every SECONDS")
+    parser.add_argument("--metrics", metavar="PATH", help="profile symbols and write metrics to PATH (JSON for *.json, Prometheus text otherwise) at every report and on exit")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.seed is not None:
+        use_random(random.Random(args.seed))
+    if args.metrics:
+        enable_profiling()
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n", write_through=True)
+    pipeline = StreamPipeline(args.source, args.window, args.step, args.queue_size, search=args.search)
+    last_report = time.perf_counter()
+
+    def sink(result):
+        nonlocal last_report
+        record = {"window": result.window.index}
+        record.update(result.record)
+        record["latency_ms"] = round(result.latency * 1000, 3)
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if args.stats_every and time.perf_counter() - last_report >= args.stats_every:
+            last_report = time.perf_counter()
+            print(format_stats(pipeline.stats()), file=sys.stderr)
+            if args.metrics:
+                write_metrics(args.metrics)
+
+    try:
+        pipeline.run(sink)
+    except BrokenPipeError:
+        sys.stderr.close()
+        return 1
+    except KeyboardInterrupt:
+        pipeline.stop()
+    finally:
+        try:
+            out.detach()
+        except Exception:
+            pass
+    print(format_stats(pipeline.stats()), file=sys.stderr)
+    if args.metrics:
+        write_metrics(args.metrics)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
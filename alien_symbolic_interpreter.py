@@ -1,123 +1,134 @@
 # Alien Symbolic Interpreter (Prototype v12 - GUI Version with Enhanced Output and Mandala)
 # Each symbol maps to a concept or function with simulated behavior
+# The interpreter engine lives in the headless alien_symbolic package; tkinter is only
+# imported when the GUI is actually constructed. Evaluations run on a background
+# thread (alien_symbolic.jobs) and their output is polled into the tabs with root.after,
+# so long signals never freeze the window. Output goes through OutputBuffer, which
+# batches inserts per frame and caps how many lines each tab keeps; every run is also
+# appended to the session log (alien_symbolic.session), which Export Output reads.
 
-import random
-import tkinter as tk
-from tkinter import ttk, scrolledtext, filedialog
 from datetime import datetime
-import math
-import json
-import os
-
-# Symbol-function mapping (with simulated behaviors)
-symbols = {
-    "●": lambda ctx: ctx.update({"●": "Universe Initialized (Big Bang Triggered)"}),
-    "◐": lambda ctx: ctx.update({"◐": "Duality Formed (Half-State Observed)"}),
-    "∴": lambda ctx: ctx.update({"∴": [f"State {i}: Energy Level {random.randint(1, 100)}" for i in range(max(2, random.randint(2, 5)))]}),
-    "✧": lambda ctx: ctx.update({"✧": f"State Collapsed to {random.choice(ctx.get('∴', ['Unknown State']))}"}),
-    "Ψ": lambda ctx: ctx.update({"Ψ": "Quantum Potential Activated"}),
-    "∅": lambda ctx: ctx.update({"∅": "Void State (No Energy)"}),
-    "꩜": lambda ctx: ctx.update({"꩜": "Dimensional Fold Opened (Spacetime Warped)"}),
-    "⧗": lambda ctx: ctx.update({"⧗": f"Entangled Pair Linked: {ctx.get('∴', ['Unknown State 1', 'Unknown State 2'])[0]} ↔ {ctx.get('∴', ['Unknown State 1', 'Unknown State 2'])[1]}" if len(ctx.get('∴', ['Unknown State 1', 'Unknown State 2'])) >= 2 else "Entangled Pair Not Formed (Insufficient States)"}),
-    "⇌": lambda ctx: ctx.update({"⇌": "Oscillation Active (Energy Fluctuating)"}),
-    "⬠": lambda ctx: ctx.update({"⬠": f"Network Transmission: {ctx.get('⧗', 'No Entanglement')}"}),
-    "⇧": lambda ctx: ctx.update({"⇧": "Expanding (Universe Growing)"}),
-    "Ω": lambda ctx: ctx.update({"Ω": f"Reality Formed: {ctx.get('✧', 'No Collapse Observed')}"}),
-    "⇀": lambda ctx: ctx.update({"⇀": "Subtle Motion (Neutrino-Like Movement)"}),
-    "ϕ": lambda ctx: ctx.update({"ϕ": "Spiral Growth (Galactic Formation)"}),
-    "∞": lambda ctx: ctx.update({"∞": "Infinite Potential (Unbounded Energy)"}),
-}
-
-# Phenomena symbolic dictionary
-phenomena = {
-    "Quantum Superposition": ("∴ + ◐ = Ψ", "Multiple possibilities coexist in a partial state until forming a quantum state."),
-    "Wave Function Collapse": ("Ψ × ✧ = Ω", "A quantum state collapses through observation, generating reality."),
-    "Quantum Entanglement": ("(∴ ∞ ∴) = ⧗", "Possibilities united infinitely form a mirrored system."),
-    "Quantum Tunneling": ("Ψ + ∅ → ꩜", "Potential crosses the void, creating a dimensional transition."),
-    "Wormhole": ("☍ + ✦⇌✦ = ꩜", "Reflected oppositions connect through a fold in spacetime."),
-    "Singularity (Black Hole)": ("● × ∅ = ꩜", "Totality collapses into nothingness, generating a dimensional fold."),
-    "Hawking Radiation": ("꩜ ⇌ (✧ + ∅)", "The fold oscillates between collapse and void, releasing energy."),
-    "Cosmic Inflation": ("∅ + ϕ = ⇧ × ∞", "From the void, growth drives expansion into infinity."),
-    "Black Hole Collision": ("( ꩜ + ꩜ ) → ⬠ ⇌ ⇧", "Two folds merge, vibrating in a network and expanding."),
-    "Holographic Principle": ("● ⇌ ⬠ = Ω", "Totality is reflected in a network, forming reality."),
-    "Casimir Effect": ("∅ × (◐ + ◐) = ⇂", "The void between nearby dualities generates compression."),
-    "Galaxy Formation": ("ϕ × ⬠ = ✧ × ⇧", "Growth in a network collapses locally and expands globally."),
-    "Neutrinos": ("∴ ⇌ ∞ = ⇀", "Possibilities oscillate infinitely, moving subtly."),
-    "Big Bang": ("∅ → ● × ꩜", "From nothing, a totality folds into itself."),
-    "Unification of Forces": ("(▲ + ⬠ + ⇧ + ✧) = ●", "Force, network, expansion, and collapse converge into unity."),
-    "Exotic Matter": ("∅ ⇌ ⇂ = ꩜", "The void under inverted compression folds space."),
-    "Quantum Decoherence": ("Ψ × ⬠ = Ω + ∅", "A quantum state interacts with a network, collapsing and dissipating."),
-    "Strings (String Theory)": ("∞ ⇌ ⇧ = ⧗ × ϕ", "Infinite vibrations in expansion form spiraling systems."),
-    "Event Horizon": ("● ⇌ ꩜ = ◐", "Totality splits at a fold, hiding half."),
-    "Inflaton Field Fluctuations": ("∅ × ϕ ⇌ ⇧ = ∴", "The void in a spiral oscillates with expansion, generating possibilities."),
-    "Information Paradox": ("(● + ✧) ⇌ ꩜ = ⬠", "Totality and collapse enter a fold, emerging as a network."),
-    "Unruh Effect": ("⇀ × ∅ = ✧", "Motion in the void manifests perceived collapses."),
-    "Universe Topology": ("● ⇌ ꩜ × ϕ = ∞", "Totality folds and grows in a spiral, extending infinitely."),
-}
-
-# Symbolic signal definitions
-signals = {
-    "FRB 121102": ["∴", "∞ ⇌ ⇧ = ⧗ × ϕ"],
-    "Wow!": ["● ⇌ ✧"],
-    "BLC1": ["◐ ⇌ ⬠"],
-    "GRB": ["✧ × ꩜"]
-}
-
-# Symbolic parser with context and conditionals
-def interpret(expression, context):
-    # Processar símbolos individualmente primeiro
-    tokens = expression.replace("=", " = ").replace("→", " → ").split()
-    output = []
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        if token in symbols:
-            symbols[token](context)
-            output.append(f"{token}: {context.get(token)}")
-        elif token == "→":
-            # Realizar a transição
-            if i > 0 and i < len(tokens) - 1:
-                origin = " ".join(tokens[:i]).strip()
-                target = " ".join(tokens[i+1:]).strip()
-                # Interpretar os símbolos da origem e do destino
-                origin_tokens = origin.split()
-                target_tokens = target.split()
-                origin_output = []
-                target_output = []
-                for ot in origin_tokens:
-                    if ot in symbols:
-                        symbols[ot](context)
-                        origin_output.append(f"{ot}: {context.get(ot)}")
-                    else:
-                        origin_output.append(ot)
-                for tt in target_tokens:
-                    if tt in symbols:
-                        symbols[tt](context)
-                        target_output.append(f"{tt}: {context.get(tt)}")
-                    else:
-                        target_output.append(tt)
-                # Realizar a transição
-                context[target] = context.get(origin, None)
-                output.append(f"Transition: {' '.join(origin_output)} → {' '.join(target_output)} => {context.get(target)}")
-            i += 1
-        elif token == "=":
-            output.append("=")
-        else:
-            output.append(token)
-        i += 1
-    return " ".join(output)
+import argparse
+
+from alien_symbolic.context import SymbolContext
+from alien_symbolic.catalog_cache import warm_start
+from alien_symbolic.core import (
+    symbols,
+    phenomena,
+    signals,
+    check_phenomenon,
+    ensure_loaded,
+    interpret,
+    mandala_layout,
+)
+from alien_symbolic.favorites import FavoritesStore, parse_label, resolve
+from alien_symbolic.incremental import IncrementalEvaluator
+from alien_symbolic.history import PAGE_SIZE as HISTORY_PAGE_SIZE, HistoryStore
+from alien_symbolic.jobs import JobRunner
+from alien_symbolic.metrics import current_profiler, disable_profiling, enable_profiling, format_summary, span, write_metrics
+from alien_symbolic.packs import discover_packs, register_pack, symbol_names
+from alien_symbolic.paths import set_data_dir
+from alien_symbolic.session import SEPARATOR, SessionLog, format_for_path, record_lines, run_header
+from alien_symbolic.stream import StreamPipeline, format_stats
+
+# Intervalo de polling dos jobs e limite de blocos inseridos por rodada
+POLL_INTERVAL_MS = 50
+MAX_ITEMS_PER_POLL = 50
+
+# Intervalo entre as linhas de estatística de um stream ao vivo
+STREAM_STATS_INTERVAL = 5.0
+
+# Botões de símbolo por página da grade (5 por linha)
+SYMBOLS_PER_PAGE = 25
+# Live preview of the expression being built: characters shown and phenomenon hints
+PREVIEW_CHARS = 300
+HINTS_SHOWN = 3
+# Stats tab refresh while profiling is on
+STATS_REFRESH_MS = 1000
+
+# Saída das abas: inserções agrupadas por frame e número de linhas visíveis limitado
+FLUSH_INTERVAL_MS = 16
+MAX_VISIBLE_LINES = 2000
+
+tk = ttk = scrolledtext = filedialog = None
+
+def _load_tkinter():
+    # Importação tardia do tkinter: só a GUI precisa dele
+    global tk, ttk, scrolledtext, filedialog
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, scrolledtext as _scrolledtext, filedialog as _filedialog
+        tk, ttk, scrolledtext, filedialog = tkinter, _ttk, _scrolledtext, _filedialog
+
+class OutputBuffer:
+    # Front end for one output tab. write() only queues text; one flush per frame inserts
+    # everything queued with a single widget.insert call. The widget keeps the last
+    # max_lines lines; the complete output of each run is in the session log.
+    def __init__(self, root, widget, max_lines=MAX_VISIBLE_LINES):
+        self.root = root
+        self.widget = widget
+        self.max_lines = max_lines
+        self.pending = []
+        self.scheduled = None
+
+    def write(self, text, tag=None):
+        self.pending.append((text, tag))
+        if self.scheduled is None:
+            self.scheduled = self.root.after(FLUSH_INTERVAL_MS, self.flush)
+
+    def write_lines(self, lines):
+        for text, tag in lines:
+            self.write(text, tag)
+
+    def cancel_flush(self):
+        if self.scheduled is not None:
+            self.root.after_cancel(self.scheduled)
+            self.scheduled = None
+
+    def flush(self):
+        self.cancel_flush()
+        if not self.pending:
+            return
+        args = []
+        for text, tag in self.pending:
+            args += (text, tag or "")
+        self.widget.insert(tk.END, *args)
+        self.pending = []
+        self.trim()
+
+    def trim(self):
+        # Descarta as linhas mais antigas do widget
+        lines = int(self.widget.index("end-1c").split(".")[0])
+        excess = lines - self.max_lines
+        if excess > 0:
+            self.widget.delete("1.0", f"{excess + 1}.0")
+
+    def clear(self):
+        self.cancel_flush()
+        self.pending = []
+        self.widget.delete("1.0", tk.END)
 
 # GUI Application
 class AlienSymbolicInterpreterGUI:
-    def __init__(self, root):
+    def __init__(self, root, max_visible_lines=MAX_VISIBLE_LINES, session_path=None, history_path=None, favorites_path=None):
+        _load_tkinter()
         self.root = root
         self.root.title("👽 Alien Symbolic Interpreter (Prototype v12)")
-        self.context = {}  # Initialize context for symbolic operations
+        self.context = SymbolContext()  # Initialize context for symbolic operations
         self.current_expression = []  # Store the current expression being built
-        self.expression_history = []  # Store history of interpreted expressions
-        self.favorites = {"phenomena": [], "signals": []}  # Store favorite phenomena and signals
-        self.load_favorites()  # Load favorites from file
+        self.builder = IncrementalEvaluator()  # Evaluates current_expression as it is built
+        self.builder_error = None  # Set when the live preview failed
+        self.history = HistoryStore(history_path)  # Persistent history of interpreted expressions
+        self.history_page = 0  # Página do histórico mostrada no dropdown
+        self.favorites = FavoritesStore(favorites_path)  # Favorite phenomena and signals, saved on every change
         self.dark_mode = True  # Fixar dark mode como único
+        self.jobs = JobRunner()  # Background evaluation, one job at a time
+        self.stream_jobs = JobRunner()  # Live streams, so they do not hold up other evaluations
+        self.active_jobs = []  # (job, output buffer) pairs still being polled
+        self.polling = False
+        self.session = SessionLog(session_path)  # Append-only log of every run
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        ensure_loaded()  # Symbol packs, before the grid and dropdowns are filled
 
         # Set window size
         self.root.geometry("1290x660")
@@ -142,49 +153,64 @@ class AlienSymbolicInterpreterGUI:
         self.output_notebook.add(self.expressions_tab, text="Expressions")
         self.expressions_output = scrolledtext.ScrolledText(self.expressions_tab, width=40, height=20, wrap=tk.WORD, font=("Arial", 12))
         self.expressions_output.grid(row=0, column=0, pady=5)
+        self.expressions_buffer = OutputBuffer(self.root, self.expressions_output, max_visible_lines)
         self.expressions_output.tag_configure("equation", foreground="lightblue")
         self.expressions_output.tag_configure("error", foreground="red")
         self.expressions_output.tag_configure("separator", foreground="gray")
         self.expressions_output.tag_configure("result", foreground="lightblue")
         self.expressions_output.tag_configure("phenomenon", font=("Arial", 12, "bold"))
-        self.expressions_output.insert(tk.END, "Expression results will appear here.\n\n")
+        self.expressions_buffer.write("Expression results will appear here.\n\n")
 
         # Signals Tab
         self.signals_tab = ttk.Frame(self.output_notebook)
         self.output_notebook.add(self.signals_tab, text="Signals")
         self.signals_output = scrolledtext.ScrolledText(self.signals_tab, width=40, height=20, wrap=tk.WORD, font=("Arial", 12))
         self.signals_output.grid(row=0, column=0, pady=5)
+        self.signals_buffer = OutputBuffer(self.root, self.signals_output, max_visible_lines)
         self.signals_output.tag_configure("equation", foreground="lightblue")
         self.signals_output.tag_configure("error", foreground="red")
         self.signals_output.tag_configure("separator", foreground="gray")
         self.signals_output.tag_configure("result", foreground="lightblue")
         self.signals_output.tag_configure("phenomenon", font=("Arial", 12, "bold"))
-        self.signals_output.insert(tk.END, "Signal simulation results will appear here.\n\n")
+        self.signals_buffer.write("Signal simulation results will appear here.\n\n")
 
         # Phenomena Tab
         self.phenomena_tab = ttk.Frame(self.output_notebook)
         self.output_notebook.add(self.phenomena_tab, text="Phenomena")
         self.phenomena_output = scrolledtext.ScrolledText(self.phenomena_tab, width=40, height=20, wrap=tk.WORD, font=("Arial", 12))
         self.phenomena_output.grid(row=0, column=0, pady=5)
+        self.phenomena_buffer = OutputBuffer(self.root, self.phenomena_output, max_visible_lines)
         self.phenomena_output.tag_configure("equation", foreground="lightblue")
         self.phenomena_output.tag_configure("error", foreground="red")
         self.phenomena_output.tag_configure("separator", foreground="gray")
         self.phenomena_output.tag_configure("phenomenon", font=("Arial", 12, "bold"))
         self.phenomena_output.tag_configure("result", foreground="lightblue")
-        self.phenomena_output.insert(tk.END, "Phenomena explanations will appear here.\n\n")
+        self.phenomena_buffer.write("Phenomena explanations will appear here.\n\n")
 
         # Favorites Tab
         self.favorites_tab = ttk.Frame(self.output_notebook)
         self.output_notebook.add(self.favorites_tab, text="Favorites")
         self.favorites_output = scrolledtext.ScrolledText(self.favorites_tab, width=40, height=20, wrap=tk.WORD, font=("Arial", 12))
         self.favorites_output.grid(row=0, column=0, pady=5)
+        self.favorites_buffer = OutputBuffer(self.root, self.favorites_output, max_visible_lines)
         self.favorites_output.tag_configure("info", foreground="yellow")
         self.favorites_output.tag_configure("separator", foreground="gray")
         self.favorites_output.tag_configure("result", foreground="lightblue")
         self.favorites_output.tag_configure("phenomenon", font=("Arial", 12, "bold"))
-        self.favorites_output.insert(tk.END, "Your favorite phenomena and signals will appear here.\n")
-        self.favorites_output.insert(tk.END, "Double-click items in 'List Phenomena' or 'List Signals' to add/remove favorites.\n")
-        self.favorites_output.insert(tk.END, "Select a favorite from the dropdown and click 'Run Favorite' to execute.\n\n")
+        self.favorites_buffer.write("Your favorite phenomena and signals will appear here.\n")
+        self.favorites_buffer.write("Double-click items in 'List Phenomena' or 'List Signals' to add/remove favorites.\n")
+        self.favorites_buffer.write("Select a favorite from the dropdown and click 'Run Favorite' to execute.\n\n")
+
+        # Stats Tab: symbol and operation timings (alien_symbolic.metrics), off by default
+        self.stats_tab = ttk.Frame(self.output_notebook)
+        self.output_notebook.add(self.stats_tab, text="Stats")
+        self.profiling_var = tk.BooleanVar(value=current_profiler() is not None)
+        self.profiling_check = ttk.Checkbutton(self.stats_tab, text="Profile symbols", variable=self.profiling_var, command=self.toggle_profiling)
+        self.profiling_check.grid(row=0, column=0, pady=5, sticky=tk.W)
+        self.stats_output = scrolledtext.ScrolledText(self.stats_tab, width=40, height=18, wrap=tk.NONE, font=("Courier", 10))
+        self.stats_output.grid(row=1, column=0, pady=5)
+        self.stats_refresh = None
+        self.refresh_stats()
 
         # Output controls
         self.clear_output_button = ttk.Button(self.output_frame, text="Clear Output", command=self.clear_output, style="Custom.TButton")
@@ -192,29 +218,43 @@ class AlienSymbolicInterpreterGUI:
         self.export_output_button = ttk.Button(self.output_frame, text="Export Output", command=self.export_output, style="Custom.TButton")
         self.export_output_button.grid(row=0, column=1, pady=5, sticky=tk.E)
 
+        # Progress of background evaluations
+        self.status_var = tk.StringVar(value="Ready")
+        self.status_label = ttk.Label(self.output_frame, textvariable=self.status_var, font=("Arial", 11))
+        self.status_label.grid(row=2, column=0, pady=5, sticky=tk.W)
+        self.cancel_button = ttk.Button(self.output_frame, text="Cancel", command=self.cancel_jobs, style="Custom.TButton")
+        self.cancel_button.grid(row=2, column=1, pady=5, sticky=tk.E)
+
         # Center Column: Build Expression
         self.build_frame = ttk.Frame(self.main_frame)
         self.build_frame.grid(row=0, column=1, padx=10, pady=5, sticky=(tk.N))
         self.build_label = ttk.Label(self.build_frame, text="Build Your Expression:", font=("Arial", 12))
         self.build_label.grid(row=0, column=0, pady=5)
 
-        # Current expression display
-        self.expression_display = ttk.Label(self.build_frame, text="Current Expression: (empty)", font=("Arial", 14))
-        self.expression_display.grid(row=1, column=0, pady=5)
-
-        # Clickable symbols grid
+        # Current expression display, live preview and phenomenon hints
+        self.live_frame = ttk.Frame(self.build_frame)
+        self.live_frame.grid(row=1, column=0, pady=5)
+        self.expression_display = ttk.Label(self.live_frame, text="Current Expression: (empty)", font=("Arial", 14))
+        self.expression_display.grid(row=0, column=0)
+        self.preview_label = ttk.Label(self.live_frame, text="", font=("Arial", 10), wraplength=450)
+        self.preview_label.grid(row=1, column=0)
+        self.hints_label = ttk.Label(self.live_frame, text="", font=("Arial", 10), wraplength=450)
+        self.hints_label.grid(row=2, column=0)
+
+        # Clickable symbols grid, one page at a time (packs can add many symbols)
         self.symbols_frame = ttk.Frame(self.build_frame)
         self.symbols_frame.grid(row=2, column=0, pady=5)
         self.symbol_buttons = {}
-        row, col = 0, 0
-        for symbol in symbols.keys():
-            btn = ttk.Button(self.symbols_frame, text=symbol, width=5, command=lambda s=symbol: self.add_symbol(s), style="Custom.TButton")
-            btn.grid(row=row, column=col, padx=2, pady=2)
-            self.symbol_buttons[symbol] = btn
-            col += 1
-            if col > 4:  # 5 symbols per row
-                col = 0
-                row += 1
+        self.symbol_page = 0
+        self.symbol_pager = ttk.Frame(self.build_frame)
+        self.symbol_pager.grid(row=2, column=1, padx=2, sticky=(tk.N, tk.S))
+        self.symbol_prev_button = ttk.Button(self.symbol_pager, text="▲", width=2, command=lambda: self.show_symbol_page(self.symbol_page - 1), style="Custom.TButton")
+        self.symbol_prev_button.grid(row=0, column=0, pady=2)
+        self.symbol_page_label = ttk.Label(self.symbol_pager, text="", font=("Arial", 10))
+        self.symbol_page_label.grid(row=1, column=0, pady=2)
+        self.symbol_next_button = ttk.Button(self.symbol_pager, text="▼", width=2, command=lambda: self.show_symbol_page(self.symbol_page + 1), style="Custom.TButton")
+        self.symbol_next_button.grid(row=2, column=0, pady=2)
+        self.show_symbol_page(0)
 
         # Additional operators (including parentheses)
         self.operator_frame = ttk.Frame(self.build_frame)
@@ -225,7 +265,8 @@ class AlienSymbolicInterpreterGUI:
         ttk.Button(self.operator_frame, text="→", width=5, command=lambda: self.add_symbol("→"), style="Custom.TButton").grid(row=0, column=3, padx=2)
         ttk.Button(self.operator_frame, text="(", width=5, command=lambda: self.add_symbol("("), style="Custom.TButton").grid(row=0, column=4, padx=2)
         ttk.Button(self.operator_frame, text=")", width=5, command=lambda: self.add_symbol(")"), style="Custom.TButton").grid(row=0, column=5, padx=2)
-        ttk.Button(self.operator_frame, text="Clear", width=10, command=self.clear_expression, style="Custom.TButton").grid(row=0, column=6, padx=2)
+        ttk.Button(self.operator_frame, text="⌫", width=5, command=self.remove_symbol, style="Custom.TButton").grid(row=0, column=6, padx=2)
+        ttk.Button(self.operator_frame, text="Clear", width=10, command=self.clear_expression, style="Custom.TButton").grid(row=0, column=7, padx=2)
 
         # Interpret built expression
         self.interpret_build_button = ttk.Button(self.build_frame, text="Interpret Built Expression", command=self.interpret_built_expression, style="Custom.TButton")
@@ -249,6 +290,16 @@ class AlienSymbolicInterpreterGUI:
         self.explain_phenomenon_button = ttk.Button(self.build_frame, text="Explain Phenomenon", command=self.explain_phenomenon, style="Custom.TButton")
         self.explain_phenomenon_button.grid(row=10, column=0, pady=5)
 
+        # Live stream into the Signals tab: tail:PATH, tcp:HOST:PORT, listen:HOST:PORT, a named pipe...
+        self.stream_label = ttk.Label(self.build_frame, text="Stream Source:", font=("Arial", 12))
+        self.stream_label.grid(row=11, column=0, pady=5)
+        self.stream_var = tk.StringVar()
+        self.stream_entry = ttk.Entry(self.build_frame, textvariable=self.stream_var, width=27, font=("Arial", 12))
+        self.stream_entry.grid(row=12, column=0, pady=5)
+        self.stream_button = ttk.Button(self.build_frame, text="Start Stream", command=self.toggle_stream, style="Custom.TButton")
+        self.stream_button.grid(row=13, column=0, pady=5)
+        self.active_stream = None
+
         # Right Column: Controls
         self.controls_frame = ttk.Frame(self.main_frame)
         self.controls_frame.grid(row=0, column=2, padx=10, pady=5, sticky=(tk.N))
@@ -280,9 +331,18 @@ class AlienSymbolicInterpreterGUI:
         # Expression History
         self.history_label = ttk.Label(self.controls_frame, text="Expression History:", font=("Arial", 12))
         self.history_label.grid(row=8, column=0, pady=5)
+        self.history_frame = ttk.Frame(self.controls_frame)
+        self.history_frame.grid(row=9, column=0, pady=5)
+        # Search box filters the dropdown; ◀ ▶ page through older entries
+        self.history_search_var = tk.StringVar()
+        self.history_search_entry = ttk.Entry(self.history_frame, textvariable=self.history_search_var, width=19, font=("Arial", 12))
+        self.history_search_entry.grid(row=0, column=0, padx=2)
+        self.history_search_entry.bind("<KeyRelease>", lambda event: self.search_history())
+        ttk.Button(self.history_frame, text="◀", width=2, command=lambda: self.page_history(-1), style="Custom.TButton").grid(row=0, column=1)
+        ttk.Button(self.history_frame, text="▶", width=2, command=lambda: self.page_history(1), style="Custom.TButton").grid(row=0, column=2)
         self.history_var = tk.StringVar()
-        self.history_dropdown = ttk.Combobox(self.controls_frame, textvariable=self.history_var, values=["(No history yet)"], width=27, state="readonly", font=("Arial", 12))
-        self.history_dropdown.grid(row=9, column=0, pady=5)
+        self.history_dropdown = ttk.Combobox(self.history_frame, textvariable=self.history_var, values=["(No history yet)"], width=27, state="readonly", font=("Arial", 12))
+        self.history_dropdown.grid(row=1, column=0, columnspan=3, pady=5)
         self.history_button = ttk.Button(self.controls_frame, text="Run Selected", command=self.run_history_expression, style="Custom.TButton")
         self.history_button.grid(row=10, column=0, pady=5, sticky=(tk.W, tk.E))
         # Botão para limpar o histórico
@@ -303,6 +363,7 @@ class AlienSymbolicInterpreterGUI:
 
         # Populate the favorites list initially, after all widgets are created
         self.update_favorites_output()
+        self.update_history_dropdown()
 
     def configure_styles(self):
         # Forçar o tema "clam" para maior controle sobre os estilos
@@ -325,13 +386,64 @@ class AlienSymbolicInterpreterGUI:
         self.phenomena_output.configure(bg="#0f3460", fg="white", insertbackground="white")
         self.favorites_output.configure(bg="#0f3460", fg="white", insertbackground="white")
 
+    def show_symbol_page(self, page):
+        # Only the buttons of the visible page exist
+        names = symbol_names()
+        pages = max(1, -(-len(names) // SYMBOLS_PER_PAGE))
+        self.symbol_page = page = min(max(page, 0), pages - 1)
+        for btn in self.symbol_buttons.values():
+            btn.destroy()
+        self.symbol_buttons = {}
+        start = page * SYMBOLS_PER_PAGE
+        for i, symbol in enumerate(names[start:start + SYMBOLS_PER_PAGE]):
+            btn = ttk.Button(self.symbols_frame, text=symbol, width=5, command=lambda s=symbol: self.add_symbol(s), style="Custom.TButton")
+            btn.grid(row=i // 5, column=i % 5, padx=2, pady=2)  # 5 symbols per row
+            self.symbol_buttons[symbol] = btn
+        self.symbol_page_label.config(text=f"{page + 1}/{pages}")
+        if pages == 1:
+            self.symbol_pager.grid_remove()
+        else:
+            self.symbol_pager.grid()
+
     def add_symbol(self, symbol):
         self.current_expression.append(symbol)
-        self.update_expression_display()
+        self.update_builder()
+
+    def remove_symbol(self):
+        if self.current_expression:
+            self.current_expression.pop()
+            self.update_builder()
 
     def clear_expression(self):
         self.current_expression = []
+        self.update_builder()
+
+    def update_builder(self):
+        # Só os tokens novos (ou removidos) são avaliados; o prefixo já avaliado é mantido
+        try:
+            self.builder.set_tokens(self.current_expression)
+            self.builder_error = None
+        except Exception as e:
+            self.builder_error = str(e)
         self.update_expression_display()
+        self.update_preview()
+
+    def update_preview(self):
+        if self.builder_error is not None:
+            self.preview_label.config(text=f"Preview error: {self.builder_error}")
+            self.hints_label.config(text="")
+            return
+        preview = self.builder.output()
+        if len(preview) > PREVIEW_CHARS:
+            preview = preview[:PREVIEW_CHARS] + "…"
+        self.preview_label.config(text=preview)
+        pheno, _, completions = self.builder.hints(HINTS_SHOWN)
+        hints = []
+        if pheno:
+            hints.append(f"Matches: {pheno}")
+        if completions:
+            hints.append("Could become: " + ", ".join(f"{name} ({equation})" for name, equation in completions))
+        self.hints_label.config(text="\n".join(hints))
 
     def update_expression_display(self):
         if not self.current_expression:
@@ -343,95 +455,72 @@ class AlienSymbolicInterpreterGUI:
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def check_phenomenon(self, expression):
-        # Normalizar a expressão para comparação
-        normalized_expression = expression.replace(" ", "")
-        for pheno, (eq, meaning) in phenomena.items():
-            normalized_eq = eq.replace(" ", "")
-            if normalized_expression == normalized_eq:
-                return pheno, meaning
-        return None, None
+        return check_phenomenon(expression)
 
     def interpret_built_expression(self):
         if not self.current_expression:
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No expression to interpret)\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+            self.expressions_buffer.write(f"[{self.get_timestamp()}] >>> (No expression to interpret)\n", "error")
+            self.expressions_buffer.write("---\n", "separator")
             return
 
         expression = " ".join(self.current_expression)
-        self.context = {}  # Reset context for new interpretation
-        try:
-            result = interpret(expression, self.context)
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"{result}\n", "result")
-            # Check for matching phenomenon
-            pheno, meaning = self.check_phenomenon(expression)
-            if pheno:
-                self.expressions_output.insert(tk.END, f"Phenomenon Detected: {pheno}\n", "phenomenon")
-                self.expressions_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
-            # Add to history
-            if expression not in self.expression_history:
-                self.expression_history.append(expression)
-                self.history_dropdown["values"] = self.expression_history if self.expression_history else ["(No history yet)"]
-        except Exception as e:
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+        # Avaliação nova, como antes: a prévia só mostra uma amostra dos símbolos aleatórios
+        self.context = SymbolContext()  # Reset context for new interpretation
+        self.start_job(f"Expression: {expression}", self.expressions_buffer, self.expression_job, "expressions", expression, self.context, total=1)
 
     def interpret_expression(self):
         expression = self.expression_entry.get().strip()
         if not expression:
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No expression entered)\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+            self.expressions_buffer.write(f"[{self.get_timestamp()}] >>> (No expression entered)\n", "error")
+            self.expressions_buffer.write("---\n", "separator")
             return
 
-        self.context = {}  # Reset context for new interpretation
-        try:
-            result = interpret(expression, self.context)
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"{result}\n", "result")
-            # Check for matching phenomenon
-            pheno, meaning = self.check_phenomenon(expression)
-            if pheno:
-                self.expressions_output.insert(tk.END, f"Phenomenon Detected: {pheno}\n", "phenomenon")
-                self.expressions_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
-            # Add to history
-            if expression not in self.expression_history:
-                self.expression_history.append(expression)
-                self.history_dropdown["values"] = self.expression_history if self.expression_history else ["(No history yet)"]
-        except Exception as e:
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+        self.context = SymbolContext()  # Reset context for new interpretation
+        self.start_job(f"Expression: {expression}", self.expressions_buffer, self.expression_job, "expressions", expression, self.context, total=1)
+
+    def add_to_history(self, expression):
+        # Dedup por hash no banco; repetir a expressão só incrementa o uso
+        self.history.record(expression)
+        self.history_page = 0
+        self.update_history_dropdown()
+
+    def update_history_dropdown(self):
+        query = self.history_search_var.get().strip()
+        entries = self.history.search(query, HISTORY_PAGE_SIZE, self.history_page * HISTORY_PAGE_SIZE)
+        if entries:
+            self.history_dropdown["values"] = [entry.expression for entry in entries]
+        else:
+            self.history_dropdown["values"] = ["(No matches)"] if query else ["(No history yet)"]
+        return len(entries)
+
+    def search_history(self):
+        self.history_page = 0
+        self.update_history_dropdown()
+
+    def page_history(self, step):
+        page = self.history_page
+        self.history_page = max(0, page + step)
+        if self.history_page != page and not self.update_history_dropdown() and step > 0:
+            # Passou da última página: volta
+            self.history_page = page
+            self.update_history_dropdown()
 
     def clear_history(self):
-        self.expression_history = []
+        self.history.clear()
+        self.history_page = 0
+        self.history_search_var.set("")
         self.history_dropdown["values"] = ["(No history yet)"]
         self.history_var.set("(No history yet)")
 
     def run_history_expression(self):
         expression = self.history_var.get()
-        if not expression or expression == "(No history yet)":
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No history selected)\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+        if not expression or expression in ("(No history yet)", "(No matches)"):
+            self.expressions_buffer.write(f"[{self.get_timestamp()}] >>> (No history selected)\n", "error")
+            self.expressions_buffer.write("---\n", "separator")
             return
 
-        self.context = {}  # Reset context for new interpretation
-        try:
-            result = interpret(expression, self.context)
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"{result}\n", "result")
-            # Check for matching phenomenon
-            pheno, meaning = self.check_phenomenon(expression)
-            if pheno:
-                self.expressions_output.insert(tk.END, f"Phenomenon Detected: {pheno}\n", "phenomenon")
-                self.expressions_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
-        except Exception as e:
-            self.expressions_output.insert(tk.END, f"[{self.get_timestamp()}] >>> {expression}\n", "equation")
-            self.expressions_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-            self.expressions_output.insert(tk.END, "---\n", "separator")
+        self.context = SymbolContext()  # Reset context for new interpretation
+        self.start_job(f"Expression: {expression}", self.expressions_buffer, self.expression_job, "expressions", expression, self.context, total=1)
 
     def list_symbols(self):
         popup = tk.Toplevel(self.root)
@@ -445,10 +534,11 @@ class AlienSymbolicInterpreterGUI:
         tree.column("Symbol", width=100, anchor="center")
         tree.column("Meaning", width=550)
 
-        for symbol, func in symbols.items():
-            self.context = {}
-            func(self.context)
-            tree.insert("", tk.END, values=(symbol, self.context.get(symbol)), tags=("symbol",))
+        context = SymbolContext()  # Separate from self.context, which a job may be using
+        for symbol in symbol_names():
+            context.clear()
+            symbols[symbol](context)
+            tree.insert("", tk.END, values=(symbol, context.get(symbol)), tags=("symbol",))
         
         tree.tag_configure("symbol", foreground="black", font=("Arial", 12))
         tree.pack(expand=True, fill="both", padx=10, pady=10)
@@ -470,7 +560,7 @@ class AlienSymbolicInterpreterGUI:
         tree.column("Favorite", width=50)
 
         for name, (eq, meaning) in phenomena.items():
-            tree.insert("", tk.END, values=(name, eq, meaning, "Add" if name not in self.favorites["phenomena"] else "Remove"), tags=("phenomenon", name))
+            tree.insert("", tk.END, values=(name, eq, meaning, "Remove" if self.favorites.contains("phenomena", name) else "Add"), tags=("phenomenon", name))
         
         tree.tag_configure("phenomenon", foreground="black", font=("Arial", 12))
         tree.bind("<Double-1>", lambda event: self.toggle_favorite(event, "phenomena"))
@@ -489,7 +579,7 @@ class AlienSymbolicInterpreterGUI:
         tree.column("Favorite", width=50)
 
         for name in signals:
-            tree.insert("", tk.END, values=(name, "Add" if name not in self.favorites["signals"] else "Remove"), tags=("signal", name))
+            tree.insert("", tk.END, values=(name, "Remove" if self.favorites.contains("signals", name) else "Add"), tags=("signal", name))
             tree.tag_configure("signal", foreground="black", font=("Arial", 12))  # Cor preta e fonte maior
             tree.bind("<Double-1>", lambda event: self.toggle_favorite(event, "signals"))
             tree.pack(expand=True, fill="both", padx=10, pady=10)
@@ -500,45 +590,167 @@ class AlienSymbolicInterpreterGUI:
     def run_signal(self):
         signal = self.signal_var.get()
         if not signal:
-            self.signals_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No signal selected)\n", "error")
-            self.signals_output.insert(tk.END, "---\n", "separator")
+            self.signals_buffer.write(f"[{self.get_timestamp()}] >>> (No signal selected)\n", "error")
+            self.signals_buffer.write("---\n", "separator")
             return
 
-        self.context = {}  # Reset context for new signal
-        self.signals_output.insert(tk.END, f"[{self.get_timestamp()}] >>> Simulating Signal: {signal}\n")
-        for expr in signals[signal]:
-            try:
-                result = interpret(expr, self.context)
-                self.signals_output.insert(tk.END, f"Expression: {expr}\n", "equation")
-                self.signals_output.insert(tk.END, f"{result}\n", "result")
-                # Check for matching phenomenon
-                pheno, meaning = self.check_phenomenon(expr)
-                if pheno:
-                    self.signals_output.insert(tk.END, f"Phenomenon Detected: {pheno}\n", "phenomenon")
-                    self.signals_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-            except Exception as e:
-                self.signals_output.insert(tk.END, f"Expression: {expr}\n", "equation")
-                self.signals_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-        self.signals_output.insert(tk.END, "---\n", "separator")
+        self.context = SymbolContext()  # Reset context for new signal
+        self.start_job(f"Signal: {signal}", self.signals_buffer, self.signal_job, "signals", signal, self.context, total=len(signals[signal]))
 
     def explain_phenomenon(self):
         pheno = self.phenomenon_var.get()
         if not pheno:
-            self.phenomena_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No phenomenon selected)\n", "error")
-            self.phenomena_output.insert(tk.END, "---\n", "separator")
+            self.phenomena_buffer.write(f"[{self.get_timestamp()}] >>> (No phenomenon selected)\n", "error")
+            self.phenomena_buffer.write("---\n", "separator")
             return
 
-        eq, meaning = phenomena[pheno]
-        self.context = {}  # Reset context for new phenomenon
-        self.phenomena_output.insert(tk.END, f"[{self.get_timestamp()}] >>> Phenomenon: {pheno}\n", "phenomenon")
-        self.phenomena_output.insert(tk.END, f"Equation: {eq}\n", "equation")
+        self.context = SymbolContext()  # Reset context for new phenomenon
+        self.start_job(f"Phenomenon: {pheno}", self.phenomena_buffer, self.phenomenon_job, "phenomena", pheno, self.context, total=1)
+
+    # Background jobs: these generators run on the worker thread and never touch widgets.
+    # Each item is a list of (text, tag) lines inserted together, or a callable to run
+    # on the Tk thread; cancelling stops a job between items.
+    def evaluate(self, tab, run, kind, source, expression, context, step=None):
+        # Interpreta uma expressão e grava o registro no log da sessão. step is a resolved
+        # (plan, phenomenon, meaning) from alien_symbolic.favorites.resolve(), if any.
+        record = {"timestamp": self.get_timestamp(), "tab": tab, "run": run, "kind": kind, "source": source, "expression": expression}
         try:
-            result = interpret(eq, self.context)
-            self.phenomena_output.insert(tk.END, f"Interpretation: {result}\n", "result")
+            if step is None:
+                result = interpret(expression, context)
+                # Check for matching phenomenon
+                pheno, meaning = self.check_phenomenon(expression)
+            else:
+                plan, pheno, meaning = step
+                result = interpret(plan, context)
+            record["result"] = result
+            record["phenomenon"], record["meaning"] = pheno, meaning
         except Exception as e:
-            self.phenomena_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-        self.phenomena_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-        self.phenomena_output.insert(tk.END, "---\n", "separator")
+            record["error"] = str(e)
+            if step is not None and kind == "phenomenon":
+                record["meaning"] = step[2]
+        self.session.append(record)
+        return record
+
+    def expression_job(self, job, tab, expression, context):
+        record = self.evaluate(tab, self.session.new_run(), "expression", None, expression, context)
+        job.advance()
+        yield record_lines(record) + [SEPARATOR]
+        if "error" not in record:
+            yield lambda: self.add_to_history(expression)
+
+    def signal_job(self, job, tab, signal, context):
+        run = self.session.new_run()
+        # Planos compilados e fenômenos detectados ficam em cache entre execuções
+        payload = resolve("signal", signal)
+        with span("signal", signal=signal):
+            for index, step in enumerate(payload.steps):
+                record = self.evaluate(tab, run, "signal", signal, step[0].source, context, step)
+                job.advance()
+                yield (run_header(record) if index == 0 else []) + record_lines(record)
+        yield [SEPARATOR]
+
+    def phenomenon_job(self, job, tab, pheno, context):
+        step = resolve("phenomenon", pheno).steps[0]
+        record = self.evaluate(tab, self.session.new_run(), "phenomenon", pheno, step[0].source, context, step)
+        job.advance()
+        yield record_lines(record) + [SEPARATOR]
+
+    def stream_job(self, job, tab, source):
+        run = self.session.new_run()
+        pipeline = StreamPipeline(source)
+        last_stats = datetime.now()
+        try:
+            for result in pipeline.results(should_stop=lambda: job.cancelled):
+                record = {"timestamp": self.get_timestamp(), "tab": tab, "run": run, "kind": "stream", "source": source}
+                record.update(result.record)
+                self.session.append(record)
+                job.advance()
+                lines = (run_header(record) if job.done == 1 else []) + record_lines(record)
+                if (datetime.now() - last_stats).total_seconds() >= STREAM_STATS_INTERVAL:
+                    last_stats = datetime.now()
+                    lines.append((format_stats(pipeline.stats()) + "\n", "separator"))
+                yield lines
+        finally:
+            pipeline.stop()
+        # Parado pelo usuário: poll_jobs já escreve "(cancelled)" e o separador
+        yield [(format_stats(pipeline.stats()) + "\n", "separator")] + ([] if job.cancelled else [SEPARATOR])
+
+    def toggle_stream(self):
+        if self.active_stream is not None and not self.active_stream.finished:
+            self.active_stream.cancel()
+            return
+        source = self.stream_var.get().strip()
+        if not source:
+            self.signals_buffer.write(f"[{self.get_timestamp()}] >>> (No stream source)\n", "error")
+            self.signals_buffer.write("---\n", "separator")
+            return
+        self.output_notebook.select(self.signals_tab)
+        self.active_stream = self.start_job(f"Stream {source}", self.signals_buffer, self.stream_job, "signals", source, runner=self.stream_jobs)
+        self.stream_button.config(text="Stop Stream")
+
+    def start_job(self, name, output, function, *args, total=None, runner=None):
+        job = (runner or self.jobs).submit(name, function, *args, total=total)
+        self.active_jobs.append((job, output))
+        self.update_status()
+        if not self.polling:
+            self.polling = True
+            self.root.after(POLL_INTERVAL_MS, self.poll_jobs)
+        return job
+
+    def poll_jobs(self):
+        # Chamado pelo mainloop: move a saída dos jobs para as abas, em ordem de envio
+        budget = MAX_ITEMS_PER_POLL
+        remaining = []
+        for job, output in self.active_jobs:
+            items = job.drain(budget) if budget > 0 else []
+            budget -= len(items)
+            for item in items:
+                if callable(item):
+                    item()
+                    continue
+                output.write_lines(item)
+            if not job.finished or job.pending():
+                remaining.append((job, output))
+            elif job.error is not None:
+                output.write(f"Error: {str(job.error)}\n", "error")
+                output.write("---\n", "separator")
+            elif job.stopped:
+                output.write(f"({job.name} cancelled)\n", "error")
+                output.write("---\n", "separator")
+        self.active_jobs = remaining
+        if self.active_stream is not None and all(job is not self.active_stream for job, _ in remaining):
+            self.active_stream = None
+            self.stream_button.config(text="Start Stream")
+        self.update_status()
+        if remaining:
+            self.root.after(POLL_INTERVAL_MS, self.poll_jobs)
+        else:
+            self.polling = False
+
+    def update_status(self):
+        if not self.active_jobs:
+            self.status_var.set("Ready")
+            return
+        job = self.active_jobs[0][0]
+        status = f"{'Cancelling' if job.cancelled else 'Running'} {job.name} ({job.progress()})"
+        if len(self.active_jobs) > 1:
+            status += f", {len(self.active_jobs) - 1} queued"
+        self.status_var.set(status)
+
+    def cancel_jobs(self):
+        for job, _ in self.active_jobs:
+            job.cancel()
+        self.update_status()
+
+    def on_close(self):
+        if self.stats_refresh is not None:
+            self.root.after_cancel(self.stats_refresh)
+        self.jobs.shutdown()
+        self.stream_jobs.shutdown()
+        self.session.close()
+        self.history.close()
+        self.favorites.close()
+        self.root.destroy()
 
     def view_mandala(self):
         popup = tk.Toplevel(self.root)
@@ -549,43 +761,23 @@ class AlienSymbolicInterpreterGUI:
         canvas = tk.Canvas(popup, width=500, height=500, bg="#0f3460", highlightthickness=0)
         canvas.pack(expand=True, fill="both")
 
+        # Center of the mandala
+        center_x, center_y = 250, 250
+        layout = mandala_layout(size=500, radius=150)
+
         # Draw some stars in the background
-        for _ in range(50):
-            x = random.randint(0, 500)
-            y = random.randint(0, 500)
+        for x, y in layout.stars:
             canvas.create_oval(x, y, x+2, y+2, fill="white", outline="white")
 
-        # Center of the mandala
-        center_x, center_y = 250, 250
-        radius = 150
-
-        # Position symbols in a circle and store their coordinates
-        symbol_list = list(symbols.keys())
-        num_symbols = len(symbol_list)
-        symbol_coords = {}
-        for i, symbol in enumerate(symbol_list):
-            angle = 2 * math.pi * i / num_symbols
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
+        # Position symbols in a circle
+        for symbol, (x, y) in layout.symbol_coords.items():
             canvas.create_text(x, y, text=symbol, font=("Arial", 16), fill="lightblue", tags=("symbol", symbol))
-            symbol_coords[symbol] = (x, y)
 
         # Draw connections between symbols (yellow dashed lines)
-        connections = [
-            ("Ω", "⇧"),
-            ("∴", "⧗"),
-            ("Ψ", "✧"),
-            ("꩜", "⬠"),
-            ("⇌", "⇀"),
-            ("◐", "∅"),
-            ("●", "∞"),
-            ("ϕ", "⇧"),
-        ]
-        for sym1, sym2 in connections:
-            if sym1 in symbol_coords and sym2 in symbol_coords:
-                x1, y1 = symbol_coords[sym1]
-                x2, y2 = symbol_coords[sym2]
-                canvas.create_line(x1, y1, x2, y2, fill="yellow", dash=(4, 4))
+        for sym1, sym2 in layout.connections:
+            x1, y1 = layout.symbol_coords[sym1]
+            x2, y2 = layout.symbol_coords[sym2]
+            canvas.create_line(x1, y1, x2, y2, fill="yellow", dash=(4, 4))
 
         # Draw a small central circle
         canvas.create_oval(center_x - 10, center_y - 10, center_x + 10, center_y + 10, fill="#16213e", outline="white")
@@ -596,12 +788,18 @@ class AlienSymbolicInterpreterGUI:
             "1. Build an Expression:\n"
             "   - Use the symbol buttons to add symbols to your expression.\n"
             "   - Use operators (+, ×, =, →) and parentheses to structure your expression.\n"
-            "   - Click 'Interpret Built Expression' to see the result.\n\n"
+            "   - A live preview of the result and the phenomena the expression matches or\n"
+            "     could become are shown as you build; ⌫ removes the last token.\n"
+            "   - Click 'Interpret Built Expression' to evaluate it afresh and log the result.\n\n"
             "2. Enter an Expression Manually:\n"
             "   - Type your expression in the 'Enter Expression Manually' field.\n"
             "   - Click 'Interpret Manual' to see the result.\n\n"
             "3. Simulate a Signal:\n"
-            "   - Select a signal from the dropdown and click 'Run Signal'.\n\n"
+            "   - Select a signal from the dropdown and click 'Run Signal'.\n"
+            "   - Evaluations run in the background: the status line shows progress\n"
+            "     and 'Cancel' stops the running and queued evaluations.\n"
+            "   - To decode a live stream, enter a source (tail:PATH, tcp:HOST:PORT,\n"
+            "     listen:HOST:PORT or a named pipe) and click 'Start Stream'.\n\n"
             "4. Explain a Phenomenon:\n"
             "   - Select a phenomenon from the dropdown and click 'Explain Phenomenon'.\n\n"
             "5. View the Mandala:\n"
@@ -610,9 +808,14 @@ class AlienSymbolicInterpreterGUI:
             "   - Double-click items in 'List Phenomena' or 'List Signals' to add/remove favorites.\n"
             "   - Select a favorite from the dropdown and click 'Run Favorite'.\n\n"
             "7. Expression History:\n"
-            "   - Your interpreted expressions are stored in the history dropdown.\n"
+            "   - Your interpreted expressions are saved in the history dropdown, most recent first.\n"
+            "   - Type in the search box to filter the history; use ◀ ▶ to see older entries.\n"
             "   - Select an expression and click 'Run Selected' to re-run it.\n"
             "   - Click 'Clear History' to reset the history.\n\n"
+            "8. Stats:\n"
+            "   - Check 'Profile symbols' in the Stats tab to count symbol calls and time\n"
+            "     expressions, transitions and phenomenon lookups.\n"
+            "   - 'Export Output' on the Stats tab saves the metrics; 'Clear Output' resets them.\n\n"
             "Have fun exploring the cosmos! 🌌"
         )
         popup = tk.Toplevel(self.root)
@@ -623,135 +826,132 @@ class AlienSymbolicInterpreterGUI:
         text.insert(tk.END, tutorial_text)
         text.config(state="disabled")
 
+    def toggle_profiling(self):
+        if self.profiling_var.get():
+            enable_profiling()
+        else:
+            disable_profiling()
+        self.refresh_stats()
+
+    def refresh_stats(self):
+        # Redesenha a aba Stats; repete enquanto o profiling estiver ligado
+        self.stats_refresh = None
+        self.stats_output.config(state="normal")
+        self.stats_output.delete("1.0", tk.END)
+        if current_profiler() is None:
+            self.stats_output.insert(tk.END, "Profiling is off. Check 'Profile symbols' to count symbol calls and time\nexpressions, transitions and phenomenon lookups; 'Export Output' on this tab\nwrites the metrics (Prometheus text, or JSON for *.json).\n")
+        else:
+            self.stats_output.insert(tk.END, format_summary() + "\n")
+            self.stats_refresh = self.root.after(STATS_REFRESH_MS, self.refresh_stats)
+        self.stats_output.config(state="disabled")
+
     def clear_output(self):
         current_tab = self.output_notebook.index(self.output_notebook.select())
         if current_tab == 0:  # Expressions tab
-            self.expressions_output.delete(1.0, tk.END)
-            self.expressions_output.insert(tk.END, "Expression results will appear here.\n\n")
+            self.expressions_buffer.clear()
+            self.expressions_buffer.write("Expression results will appear here.\n\n")
         elif current_tab == 1:  # Signals tab
-            self.signals_output.delete(1.0, tk.END)
-            self.signals_output.insert(tk.END, "Signal simulation results will appear here.\n\n")
+            self.signals_buffer.clear()
+            self.signals_buffer.write("Signal simulation results will appear here.\n\n")
         elif current_tab == 2:  # Phenomena tab
-            self.phenomena_output.delete(1.0, tk.END)
-            self.phenomena_output.insert(tk.END, "Phenomena explanations will appear here.\n\n")
+            self.phenomena_buffer.clear()
+            self.phenomena_buffer.write("Phenomena explanations will appear here.\n\n")
         elif current_tab == 3:  # Favorites tab
-            self.favorites_output.delete(1.0, tk.END)
-            self.favorites_output.insert(tk.END, "Your favorite phenomena and signals will appear here.\n")
-            self.favorites_output.insert(tk.END, "Double-click items in 'List Phenomena' or 'List Signals' to add/remove favorites.\n")
-            self.favorites_output.insert(tk.END, "Select a favorite from the dropdown and click 'Run Favorite' to execute.\n\n")
+            self.favorites_buffer.clear()
+            self.favorites_buffer.write("Your favorite phenomena and signals will appear here.\n")
+            self.favorites_buffer.write("Double-click items in 'List Phenomena' or 'List Signals' to add/remove favorites.\n")
+            self.favorites_buffer.write("Select a favorite from the dropdown and click 'Run Favorite' to execute.\n\n")
             self.update_favorites_output()
+        elif current_tab == 4:  # Stats tab
+            profiler = current_profiler()
+            if profiler is not None:
+                profiler.reset()
+            self.refresh_stats()
 
     def export_output(self):
+        # Exporta do log da sessão, não do widget: inclui o que já foi limpo da aba
         current_tab = self.output_notebook.index(self.output_notebook.select())
-        if current_tab == 0:
-            content = self.expressions_output.get(1.0, tk.END).strip()
-        elif current_tab == 1:
-            content = self.signals_output.get(1.0, tk.END).strip()
-        elif current_tab == 2:
-            content = self.phenomena_output.get(1.0, tk.END).strip()
-        elif current_tab == 3:
-            content = self.favorites_output.get(1.0, tk.END).strip()
-        else:
+        if current_tab == 4:
+            self.export_metrics()
+            return
+        tabs = ["expressions", "signals", "phenomena", "favorites"]
+        if not 0 <= current_tab < len(tabs):
             return
 
-        file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("JSON Lines", "*.jsonl"), ("CSV files", "*.csv"), ("All files", "*.*")])
         if file_path:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-    def load_favorites(self):
-        if os.path.exists("favorites.json"):
-            with open("favorites.json", "r") as f:
-                self.favorites = json.load(f)
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
+                self.session.export(f, format_for_path(file_path), tabs[current_tab])
 
-    def save_favorites(self):
-        with open("favorites.json", "w") as f:
-            json.dump(self.favorites, f)
+    def export_metrics(self):
+        if current_profiler() is None:
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".prom", filetypes=[("Prometheus text", "*.prom"), ("JSON snapshot", "*.json"), ("All files", "*.*")])
+        if file_path:
+            write_metrics(file_path)
 
     def update_favorites_output(self):
-        self.favorites_output.insert(tk.END, "\nFavorites List:\n", "info")
-        if not self.favorites["phenomena"] and not self.favorites["signals"]:
-            self.favorites_output.insert(tk.END, "(No favorites yet)\n", "info")
+        favorites = self.favorites.to_dict()
+        self.favorites_buffer.write("\nFavorites List:\n", "info")
+        if not favorites["phenomena"] and not favorites["signals"]:
+            self.favorites_buffer.write("(No favorites yet)\n", "info")
         else:
-            if self.favorites["phenomena"]:
-                self.favorites_output.insert(tk.END, "Phenomena:\n", "info")
-                for pheno in self.favorites["phenomena"]:
-                    self.favorites_output.insert(tk.END, f"- {pheno}\n", "result")
-            if self.favorites["signals"]:
-                self.favorites_output.insert(tk.END, "Signals:\n", "info")
-                for signal in self.favorites["signals"]:
-                    self.favorites_output.insert(tk.END, f"- {signal}\n", "result")
-        self.favorites_output.insert(tk.END, "---\n", "separator")
+            if favorites["phenomena"]:
+                self.favorites_buffer.write("Phenomena:\n", "info")
+                for pheno in favorites["phenomena"]:
+                    self.favorites_buffer.write(f"- {pheno}\n", "result")
+            if favorites["signals"]:
+                self.favorites_buffer.write("Signals:\n", "info")
+                for signal in favorites["signals"]:
+                    self.favorites_buffer.write(f"- {signal}\n", "result")
+        self.favorites_buffer.write("---\n", "separator")
         self.favorites_dropdown["values"] = self.get_favorites_list()
 
     def get_favorites_list(self):
-        favorites_list = []
-        for pheno in self.favorites["phenomena"]:
-            favorites_list.append(f"Phenomenon: {pheno}")
-        for signal in self.favorites["signals"]:
-            favorites_list.append(f"Signal: {signal}")
-        return favorites_list if favorites_list else ["(No favorites yet)"]
+        return self.favorites.labels() or ["(No favorites yet)"]
 
     def toggle_favorite(self, event, category):
         tree = event.widget
         item = tree.selection()[0]
         name = tree.item(item, "values")[0]
-        if category == "phenomena":
-            if name in self.favorites["phenomena"]:
-                self.favorites["phenomena"].remove(name)
-                tree.set(item, "Favorite", "Add")
-            else:
-                self.favorites["phenomena"].append(name)
-                tree.set(item, "Favorite", "Remove")
-        elif category == "signals":
-            if name in self.favorites["signals"]:
-                self.favorites["signals"].remove(name)
-                tree.set(item, "Favorite", "Add")
-            else:
-                self.favorites["signals"].append(name)
-                tree.set(item, "Favorite", "Remove")
-        self.save_favorites()
+        # Uma linha inserida/removida no banco; outras instâncias veem a mudança
+        is_favorite = self.favorites.toggle(category, name)
+        tree.set(item, "Favorite", "Remove" if is_favorite else "Add")
         self.favorites_dropdown["values"] = self.get_favorites_list()
         self.update_favorites_output()
 
     def run_favorite(self):
         favorite = self.favorites_var.get()
-        if not favorite or favorite == "(No favorites yet)":
-            self.favorites_output.insert(tk.END, f"[{self.get_timestamp()}] >>> (No favorite selected)\n", "error")
-            self.favorites_output.insert(tk.END, "---\n", "separator")
+        parsed = parse_label(favorite) if favorite else None
+        if parsed is None:
+            self.favorites_buffer.write(f"[{self.get_timestamp()}] >>> (No favorite selected)\n", "error")
+            self.favorites_buffer.write("---\n", "separator")
             return
 
-        self.context = {}  # Reset context for new favorite
-        if favorite.startswith("Phenomenon: "):
-            pheno = favorite.replace("Phenomenon: ", "")
-            eq, meaning = phenomena[pheno]
-            self.favorites_output.insert(tk.END, f"[{self.get_timestamp()}] >>> Phenomenon: {pheno}\n", "phenomenon")
-            self.favorites_output.insert(tk.END, f"Equation: {eq}\n", "equation")
-            try:
-                result = interpret(eq, self.context)
-                self.favorites_output.insert(tk.END, f"Interpretation: {result}\n", "result")
-            except Exception as e:
-                self.favorites_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-            self.favorites_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-        elif favorite.startswith("Signal: "):
-            signal = favorite.replace("Signal: ", "")
-            self.favorites_output.insert(tk.END, f"[{self.get_timestamp()}] >>> Simulating Signal: {signal}\n")
-            for expr in signals[signal]:
-                try:
-                    result = interpret(expr, self.context)
-                    self.favorites_output.insert(tk.END, f"Expression: {expr}\n", "equation")
-                    self.favorites_output.insert(tk.END, f"{result}\n", "result")
-                    pheno, meaning = self.check_phenomenon(expr)
-                    if pheno:
-                        self.favorites_output.insert(tk.END, f"Phenomenon Detected: {pheno}\n", "phenomenon")
-                        self.favorites_output.insert(tk.END, f"Meaning: {meaning}\n", "result")
-                except Exception as e:
-                    self.favorites_output.insert(tk.END, f"Expression: {expr}\n", "equation")
-                    self.favorites_output.insert(tk.END, f"Error: {str(e)}\n", "error")
-        self.favorites_output.insert(tk.END, "---\n", "separator")
+        kind, name = parsed
+        self.context = SymbolContext()  # Reset context for new favorite
+        if kind == "phenomenon":
+            self.start_job(favorite, self.favorites_buffer, self.phenomenon_job, "favorites", name, self.context, total=1)
+        else:
+            self.start_job(favorite, self.favorites_buffer, self.signal_job, "favorites", name, self.context, total=len(signals.get(name, ())))
 
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Alien Symbolic Interpreter GUI")
+    parser.add_argument("--data-dir", help="directory for history, favorites and session logs (default: ~/.alien_symbolic)")
+    parser.add_argument("--pack", action="append", default=[], metavar="PATH", help="load a symbol pack (JSON or TOML); may be repeated")
+    parser.add_argument("--profile", action="store_true", help="start with symbol profiling on (see the Stats tab)")
+    parser.add_argument("--no-catalog-cache", action="store_true", help="load the symbol packs and build the catalog indexes without the on-disk cache")
+    args = parser.parse_args()
+    set_data_dir(args.data_dir)
+    for path in args.pack:
+        register_pack(path)
+    discover_packs()  # <data dir>/packs and ALIEN_SYMBOLIC_PACKS
+    if not args.no_catalog_cache:
+        warm_start()  # Packs, indexes and signal plans from <data dir>/cache when still valid
+    if args.profile:
+        enable_profiling()
+    _load_tkinter()
     root = tk.Tk()
     app = AlienSymbolicInterpreterGUI(root)
     root.mainloop()
@@ -0,0 +1,30 @@
+# Benchmark: Monte Carlo ensembles vs repeated interpret() calls
+# Times N realizations of stochastic expressions with every available backend.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alien_symbolic.ensemble import load_numpy, run_ensemble
+
+EXPRESSIONS = ["∴ + ◐ = Ψ", "(∴ ∞ ∴) = ⧗ ✧ Ω", "Ψ × ✧ = Ω"]
+REALIZATIONS = 100_000
+
+def main():
+    np = load_numpy()
+    backends = ["interpret", "python"] + (["numpy"] if np is not None else [])
+    print(f"{'expression':<20} " + " ".join(f"{b + ' s':>12}" for b in backends))
+    for expression in EXPRESSIONS:
+        timings = []
+        for backend in backends:
+            start = time.perf_counter()
+            run_ensemble(expression, REALIZATIONS, seed=1, backend=backend)
+            timings.append(time.perf_counter() - start)
+        print(f"{expression:<20} " + " ".join(f"{t:>12.3f}" for t in timings))
+    if np is None:
+        print("(NumPy not installed: numpy backend skipped)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Benchmark: cold-start import time of the headless core vs the GUI module
+# Each case runs in a fresh interpreter; the best of several runs is reported.
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+
+CASES = [
+    ("python (no imports)", "pass"),
+    ("alien_symbolic (headless core)", "import alien_symbolic"),
+    ("alien_symbolic_interpreter (lazy tkinter)", "import alien_symbolic_interpreter"),
+    ("GUI module + tkinter (previous startup)", "import alien_symbolic_interpreter; import tkinter; from tkinter import ttk, scrolledtext, filedialog"),
+]
+
+def cold_start(code):
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    for label, code in CASES:
+        try:
+            elapsed = cold_start(code)
+        except subprocess.CalledProcessError:
+            print(f"{label:<45} failed (tkinter unavailable?)")
+            continue
+        print(f"{label:<45} {elapsed * 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
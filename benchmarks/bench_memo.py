@@ -0,0 +1,37 @@
+# Benchmark: memoized evaluation of deterministic expressions
+# Evaluates every phenomenon equation (plus the signals) many times with a fresh
+# context per run, with memoization disabled and enabled, and prints the memo stats.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import alien_symbolic as asi
+
+ROUNDS = 2_000
+
+def run(expressions):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for expression in expressions:
+            asi.interpret(expression, asi.SymbolContext())
+    return time.perf_counter() - start
+
+def main():
+    deterministic = [eq for eq, _ in asi.phenomena.values() if asi.compile_expression(eq).inputs is not None]
+    mixed = [eq for eq, _ in asi.phenomena.values()] + [e for exprs in asi.signals.values() for e in exprs]
+    print(f"{len(deterministic)} deterministic of {len(asi.phenomena)} phenomena, {ROUNDS} rounds")
+    for label, expressions in (("deterministic", deterministic), ("all", mixed)):
+        asi.use_memoization(False)
+        plain = run(expressions)
+        asi.use_memoization(True)
+        asi.clear_memo()
+        memoized = run(expressions)
+        evaluations = ROUNDS * len(expressions)
+        print(f"{label:<14} off {plain:7.3f}s ({evaluations / plain:>10,.0f}/s)   on {memoized:7.3f}s ({evaluations / memoized:>10,.0f}/s)   x{plain / memoized:.1f}")
+    print("memo stats:", asi.memo_stats())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Benchmark: phenomenon matching against large user-defined catalogs
+# Compares the previous linear scan with the normalized-equation index for catalogs
+# of growing size, and times structural search (commutative, sub-expression) on the
+# same catalogs. Queries mix hits on the built-in phenomena and misses.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alien_symbolic import phenomena, symbols
+from alien_symbolic.matching import PhenomenonIndex, StructuralIndex
+
+SIZES = [1_000, 10_000, 100_000, 200_000]
+QUERIES = 200
+
+def linear_scan(catalog, expression):
+    # Implementação anterior de check_phenomenon
+    normalized_expression = expression.replace(" ", "")
+    for pheno, (eq, meaning) in catalog.items():
+        if normalized_expression == eq.replace(" ", ""):
+            return pheno, meaning
+    return None, None
+
+def synthetic_catalog(size, rng):
+    names = list(symbols.keys())
+    catalog = dict(phenomena)
+    while len(catalog) < size:
+        eq = " ".join(rng.choice(names + ["+", "×", "⇌"]) for _ in range(rng.randint(3, 9))) + " = " + rng.choice(names)
+        catalog[f"User Phenomenon {len(catalog)}"] = (eq, "Synthetic phenomenon.")
+    return catalog
+
+def per_query(fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries)
+
+def main():
+    rng = random.Random(42)
+    builtin = [eq for eq, _ in phenomena.values()]
+    print(f"{'catalog':>8} {'build ms':>9} {'index us/query':>15} {'scan us/query':>14} {'struct build ms':>16} {'search us/query':>16}")
+    for size in SIZES:
+        catalog = synthetic_catalog(size, rng)
+        queries = [rng.choice(builtin) if i % 2 else "◐ ⇌ ⇀ ⇀ ⇀" for i in range(QUERIES)]
+        start = time.perf_counter()
+        index = PhenomenonIndex(catalog)
+        build = time.perf_counter() - start
+        indexed = per_query(index.lookup, queries)
+        scanned = per_query(lambda q: linear_scan(catalog, q), queries[:20])
+        start = time.perf_counter()
+        structural = StructuralIndex(catalog)
+        structural_build = time.perf_counter() - start
+        # Consultas com ordem dos operandos trocada, para exercitar a forma canônica
+        searched = per_query(structural.search, [q.replace("∴ + ◐", "◐ + ∴") + f" {i % 7}" for i, q in enumerate(queries)])
+        print(f"{size:>8} {build * 1e3:>9.1f} {indexed * 1e6:>15.2f} {scanned * 1e6:>14.1f} {structural_build * 1e3:>16.1f} {searched * 1e6:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Benchmark: transition engine scaling with expression length
+# Counts symbol handler calls and wall time for chained "→" expressions of growing
+# length, comparing the single-pass engine against the previous re-evaluating one.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import alien_symbolic as asi
+
+LENGTHS = [50, 100, 200, 400, 800, 1600]
+# Número fixo de setas, e uma seta a cada 10 tokens (caso quadrático da versão anterior)
+ARROW_MODES = [("4 arrows", lambda length: 4), ("1 arrow / 10 tokens", lambda length: length // 10)]
+REPEATS = 5
+
+# Versão anterior do interpretador: cada "→" reavalia origem e destino inteiros
+def legacy_interpret(expression, context):
+    tokens = expression.replace("=", " = ").replace("→", " → ").split()
+    output = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in asi.symbols:
+            asi.symbols[token](context)
+            output.append(f"{token}: {context.get(token)}")
+        elif token == "→":
+            if i > 0 and i < len(tokens) - 1:
+                origin = " ".join(tokens[:i]).strip()
+                target = " ".join(tokens[i+1:]).strip()
+                origin_output = []
+                target_output = []
+                for ot in origin.split():
+                    if ot in asi.symbols:
+                        asi.symbols[ot](context)
+                        origin_output.append(f"{ot}: {context.get(ot)}")
+                    else:
+                        origin_output.append(ot)
+                for tt in target.split():
+                    if tt in asi.symbols:
+                        asi.symbols[tt](context)
+                        target_output.append(f"{tt}: {context.get(tt)}")
+                    else:
+                        target_output.append(tt)
+                context[target] = context.get(origin, None)
+                output.append(f"Transition: {' '.join(origin_output)} → {' '.join(target_output)} => {context.get(target)}")
+            i += 1
+        else:
+            output.append(token)
+        i += 1
+    return " ".join(output)
+
+def make_expression(length, arrows, rng):
+    names = list(asi.symbols.keys())
+    tokens = [rng.choice(names) for _ in range(length)]
+    step = length // (arrows + 1)
+    for k in range(1, arrows + 1):
+        tokens[k * step] = "→"
+    return " ".join(tokens)
+
+def count_calls(run, expression):
+    calls = [0]
+    original = dict(asi.symbols)
+
+    def counted(handler):
+        def wrapper(ctx):
+            calls[0] += 1
+            handler(ctx)
+        return wrapper
+
+    asi.symbols.update({name: counted(handler) for name, handler in original.items()})
+    asi.clear_compiled_cache()
+    try:
+        run(expression, {})
+    finally:
+        asi.symbols.update(original)
+        asi.clear_compiled_cache()
+    return calls[0]
+
+def best_time(run, expression):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run(expression, {})
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    rng = random.Random(42)
+    for label, arrows_for in ARROW_MODES:
+        print(f"-- {label}")
+        print(f"{'tokens':>7} {'calls(new)':>11} {'calls(old)':>11} {'new ms':>9} {'old ms':>9} {'new us/token':>13}")
+        for length in LENGTHS:
+            expression = make_expression(length, arrows_for(length), rng)
+            asi.compile_expression(expression)  # medir apenas a execução do plano
+            new_calls = count_calls(asi.interpret, expression)
+            old_calls = count_calls(legacy_interpret, expression)
+            new_time = best_time(asi.interpret, expression)
+            old_time = best_time(legacy_interpret, expression)
+            print(f"{length:>7} {new_calls:>11} {old_calls:>11} {new_time * 1e3:>9.2f} {old_time * 1e3:>9.2f} {new_time / length * 1e6:>13.2f}")
+
+if __name__ == "__main__":
+    main()
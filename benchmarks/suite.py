@@ -0,0 +1,460 @@
+# Benchmark suite
+# Times the parser, the evaluator, phenomenon matching and the GUI output path on
+# seeded synthetic workloads, so two runs (or two commits) can be compared:
+#
+#   python benchmarks/suite.py                               # table on stdout
+#   python benchmarks/suite.py --output results.json         # also machine-readable
+#   python benchmarks/suite.py --baseline benchmarks/baseline.json
+#   python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+#
+# With --baseline, every case is compared with the stored median time and the exit
+# status is 1 when one is slower by more than --threshold (default 15%). Baselines are
+# machine specific: regenerate the stored one on the machine that runs the comparison.
+#
+# Cases:
+#   parse/*      lexing + parsing of synthetic expressions (compile cache cleared)
+#   interpret/*  evaluation of synthetic expressions by length, arrow count, symbol mix
+#   outputs/*    evaluate_outputs() of one symbol out of a synthetic expression
+#   replay/*     every built-in phenomenon and signal, as run from the GUI
+#   catalog/*    index build and lookup/search on synthetic catalogs of growing size
+#   render/*     OutputBuffer inserts and a full signal run against mocked Tk widgets
+#                (no display or Xvfb needed)
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import types
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import alien_symbolic as asi
+from alien_symbolic import jobs, paths, session
+from alien_symbolic.matching import PhenomenonIndex, StructuralIndex, canonical_form
+
+SEED = 1234
+REPEAT = 5
+THRESHOLD = 0.15
+MIN_RUN_TIME = 0.05  # Casos rápidos repetem run() até levar pelo menos isso por medição
+FORMAT_VERSION = 1
+
+# Símbolos por comportamento, para variar a mistura das expressões geradas
+SYMBOL_MIXES = {
+    "pure": [s for s in asi.symbols if asi.symbol_class(s) == asi.PURE],
+    "random": ["∴", "✧", "⧗", "Ω"],
+    "all": list(asi.symbols),
+}
+
+# setup(scale) -> (run, operations): run() is timed, operations is how many units of
+# work one run() does (expressions, lookups, lines...)
+Case = namedtuple("Case", ["name", "setup"])
+# best/median are seconds per timed run of `operations` units; per_operation is the
+# median divided by operations, which is what baselines are compared on
+Result = namedtuple("Result", ["name", "operations", "best", "median", "per_operation", "ops_per_second"])
+
+def generate_expression(rng, length, arrows=0, mix="all"):
+    # length symbols joined by + × ⇌ or juxtaposition, with arrows "→" spread evenly
+    names = SYMBOL_MIXES[mix]
+    parts = [rng.choice(names)]
+    arrow_every = length // (arrows + 1) if arrows else 0
+    for i in range(1, length):
+        if arrow_every and i % arrow_every == 0 and arrows:
+            parts.append("→")
+            arrows -= 1
+        else:
+            parts.append(rng.choice(("+", "×", "⇌", "")))
+        parts.append(rng.choice(names))
+    return " ".join(part for part in parts if part)
+
+def generate_expressions(seed, count, length, arrows=0, mix="all"):
+    rng = random.Random(f"{seed}:{count}:{length}:{arrows}:{mix}")
+    return [generate_expression(rng, length, arrows, mix) for _ in range(count)]
+
+def synthetic_catalog(seed, size):
+    rng = random.Random(f"{seed}:catalog:{size}")
+    names = list(asi.symbols)
+    catalog = dict(asi.phenomena)
+    while len(catalog) < size:
+        eq = " ".join(rng.choice(names + ["+", "×", "⇌"]) for _ in range(rng.randint(3, 9))) + " = " + rng.choice(names)
+        catalog[f"User Phenomenon {len(catalog)}"] = (eq, "Synthetic phenomenon.")
+    return catalog
+
+# Cases
+
+def parse_case(length):
+    def setup(scale):
+        expressions = generate_expressions(SEED, max(1, 2000 * scale // length), length)
+
+        def run():
+            asi.clear_compiled_cache()
+            for expression in expressions:
+                asi.compile_expression(expression)
+        return run, len(expressions)
+    return Case(f"parse/length={length}", setup)
+
+def interpret_case(length, arrows, mix):
+    def setup(scale):
+        expressions = generate_expressions(SEED, max(1, 2000 * scale // length), length, arrows, mix)
+        for expression in expressions:
+            asi.compile_expression(expression)
+
+        def run():
+            asi.use_random(random.Random(SEED))
+            try:
+                for expression in expressions:
+                    asi.interpret(expression, asi.SymbolContext())
+            finally:
+                asi.use_random(None)
+        return run, len(expressions)
+    return Case(f"interpret/length={length},arrows={arrows},mix={mix}", setup)
+
+def structured_case(length, arrows):
+    # interpret_result(): typed events, no text formatting
+    def setup(scale):
+        expressions = generate_expressions(SEED, max(1, 2000 * scale // length), length, arrows)
+        for expression in expressions:
+            asi.compile_expression(expression)
+
+        def run():
+            asi.use_random(random.Random(SEED))
+            try:
+                for expression in expressions:
+                    asi.interpret_result(expression, asi.SymbolContext())
+            finally:
+                asi.use_random(None)
+        return run, len(expressions)
+    return Case(f"structured/length={length},arrows={arrows}", setup)
+
+def outputs_case(length, outputs):
+    # evaluate_outputs() of a few symbols, on expressions that contain all of them
+    def setup(scale):
+        rng = random.Random(f"{SEED}:outputs:{length}")
+        expressions = [" ".join(outputs) + " " + generate_expression(rng, length - len(outputs)) for _ in range(max(1, 2000 * scale // length))]
+        for expression in expressions:
+            asi.output_plan(expression, outputs)
+
+        def run():
+            asi.use_random(random.Random(SEED))
+            try:
+                for expression in expressions:
+                    asi.evaluate_outputs(expression, outputs)
+            finally:
+                asi.use_random(None)
+        return run, len(expressions)
+    return Case(f"outputs/length={length},outputs={','.join(outputs)}", setup)
+
+def replay_phenomena_case():
+    def setup(scale):
+        equations = [eq for eq, _ in asi.phenomena.values()]
+
+        def run():
+            for _ in range(20 * scale):
+                for eq in equations:
+                    asi.interpret(eq, asi.SymbolContext())
+                    asi.check_phenomenon(eq)
+        return run, 20 * scale * len(equations)
+    return Case("replay/phenomena", setup)
+
+def replay_signals_case():
+    def setup(scale):
+        names = list(asi.signals)
+
+        def run():
+            asi.use_random(random.Random(SEED))
+            try:
+                for _ in range(20 * scale):
+                    for name in names:
+                        asi.decode_signal(asi.signals[name])
+            finally:
+                asi.use_random(None)
+        return run, 20 * scale * len(names)
+    return Case("replay/signals", setup)
+
+def _catalog_queries(seed, count):
+    rng = random.Random(f"{seed}:queries")
+    builtin = [eq for eq, _ in asi.phenomena.values()]
+    # Metade acertos (com operandos trocados), metade expressões ausentes do catálogo
+    return [rng.choice(builtin).replace("∴ + ◐", "◐ + ∴") if i % 2 else generate_expression(rng, 5) for i in range(count)]
+
+def catalog_build_case(size):
+    def setup(scale):
+        catalog = synthetic_catalog(SEED, size)
+
+        def run():
+            canonical_form.cache_clear()  # Senão catálogos pequenos só medem acertos do cache
+            PhenomenonIndex(catalog)
+            StructuralIndex(catalog)
+        return run, len(catalog)
+    return Case(f"catalog/build,size={size}", setup)
+
+def catalog_lookup_case(size):
+    def setup(scale):
+        catalog = synthetic_catalog(SEED, size)
+        index = PhenomenonIndex(catalog)
+        structural = StructuralIndex(catalog)
+        queries = _catalog_queries(SEED, 200 * scale)
+
+        def run():
+            for query in queries:
+                if index.lookup(query)[0] is None:
+                    structural.match(query)
+                structural.search(query)
+        return run, len(queries)
+    return Case(f"catalog/lookup+search,size={size}", setup)
+
+# Mocked Tk: enough of tkinter for the GUI to build and for OutputBuffer to insert,
+# trim and count lines, without a display
+
+class _MockWidget:
+    def __init__(self, *args, **kwargs):
+        self._config = dict(kwargs)
+        self._lines = [""]
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def __setitem__(self, key, value):
+        self._config[key] = value
+
+    def __getitem__(self, key):
+        return self._config.get(key)
+
+    def config(self, *args, **kwargs):
+        self._config.update(kwargs)
+
+    configure = config
+
+    def cget(self, key):
+        return self._config.get(key)
+
+    def insert(self, index, *args):
+        # Como Text.insert(END, texto, tag, texto, tag, ...)
+        text = "".join(args[0::2])
+        lines = text.split("\n")
+        self._lines[-1] += lines[0]
+        self._lines.extend(lines[1:])
+
+    def index(self, index):
+        return f"{len(self._lines)}.0"
+
+    def delete(self, first, last=None):
+        if last is None or last == "end":
+            self._lines = [""]
+            return
+        del self._lines[:int(str(last).split(".")[0]) - 1]
+
+    def after(self, ms, function=None, *args):
+        if function is not None:
+            _MockTk.scheduled.append((function, args))
+        return f"after#{len(_MockTk.scheduled)}"
+
+    def after_cancel(self, identifier):
+        pass
+
+class _MockTk(_MockWidget):
+    scheduled = []
+
+    @classmethod
+    def run_scheduled(cls):
+        while cls.scheduled:
+            function, args = cls.scheduled.pop(0)
+            function(*args)
+
+class _MockVar:
+    def __init__(self, value=""):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+def _mock_tkinter():
+    tkinter = types.ModuleType("tkinter")
+    for name in ("Toplevel", "Canvas", "Text", "Frame", "Label", "Button", "Entry"):
+        setattr(tkinter, name, _MockWidget)
+    tkinter.Tk = _MockTk
+    tkinter.StringVar = tkinter.IntVar = tkinter.BooleanVar = _MockVar
+    for constant in ("END", "W", "E", "N", "S", "WORD", "NONE", "BOTH", "LEFT", "RIGHT", "X", "Y"):
+        setattr(tkinter, constant, constant.lower())
+    ttk = types.ModuleType("tkinter.ttk")
+    for name in ("Frame", "Label", "Button", "Checkbutton", "Entry", "Combobox", "Notebook", "Treeview", "Style", "Scrollbar", "Spinbox"):
+        setattr(ttk, name, _MockWidget)
+    scrolledtext = types.ModuleType("tkinter.scrolledtext")
+    scrolledtext.ScrolledText = _MockWidget
+    filedialog = types.ModuleType("tkinter.filedialog")
+    tkinter.ttk, tkinter.scrolledtext, tkinter.filedialog = ttk, scrolledtext, filedialog
+    return {"tkinter": tkinter, "tkinter.ttk": ttk, "tkinter.scrolledtext": scrolledtext, "tkinter.filedialog": filedialog}
+
+_gui = None
+
+def _gui_module():
+    # Importa a GUI com o tkinter simulado (o módulo real é restaurado depois)
+    global _gui
+    if _gui is None:
+        mocks = _mock_tkinter()
+        saved = {name: sys.modules.get(name) for name in mocks}
+        sys.modules.update(mocks)
+        try:
+            import alien_symbolic_interpreter as gui
+            gui.tk = None
+            gui._load_tkinter()
+        finally:
+            for name, module in saved.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+        paths.set_data_dir(tempfile.mkdtemp(prefix="alien-symbolic-bench-"))
+        _gui = gui
+    return _gui
+
+def render_buffer_case(max_lines):
+    def setup(scale):
+        gui = _gui_module()
+        records = [dict(asi.decode_expression(e), timestamp="2000-01-01 00:00:00", kind="expression") for e in generate_expressions(SEED, 200, 6, 1)]
+        lines = [session.record_lines(record) + [session.SEPARATOR] for record in records]
+        rounds = 10 * scale
+
+        def run():
+            buffer = gui.OutputBuffer(_MockTk(), _MockWidget(), max_lines)
+            for _ in range(rounds):
+                for block in lines:
+                    buffer.write_lines(block)
+                buffer.flush()
+        return run, rounds * sum(len(block) for block in lines)
+    return Case(f"render/buffer,max_lines={max_lines}", setup)
+
+def render_gui_case():
+    def setup(scale):
+        gui = _gui_module()
+        names = list(asi.signals)
+        rounds = 5 * scale
+
+        def run():
+            app = gui.AlienSymbolicInterpreterGUI(_MockTk())
+            try:
+                # Mesmo caminho do botão Run Signal, sem o thread do JobRunner
+                for _ in range(rounds):
+                    for name in names:
+                        job = jobs.Job(name)
+                        for item in app.signal_job(job, "signals", name, asi.SymbolContext()):
+                            app.signals_buffer.write_lines(item)
+                    app.signals_buffer.flush()
+                _MockTk.run_scheduled()
+            finally:
+                app.jobs.shutdown()
+                app.stream_jobs.shutdown()
+                app.session.close()
+                app.history.close()
+                app.favorites.close()
+        return run, rounds * len(names)
+    return Case("render/gui signals", setup)
+
+def all_cases():
+    cases = [parse_case(length) for length in (5, 50, 500)]
+    cases += [interpret_case(length, arrows, "all") for length, arrows in ((5, 0), (5, 1), (50, 0), (50, 5), (500, 50))]
+    cases += [interpret_case(20, 2, mix) for mix in ("pure", "random")]
+    cases += [structured_case(length, arrows) for length, arrows in ((5, 0), (50, 5), (500, 50))]
+    cases += [outputs_case(length, ("Ω",)) for length in (5, 50)]
+    cases += [replay_phenomena_case(), replay_signals_case()]
+    cases += [catalog_build_case(size) for size in (1_000, 10_000)]
+    cases += [catalog_lookup_case(size) for size in (1_000, 10_000, 50_000)]
+    cases += [render_buffer_case(2000), render_buffer_case(200), render_gui_case()]
+    return cases
+
+def run_case(case, scale, repeat):
+    # Cada caso parte de caches vazios e sem lixo dos casos anteriores
+    asi.clear_compiled_cache()  # Também limpa os memos
+    gc.collect()
+    run, operations = case.setup(scale)
+    # Aquecimento (caches de compilação, índices, imports) e calibração
+    start = time.perf_counter()
+    run()
+    loops = max(1, int(MIN_RUN_TIME / max(time.perf_counter() - start, 1e-9)) + 1)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    operations *= loops
+    return Result(case.name, operations, min(times), median, median / operations, operations / median if median else 0.0)
+
+def environment():
+    return {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "seed": SEED,
+    }
+
+def compare(results, baseline, threshold):
+    # (name, baseline per-op seconds, per-op seconds, ratio, regressed) for cases in both
+    previous = {entry["name"]: entry for entry in baseline.get("results", [])}
+    rows = []
+    for result in results:
+        entry = previous.get(result.name)
+        if entry is None or not entry.get("per_operation"):
+            continue  # Caso novo: sem comparação
+        ratio = result.per_operation / entry["per_operation"]
+        rows.append((result.name, entry["per_operation"], result.per_operation, ratio, ratio > 1 + threshold))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Alien Symbolic Interpreter benchmark suite")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--scale", type=int, default=1, help="multiply the work per case (larger = steadier timings)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case (the median is reported)")
+    parser.add_argument("--output", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with a results file and fail on regressions")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown against the baseline (0.15 = 15%%)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if args.filter in case.name]
+    if args.list:
+        print("\n".join(case.name for case in cases))
+        return 0
+
+    results = []
+    print(f"{'case':<48} {'ops':>8} {'median ms':>10} {'best ms':>9} {'us/op':>10} {'ops/s':>12}")
+    for case in cases:
+        result = run_case(case, args.scale, args.repeat)
+        results.append(result)
+        print(f"{result.name:<48} {result.operations:>8} {result.median * 1e3:>10.2f} {result.best * 1e3:>9.2f} {result.per_operation * 1e6:>10.3f} {result.ops_per_second:>12,.0f}")
+        sys.stdout.flush()
+
+    report = {"environment": environment(), "scale": args.scale, "results": [result._asdict() for result in results]}
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+    print(f"\n{'case':<48} {'baseline us/op':>15} {'now us/op':>10} {'change':>8}")
+    for name, before, now, ratio, regressed in rows:
+        print(f"{name:<48} {before * 1e6:>15.3f} {now * 1e6:>10.3f} {(ratio - 1) * 100:>+7.1f}%{'  REGRESSION' if regressed else ''}")
+    regressions = sum(1 for row in rows if row[4])
+    print(f"{regressions} regression(s) over {args.threshold:.0%} in {len(rows)} compared case(s)")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
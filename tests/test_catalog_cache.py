@@ -0,0 +1,82 @@
+# Catalog cache (alien_symbolic/catalog_cache.py): a cold start builds and saves the
+# cache, a warm start loads it with the same lookups; an edited pack, a phenomenon
+# registered in code or an unusable data directory make it a miss.
+# Run from the repository root: python -m pytest -q
+
+import json
+
+import pytest
+
+from alien_symbolic import check_phenomenon, complete_phenomena, ensure_loaded, load_catalog, phenomena, register_pack, register_phenomenon, save_catalog, search_phenomena, warm_start
+from alien_symbolic import paths
+from alien_symbolic.catalog_cache import cache_path
+
+@pytest.fixture
+def data_dir(tmp_path):
+    previous = paths._data_dir
+    paths.set_data_dir(str(tmp_path))
+    try:
+        yield tmp_path
+    finally:
+        paths.set_data_dir(previous)
+
+def lookups():
+    return (
+        [check_phenomenon(equation) for equation, _ in phenomena.values()],
+        search_phenomena("∴ + ◐"),
+        complete_phenomena(["∴"]),
+        complete_phenomena([], 5),
+    )
+
+def test_cold_then_warm_start(data_dir):
+    ensure_loaded()
+    expected = lookups()
+    assert warm_start() is False
+    assert (data_dir / "cache" / "catalog.cache").exists()
+    assert warm_start() is True
+    assert lookups() == expected
+
+def test_edited_pack_is_a_miss(data_dir):
+    pack = data_dir / "cacheprobe.json"
+    pack.write_text(json.dumps({"phenomena": {"Cache Probe": ["Ω ⇧ ∅ ⇧", "before"]}}), encoding="utf-8")
+    register_pack(str(pack))
+    ensure_loaded()
+    save_catalog()
+    assert load_catalog() is True
+    pack.write_text(json.dumps({"phenomena": {"Cache Probe": ["Ω ⇧ ∅ ⇧", "after"]}}), encoding="utf-8")
+    assert load_catalog() is False
+
+def test_phenomenon_registered_in_code_is_a_miss(data_dir):
+    ensure_loaded()
+    save_catalog()
+    register_phenomenon("Cache Drift", "⬠ ⬠ ⬠ ⬠", "registered after the cache was built")
+    try:
+        assert load_catalog() is False
+        assert check_phenomenon("⬠ ⬠ ⬠ ⬠") == ("Cache Drift", "registered after the cache was built")
+    finally:
+        del phenomena["Cache Drift"]
+    assert load_catalog() is True
+    assert check_phenomenon("⬠ ⬠ ⬠ ⬠") == (None, None)
+
+def test_unusable_data_dir_is_a_miss(tmp_path):
+    blocker = tmp_path / "not a directory"
+    blocker.write_text("", encoding="utf-8")
+    previous = paths._data_dir
+    paths.set_data_dir(str(blocker))
+    try:
+        with pytest.raises(OSError):
+            cache_path()
+        assert load_catalog() is False
+        assert warm_start() is False
+        assert check_phenomenon("∴ + ◐ = Ψ")[0] == "Quantum Superposition"
+    finally:
+        paths.set_data_dir(previous)
+
+def test_corrupt_cache_is_a_miss(data_dir):
+    ensure_loaded()
+    save_catalog()
+    with open(cache_path(), "r+b") as f:
+        f.truncate(40)
+    assert load_catalog() is False
+    assert warm_start() is False
+    assert load_catalog() is True
@@ -0,0 +1,97 @@
+# Favorites store (alien_symbolic/favorites.py): the SQLite rows, the one-time import of
+# a legacy favorites.json, and resolve() returning plans for the current catalog and
+# symbol table.
+# Run from the repository root: python -m pytest -q
+
+import json
+
+from alien_symbolic import compile_expression, phenomena, register_phenomenon, register_symbol, signals, symbol_values, value_classes
+from alien_symbolic.favorites import FavoritesStore, parse_label, resolve
+
+def store(tmp_path, legacy=None):
+    return FavoritesStore(str(tmp_path / "favorites.sqlite3"), legacy_path=legacy or str(tmp_path / "missing.json"))
+
+def test_add_remove_toggle(tmp_path):
+    favorites = store(tmp_path)
+    favorites.add("phenomena", "Wormhole")
+    favorites.add("phenomena", "Big Bang")
+    favorites.add("phenomena", "Wormhole")  # Repetido: ignorado
+    favorites.add("signals", "Wow!")
+    assert favorites.names("phenomena") == ["Wormhole", "Big Bang"]
+    assert favorites.contains("signals", "Wow!")
+    assert favorites.toggle("signals", "Wow!") is False
+    assert favorites.toggle("signals", "GRB") is True
+    favorites.remove("phenomena", "Wormhole")
+    assert favorites.to_dict() == {"phenomena": ["Big Bang"], "signals": ["GRB"]}
+    assert favorites.labels() == ["Phenomenon: Big Bang", "Signal: GRB"]
+    favorites.close()
+
+def test_changes_are_shared_between_stores(tmp_path):
+    first, second = store(tmp_path), store(tmp_path)
+    first.add("signals", "BLC1")
+    assert second.contains("signals", "BLC1")
+    second.remove("signals", "BLC1")
+    assert first.names("signals") == []
+    first.close()
+    second.close()
+
+def test_favorites_survive_reopening(tmp_path):
+    favorites = store(tmp_path)
+    favorites.add("phenomena", "Neutrinos")
+    favorites.close()
+    favorites = store(tmp_path)
+    assert favorites.names("phenomena") == ["Neutrinos"]
+    favorites.close()
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "favorites.json"
+    legacy.write_text(json.dumps({"phenomena": ["Wormhole"], "signals": ["Wow!"]}), encoding="utf-8")
+    favorites = store(tmp_path, str(legacy))
+    assert favorites.to_dict() == {"phenomena": ["Wormhole"], "signals": ["Wow!"]}
+    favorites.remove("phenomena", "Wormhole")
+    favorites.close()
+    favorites = store(tmp_path, str(legacy))
+    assert favorites.names("phenomena") == []
+    favorites.close()
+
+def test_corrupt_legacy_json_starts_empty(tmp_path):
+    legacy = tmp_path / "favorites.json"
+    legacy.write_text("{not json", encoding="utf-8")
+    favorites = store(tmp_path, str(legacy))
+    assert favorites.to_dict() == {"phenomena": [], "signals": []}
+    favorites.close()
+
+def test_parse_label():
+    assert parse_label("Phenomenon: Big Bang") == ("phenomenon", "Big Bang")
+    assert parse_label("Signal: Wow!") == ("signal", "Wow!")
+    assert parse_label("Wow!") is None
+
+def test_resolve_is_cached():
+    first = resolve("signal", "Wow!")
+    assert resolve("signal", "Wow!") is first
+    assert [step[0].source for step in first.steps] == signals["Wow!"]
+
+def test_resolve_follows_replaced_phenomena():
+    register_phenomenon("Test Glow", "● ⇌ ✧ ✧", "before")
+    try:
+        assert resolve("signal", "Wow!").steps[0][1:] == (None, None)
+        phenomena["Test Glow"] = ("● ⇌ ✧", "after")
+        assert resolve("signal", "Wow!").steps[0][1:] == ("Test Glow", "after")
+    finally:
+        del phenomena["Test Glow"]
+    assert resolve("signal", "Wow!").steps[0][1:] == (None, None)
+
+def test_resolve_recompiles_after_symbol_changes():
+    name = "Quantum Superposition"
+    first = resolve("phenomenon", name)
+    value_function = symbol_values["∴"]
+    kind, reads = value_classes[value_function]
+    register_symbol("∴", lambda ctx: "Replaced")
+    try:
+        payload = resolve("phenomenon", name)
+        assert payload is not first
+        plan = payload.steps[0][0]
+        assert plan is compile_expression(phenomena[name][0])
+    finally:
+        register_symbol("∴", value_function, kind, reads)
+    assert resolve("phenomenon", name).steps[0][0] is compile_expression(phenomena[name][0])
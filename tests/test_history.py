@@ -0,0 +1,53 @@
+# Expression history (alien_symbolic/history.py): one row per distinct expression with its
+# usage count and run times, recent and most-used pages, and prefix and substring search.
+# Run from the repository root: python -m pytest -q
+
+from alien_symbolic.history import HistoryStore
+
+def history(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    for when, expression in enumerate(["∴ → ⧗", "∴ + ◐ = Ψ", "● ⇌ ✧", "∴ → ⧗", "Ω", "∴ → ⧗"]):
+        store.record(expression, when=float(when))
+    return store
+
+def expressions(entries):
+    return [entry.expression for entry in entries]
+
+def test_duplicates_bump_the_count(tmp_path):
+    store = history(tmp_path)
+    assert len(store) == 4
+    assert tuple(store.get("∴ → ⧗")) == ("∴ → ⧗", 3, 0.0, 5.0)
+    assert "Ω" in store and "Ψ" not in store
+    store.close()
+
+def test_recent_and_most_used_pages(tmp_path):
+    store = history(tmp_path)
+    assert expressions(store.recent()) == ["∴ → ⧗", "Ω", "● ⇌ ✧", "∴ + ◐ = Ψ"]
+    assert expressions(store.recent(limit=2, offset=1)) == ["Ω", "● ⇌ ✧"]
+    assert expressions(store.most_used(limit=1)) == ["∴ → ⧗"]
+    store.close()
+
+def test_search(tmp_path):
+    store = history(tmp_path)
+    assert expressions(store.search("∴", prefix=True)) == ["∴ → ⧗", "∴ + ◐ = Ψ"]
+    assert expressions(store.search("⇌")) == ["● ⇌ ✧"]
+    assert expressions(store.search("⇌", prefix=True)) == []
+    assert expressions(store.search("")) == expressions(store.recent())
+    assert expressions(store.search("∴", limit=1, offset=1)) == ["∴ + ◐ = Ψ"]
+    store.close()
+
+def test_remove_clear_and_reopen(tmp_path):
+    store = history(tmp_path)
+    store.remove("Ω")
+    store.close()
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    assert len(store) == 3 and "Ω" not in store
+    store.clear()
+    assert len(store) == 0 and store.recent() == []
+    store.close()
+
+def test_in_memory_store():
+    store = HistoryStore(":memory:")
+    store.record("Ω")
+    assert store.get("Ω").uses == 1
+    store.close()
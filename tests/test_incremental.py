@@ -0,0 +1,94 @@
+# Incremental evaluation (alien_symbolic/incremental.py): building an expression token by
+# token must give the text and context interpret() gives for the whole expression, with
+# the same seeded random draws, and removing or replacing tokens must undo exactly what
+# they wrote. Also the completion hints and their limit.
+# Run from the repository root: python -m pytest -q
+
+import random
+
+from alien_symbolic import IncrementalEvaluator, SymbolContext, complete_phenomena, interpret, symbols, tokenize, use_random
+
+TOKENS = list(symbols) + ["+", "×", "=", "→", "⇌", "(", ")"]
+PURE = [token for token in TOKENS if token not in ("∴", "✧")]
+
+def interpreted(tokens, seed=None):
+    previous = use_random(random.Random(seed))
+    try:
+        context = SymbolContext()
+        return interpret(" ".join(tokens), context), context.to_dict()
+    finally:
+        use_random(previous)
+
+def built(evaluator):
+    return evaluator.output(), evaluator.context.to_dict()
+
+def sequences(count, pure=False):
+    rng = random.Random(7)
+    choices = PURE if pure else TOKENS
+    return [[rng.choice(choices) for _ in range(rng.randint(1, 10))] for _ in range(count)]
+
+def test_appending_matches_interpret():
+    for seed, tokens in enumerate(sequences(300)):
+        previous = use_random(random.Random(seed))
+        try:
+            evaluator = IncrementalEvaluator()
+            for token in tokens:
+                evaluator.append(token)
+        finally:
+            use_random(previous)
+        assert built(evaluator) == interpreted(tokens, seed), tokens
+
+def test_pop_and_set_tokens_match_interpret():
+    rng = random.Random(3)
+    for tokens in sequences(300, pure=True):
+        evaluator = IncrementalEvaluator()
+        for token in tokens:
+            evaluator.append(token)
+        for _ in range(rng.randint(1, 5)):
+            if evaluator.tokens and rng.random() < 0.5:
+                evaluator.pop()
+            else:
+                evaluator.append(rng.choice(PURE))
+            expected = interpreted(evaluator.tokens) if evaluator.tokens else ("", {})
+            assert built(evaluator) == expected, evaluator.tokens
+        replacement = tokens[: len(tokens) // 2] + ["Ω"]
+        evaluator.set_tokens(replacement)
+        assert built(evaluator) == interpreted(replacement)
+        evaluator.clear()
+        assert built(evaluator) == ("", {})
+
+def test_stochastic_symbols_keep_their_value():
+    previous = use_random(random.Random(5))
+    try:
+        evaluator = IncrementalEvaluator()
+        first = evaluator.append("∴")
+        evaluator.append("→")
+        evaluator.append("⧗")
+        evaluator.pop()
+        evaluator.pop()
+        assert evaluator.output() == first
+    finally:
+        use_random(previous)
+
+def test_appending_a_symbol_runs_only_that_step():
+    evaluator = IncrementalEvaluator()
+    evaluator.append("Ω")
+    evaluator.append("⧗")
+    assert evaluator.last_run == 1
+
+def test_hints():
+    evaluator = IncrementalEvaluator()
+    assert evaluator.hints() == (None, None, [])
+    evaluator.set_tokens(["∴"])
+    pheno, meaning, completions = evaluator.hints(limit=1)
+    assert pheno is None and meaning is None
+    assert completions == complete_phenomena(["∴"], 1)
+    assert completions[0][1].startswith("∴")
+
+def test_completions_are_shortest_first_and_limited():
+    everything = complete_phenomena([])
+    sizes = [len(tokenize(equation)) for _, equation in everything]
+    assert sizes == sorted(sizes)
+    for limit in (0, 1, 3, len(everything) + 5):
+        assert complete_phenomena([], limit) == everything[:limit]
+    assert complete_phenomena(["no such token"]) == []
@@ -0,0 +1,88 @@
+# Background jobs (alien_symbolic/jobs.py): items reach drain() in order, jobs run one at
+# a time in submission order, cancel() stops a running job at its next yield or a queued
+# one before it starts, and errors are kept on the job.
+# Run from the repository root: python -m pytest -q
+
+import threading
+
+from alien_symbolic.jobs import JobRunner
+
+def count(job, n):
+    for i in range(n):
+        job.advance()
+        yield i
+
+def test_items_are_drained_in_order():
+    runner = JobRunner()
+    try:
+        job = runner.submit("count", count, 50, total=50)
+        job.future.result(timeout=10)
+        assert job.finished and not job.stopped and job.error is None
+        assert job.progress() == "50/50"
+        assert job.drain(limit=10) == list(range(10))
+        assert job.pending()
+        assert job.drain() == list(range(10, 50))
+        assert not job.pending()
+    finally:
+        runner.shutdown(wait=True)
+
+def test_jobs_run_in_submission_order():
+    runner = JobRunner()
+    order = []
+
+    def record(job, name):
+        order.append(name)
+        yield name
+
+    try:
+        jobs = [runner.submit(str(i), record, i) for i in range(5)]
+        for job in jobs:
+            job.future.result(timeout=10)
+        assert order == list(range(5))
+    finally:
+        runner.shutdown(wait=True)
+
+def test_cancel_stops_a_running_job_and_skips_queued_ones():
+    runner = JobRunner()
+    started, release = threading.Event(), threading.Event()
+    closed = []
+
+    def blocking(job):
+        try:
+            started.set()
+            release.wait(10)
+            yield "first"
+            yield "second"
+        finally:
+            closed.append(True)
+
+    try:
+        running = runner.submit("running", blocking)
+        queued = runner.submit("queued", count, 5)
+        started.wait(10)
+        runner.cancel_all()
+        release.set()
+        running.future.result(timeout=10)
+        queued.future.result(timeout=10)
+        assert running.stopped and running.drain() == ["first"]
+        assert closed == [True]  # O gerador é fechado ao cancelar
+        assert queued.stopped and queued.drain() == []
+        assert queued.done == 0
+    finally:
+        runner.shutdown(wait=True)
+
+def test_errors_are_kept_on_the_job():
+    runner = JobRunner()
+
+    def failing(job):
+        yield 1
+        raise ValueError("bad signal")
+
+    try:
+        job = runner.submit("failing", failing)
+        job.future.result(timeout=10)
+        assert isinstance(job.error, ValueError)
+        assert job.drain() == [1]
+        assert job.progress() == "0"
+    finally:
+        runner.shutdown(wait=True)
@@ -0,0 +1,96 @@
+# Memoized evaluation (use_memoization) must give the same text and leave the same
+# context as plain evaluation: over every phenomenon equation and signal expression,
+# in fresh and shared contexts, with the same seeded random draws on both sides.
+# Run from the repository root: python -m pytest -q
+
+import random
+import threading
+
+from alien_symbolic import SymbolContext, clear_memo, interpret, memo_stats, phenomena, signals, use_memoization, use_random
+from alien_symbolic.memo import MemoCache
+
+def catalog_expressions():
+    return [equation for equation, _ in phenomena.values()] + [e for expressions in signals.values() for e in expressions]
+
+def run(expression, context, seed, memoize):
+    previous_memo = use_memoization(memoize)
+    previous_rng = use_random(random.Random(seed))
+    try:
+        return interpret(expression, context)
+    finally:
+        use_random(previous_rng)
+        use_memoization(previous_memo)
+
+def compare(expressions, make_context, share_every):
+    mismatches = []
+    plain, memoized = make_context(), make_context()
+    for i, expression in enumerate(expressions):
+        if i % share_every == 0:
+            # Blocos de expressões avaliadas no mesmo contexto
+            plain, memoized = make_context(), make_context()
+        expected = run(expression, plain, i, False)
+        got = run(expression, memoized, i, True)
+        if got != expected or dict(memoized.items()) != dict(plain.items()):
+            mismatches.append((expression, expected, got))
+    return mismatches
+
+def test_memoized_matches_plain_in_fresh_contexts():
+    clear_memo()
+    # Duas passadas: a segunda é servida pelo cache
+    for _ in range(2):
+        assert compare(catalog_expressions(), SymbolContext, 1) == []
+
+def test_memoized_matches_plain_in_shared_contexts():
+    clear_memo()
+    for _ in range(2):
+        assert compare(catalog_expressions(), SymbolContext, 5) == []
+        assert compare(catalog_expressions(), dict, 5) == []
+
+def test_memoized_matches_plain_across_seeds():
+    clear_memo()
+    expressions = catalog_expressions()
+    for seed in range(3):
+        rng = random.Random(seed)
+        shuffled = rng.sample(expressions, len(expressions))
+        assert compare(shuffled, SymbolContext, 3) == []
+
+def test_memo_is_used():
+    clear_memo()
+    compare(catalog_expressions() * 2, SymbolContext, 1)
+    stats = memo_stats()
+    assert stats["plans"]["hits"] + stats["values"]["hits"] > 0
+
+def test_memo_cache_is_lru():
+    cache = MemoCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" passa a ser o mais recente
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["size"] == 2
+
+def test_memo_cache_is_thread_safe():
+    # Vários threads inserindo e lendo com despejo constante (maxsize pequeno)
+    cache = MemoCache(16)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(20000):
+                key = (offset + i) % 64
+                cache.put(key, key)
+                value = cache.get((key + 7) % 64)
+                assert value is None or value == (key + 7) % 64
+        except Exception as e:  # pragma: no cover - só em caso de falha
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n * 13,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) == 16
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 20000
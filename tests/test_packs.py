@@ -0,0 +1,53 @@
+# Symbol packs (alien_symbolic/packs.py): loading, namespaces, and pack symbols and
+# phenomena resolving in the worker processes of the parallel decoder under start
+# methods that do not fork the main process.
+# Run from the repository root: python -m pytest -q
+
+import json
+import multiprocessing
+
+from alien_symbolic import check_phenomenon, ensure_loaded, interpret, register_pack, symbols
+from alien_symbolic.packs import packs
+from alien_symbolic.parallel import decode_expressions_parallel
+
+PACK = {
+    "symbols": {
+        "⟁": "Pyramid Resonance (Energy Focused)",
+        "⟐": {"template": "Echo of {⧗}", "defaults": {"⧗": "Silence"}},
+    },
+    "phenomena": {"Resonant Fold": ["⟁ × ꩜", "Focused energy bends spacetime."]},
+    "signals": {"Pulse 7": ["⟁", "⟁ ⇌ ⟐"]},
+}
+
+def pack(tmp_path_factory, namespace):
+    # Um namespace por teste: pacotes registrados ficam no processo até o fim
+    if namespace not in packs:
+        path = tmp_path_factory.mktemp("packs") / f"{namespace}.json"
+        path.write_text(json.dumps(PACK, ensure_ascii=False), encoding="utf-8")
+        register_pack(str(path))
+        ensure_loaded()
+    return namespace
+
+def test_pack_symbols_and_phenomena(tmp_path_factory):
+    namespace = pack(tmp_path_factory, "testpack_local")
+    assert f"{namespace}:⟁" in symbols
+    assert interpret("⟁", {}) == "⟁: Pyramid Resonance (Energy Focused)"
+    assert interpret("⟐", {}) == "⟐: Echo of Silence"
+    assert check_phenomenon("⟁ × ꩜") == (f"{namespace}:Resonant Fold", "Focused energy bends spacetime.")
+
+def test_workers_register_packs_without_fork(tmp_path_factory):
+    pack(tmp_path_factory, "testpack_workers")
+    expressions = ["⟁ × ꩜", "⟐", "⟁"] * 4
+    for method in ("spawn", "forkserver"):
+        if method not in multiprocessing.get_all_start_methods():
+            continue
+        records = list(decode_expressions_parallel(expressions, seed=3, workers=2, batch_size=2, mp_context=multiprocessing.get_context(method)))
+        assert [record["expression"] for record in records] == expressions
+        for record in records:
+            assert "error" not in record
+        fold = records[0]
+        assert fold["result"].startswith("⟁: Pyramid Resonance (Energy Focused)")
+        # Mesmo fenômeno que o processo principal encontra (o primeiro pacote com a equação)
+        assert fold["phenomenon"] == check_phenomenon("⟁ × ꩜")[0]
+        assert fold["phenomenon"].endswith(":Resonant Fold")
+        assert records[1]["result"] == "⟐: Echo of Silence"
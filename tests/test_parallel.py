@@ -0,0 +1,76 @@
+# Parallel decoding (alien_symbolic/parallel.py) and the batch runner (alien_symbolic/cli.py):
+# with a seed the records do not depend on the number of workers or the batch size, and
+# the --search, --output, --events and --workers options reach every record.
+# Run from the repository root: python -m pytest -q
+
+import io
+import json
+
+from alien_symbolic import phenomena, signals
+from alien_symbolic.cli import main, run_batch
+from alien_symbolic.parallel import decode_expressions_parallel, decode_signals_parallel, task_random
+
+EXPRESSIONS = ["∴ ✧ Ω", "∴ → ⧗ ⬠", "✧ ∴", "x +", "(∴ + ◐) → Ψ"] + [equation for equation, _ in phenomena.values()]
+
+def decoded(workers, batch_size, seed=11, **options):
+    return list(decode_expressions_parallel(EXPRESSIONS, seed=seed, workers=workers, batch_size=batch_size, **options))
+
+def test_task_random_is_stable():
+    assert task_random(5, 3).random() == task_random(5, 3).random()
+    assert task_random(5, 3).random() != task_random(5, 4).random()
+    assert task_random(5, 3).random() != task_random(6, 3).random()
+
+def test_records_do_not_depend_on_workers_or_batches():
+    expected = decoded(1, 256)
+    assert [record["expression"] for record in expected] == EXPRESSIONS
+    assert decoded(1, 3) == expected
+    assert decoded(2, 1) == expected
+    assert decoded(3, 4) == expected
+    assert decoded(1, 256, seed=12) != expected
+
+def test_options_reach_the_workers():
+    for options in ({"search": True}, {"outputs": ["Ω"]}, {"events": True}):
+        assert decoded(2, 2, **options) == decoded(1, 256, **options)
+
+def test_signals_decode_in_parallel():
+    names = list(signals)
+    expected = list(decode_signals_parallel(names, seed=4, workers=1))
+    assert [record["signal"] for record in expected] == names
+    assert list(decode_signals_parallel(names, seed=4, workers=2, batch_size=2)) == expected
+    custom = list(decode_signals_parallel([("Custom", ["∴ ✧", "Ω"])], seed=4, workers=1))
+    assert [entry["expression"] for entry in custom[0]["expressions"]] == ["∴ ✧", "Ω"]
+
+def batch(text, **options):
+    out = io.StringIO()
+    count = run_batch(["-"], out, stdin=io.StringIO(text), seed=3, **options)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == count
+    return records
+
+def test_run_batch_skips_blank_lines_and_keeps_line_numbers():
+    records = batch("∴ ✧ Ω\n\n  \nx +\n")
+    assert [(record["source"], record["line"], record["expression"]) for record in records] == [("<stdin>", 1, "∴ ✧ Ω"), ("<stdin>", 4, "x +")]
+    assert records[1]["result"] == "x +"
+
+def test_run_batch_options():
+    text = "∴ ✧ Ω\n∴ + ◐ = Ψ\nx +\n"
+    assert batch(text, workers=2) == batch(text)
+    assert all("matches" in record for record in batch(text, search=True))
+    selected = batch(text, outputs=["Ω"])
+    assert list(selected[0]["outputs"]) == ["Ω"]
+    assert "error" in selected[2]
+    events = batch(text, events=True)
+    assert [event["type"] for event in events[2]["events"]] == ["operator", "operator"]
+    assert events[0]["events"][0]["symbol"] == "∴"
+
+def test_main_reads_files(tmp_path, capsys):
+    source = tmp_path / "signals.txt"
+    source.write_text("∴ ✧ Ω\n∴ + ◐ = Ψ\n", encoding="utf-8")
+    assert main([str(source), "--seed", "3", "--workers", "2", "--search", "--no-catalog-cache"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["line"] for record in records] == [1, 2]
+    assert records[1]["phenomenon"] == "Quantum Superposition"
+    expected = batch(source.read_text(encoding="utf-8"), search=True)
+    for record in expected:
+        record["source"] = str(source)
+    assert records == expected
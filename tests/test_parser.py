@@ -0,0 +1,134 @@
+# Regression tests for the expression parser (alien_symbolic/parser.py) and for how
+# compile_expression() turns → nodes into transitions.
+# Run from the repository root: python -m pytest -q
+
+import random
+
+from alien_symbolic import SymbolContext, compile_expression, interpret_result, use_random
+from alien_symbolic.parser import Group, Literal, Sequence, Symbol, lex, parse_expression, to_source
+
+def texts(expression):
+    return [token.text for token in lex(expression)]
+
+def shape(node):
+    # Compact form of a tree: names, literals, ("op", left, right), ["seq"...], ("()", body)
+    if isinstance(node, Symbol):
+        return node.name
+    if isinstance(node, Literal):
+        return ("lit", node.text)
+    if isinstance(node, Group):
+        return ("()" if node.closed else "(", shape(node.body) if node.body is not None else None)
+    if isinstance(node, Sequence):
+        return ["seq"] + [shape(item) for item in node.items]
+    return (node.op, shape(node.left), shape(node.right))
+
+# Operadores e parênteses colados
+
+def test_glued_operators_are_split():
+    assert texts("✦⇌✦") == ["✦", "⇌", "✦"]
+    assert texts("∴+◐=Ψ") == ["∴", "+", "◐", "=", "Ψ"]
+    assert texts("(∴+◐)×Ψ") == ["(", "∴", "+", "◐", ")", "×", "Ψ"]
+
+def test_glued_paren_is_split():
+    assert texts("(∴") == ["(", "∴"]
+    assert texts("∴)") == ["∴", ")"]
+
+def test_token_offsets():
+    assert [(t.start, t.end) for t in lex("☍ + ✦⇌✦")] == [(0, 1), (2, 3), (4, 5), (5, 6), (6, 7)]
+
+def test_glued_and_spaced_parse_alike():
+    assert shape(parse_expression("✦⇌✦")) == shape(parse_expression("✦ ⇌ ✦"))
+    assert shape(parse_expression("(∴+◐)×Ψ")) == shape(parse_expression("( ∴ + ◐ ) × Ψ"))
+
+# Precedência e associatividade
+
+def test_precedence_from_weakest_to_strongest():
+    # = < → < ⇌ < + < × < juxtaposition
+    assert shape(parse_expression("∴ + ◐ × Ψ")) == ("+", "∴", ("×", "◐", "Ψ"))
+    assert shape(parse_expression("∴ ⇌ ◐ + Ψ")) == ("⇌", "∴", ("+", "◐", "Ψ"))
+    assert shape(parse_expression("∴ → ◐ ⇌ Ψ")) == ("→", "∴", ("⇌", "◐", "Ψ"))
+    assert shape(parse_expression("∴ = ◐ → Ψ")) == ("=", "∴", ("→", "◐", "Ψ"))
+    assert shape(parse_expression("∴ ∞ × Ψ")) == ("×", ["seq", "∴", "∞"], "Ψ")
+
+def test_transition_is_right_associative():
+    assert shape(parse_expression("∴ → ◐ → Ψ")) == ("→", "∴", ("→", "◐", "Ψ"))
+
+def test_other_operators_are_left_associative():
+    for op in ("=", "⇌", "+", "×"):
+        assert shape(parse_expression(f"∴ {op} ◐ {op} Ψ")) == (op, (op, "∴", "◐"), "Ψ")
+
+def test_parentheses_override_precedence():
+    assert shape(parse_expression("(∴ + ◐) × Ψ")) == ("×", ("()", ("+", "∴", "◐")), "Ψ")
+
+def test_juxtaposition_is_a_sequence():
+    assert shape(parse_expression("∴ ∞ ∴")) == ["seq", "∴", "∞", "∴"]
+
+def test_oscillation_without_operands_is_a_symbol():
+    assert shape(parse_expression("⇌")) == "⇌"
+    assert shape(parse_expression("꩜ ⇌")) == ["seq", "꩜", "⇌"]
+
+def test_spans_and_source():
+    tree = parse_expression("∴ + (◐ × Ψ)")
+    assert tree.span == (0, 11)
+    assert tree.right.span == (4, 11)
+    assert to_source(tree.right, lex("∴ + (◐ × Ψ)")) == "( ◐ × Ψ )"
+
+def test_known_symbols_turn_other_atoms_into_literals():
+    assert shape(parse_expression("∴ + foo", known_symbols={"∴"})) == ("+", "∴", ("lit", "foo"))
+
+# Entrada malformada nunca é rejeitada
+
+def test_unclosed_paren_is_an_open_group():
+    tree = parse_expression("(∴")
+    assert isinstance(tree, Group) and not tree.closed
+    assert shape(tree) == ("(", "∴")
+    assert shape(parse_expression("(∴ + ◐")) == ("(", ("+", "∴", "◐"))
+    assert shape(parse_expression("(")) == ("(", None)
+
+def test_stray_close_paren_is_a_literal():
+    assert shape(parse_expression(")")) == ("lit", ")")
+    assert shape(parse_expression("∴ )")) == ["seq", "∴", ("lit", ")")]
+    assert shape(parse_expression("∴ ) + ◐")) == ("+", ["seq", "∴", ("lit", ")")], "◐")
+    assert shape(parse_expression("(∴)) × ◐")) == ("×", ["seq", ("()", "∴"), ("lit", ")")], "◐")
+
+def test_operator_without_operands_is_a_literal():
+    assert shape(parse_expression("+ ∴")) == ["seq", ("lit", "+"), "∴"]
+    assert shape(parse_expression("∴ →")) == ["seq", "∴", ("lit", "→")]
+    assert shape(parse_expression("=")) == ("lit", "=")
+
+def test_empty_expression():
+    assert parse_expression("") is None
+    assert parse_expression("   ") is None
+
+def test_malformed_expressions_still_evaluate():
+    for expression in ("(∴", "∴ )", ")", "+ ∴", "∴ →", "→", "((∴ + ◐", "∴ ) ) → ◐"):
+        assert interpret_result(expression, SymbolContext()).events
+
+def test_long_chains_do_not_recurse():
+    expression = " + ".join(["∴"] * 5000)
+    assert parse_expression(expression).span == (0, len(expression))
+
+# Operandos de transições
+
+def test_transition_operands_come_from_the_ast():
+    plan = compile_expression("(∴ + ◐) → ⇧ Ω")
+    (transition,) = plan.transitions
+    assert transition.origin_key == "( ∴ + ◐ )"
+    assert transition.target_key == "⇧ Ω"
+
+def test_transition_inside_an_equation_assigns_its_target():
+    # = binds weaker than →, so the transition is ◐ → ⇧ and ⇧ receives ◐'s value
+    previous = use_random(random.Random(1))
+    try:
+        context = SymbolContext()
+        result = interpret_result("● = ◐ → ⇧ = Ω", context)
+    finally:
+        use_random(previous)
+    (transition,) = result.transitions()
+    assert (transition.origin_key, transition.target_key) == ("◐", "⇧")
+    assert context["⇧"] == context["◐"]
+    assert transition.result == context["◐"]
+
+def test_chained_transitions():
+    plan = compile_expression("∴ → ◐ → Ψ")
+    assert [(t.origin_key, t.target_key) for t in plan.transitions] == [("∴", "◐ → Ψ"), ("◐", "Ψ")]
@@ -0,0 +1,104 @@
+# Decoding service (alien_symbolic/server.py) and its client (alien_symbolic/client.py):
+# request handling, seeded responses matching decode_expression(), pipelined requests
+# answered in order over TCP and Unix sockets, errors, and the process pool.
+# Run from the repository root: python -m pytest -q
+
+import asyncio
+import json
+import random
+import socket
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from alien_symbolic import SymbolContext, decode_expression, phenomena, signals, use_random
+from alien_symbolic.client import DecodeClient, load_test
+from alien_symbolic.server import DecodeServer, handle_request
+
+async def shutdown(server):
+    await server.close()
+    # Conexões que o servidor ainda não viu fechar
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+@contextmanager
+def running_server(path=None, **options):
+    # Servidor num loop próprio em outro thread; o teste usa o cliente bloqueante
+    loop = asyncio.new_event_loop()
+    server = DecodeServer(**options)
+    listener = loop.run_until_complete(server.start(port=0, path=path))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, (None if path else listener.sockets[0].getsockname()[1])
+    finally:
+        asyncio.run_coroutine_threadsafe(shutdown(server), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+        loop.close()
+
+def seeded_decode(expression, seed):
+    previous = use_random(random.Random(seed))
+    try:
+        return decode_expression(expression, SymbolContext())
+    finally:
+        use_random(previous)
+
+def test_handle_request():
+    response = handle_request({"id": 1, "op": "interpret", "expression": "∴ ✧ Ω", "seed": 7})
+    assert response == dict(seeded_decode("∴ ✧ Ω", 7), id=1)
+    assert handle_request({"id": 2, "op": "phenomenon", "name": "Wormhole"})["equation"] == phenomena["Wormhole"][0]
+    found = handle_request({"op": "phenomenon", "expression": "∴ + ◐ = Ψ", "search": True})
+    assert found["phenomenon"] == "Quantum Superposition" and found["matches"]
+    assert len(handle_request({"op": "signal", "name": "Wow!"})["expressions"]) == len(signals["Wow!"])
+    assert handle_request({"id": 3, "op": "ping"}) == {"id": 3}
+    assert "error" in handle_request({"id": 4, "op": "nope"})
+    assert "error" in handle_request({"op": "interpret"})
+    assert "error" in handle_request({"op": "signal", "name": "No Such Signal"})
+    assert handle_request(["not", "an", "object"])["id"] is None
+
+def test_client_over_tcp():
+    with running_server() as (server, port):
+        with DecodeClient(port=port, timeout=10) as client:
+            assert client.interpret("∴ ✧ Ω", seed=7) == dict(seeded_decode("∴ ✧ Ω", 7), id=1)
+            events = client.interpret("∴ → ⧗", seed=7, events=True)["events"]
+            assert [event["type"] for event in events] == ["symbol", "transition"]
+            assert client.phenomenon("Wormhole")["phenomenon"] == "Wormhole"
+            assert client.signal(expressions=["●", "∴ + ◐"], seed=1)["signal"] is None
+            assert "error" in client.request("nope")
+        assert server.stats()["requests"] == 5
+
+def test_pipelined_requests_keep_their_order():
+    requests = [{"id": i, "op": "interpret", "expression": "∴ ✧", "seed": i} for i in range(200)]
+    with running_server(batch_size=16) as (server, port):
+        with socket.create_connection(("127.0.0.1", port), 10) as conn:
+            data = "".join(json.dumps(request, ensure_ascii=False) + "\n" for request in requests)
+            conn.sendall(("{broken\n\n" + data).encode("utf-8"))
+            stream = conn.makefile("rb")
+            assert "invalid JSON" in json.loads(stream.readline())["error"]
+            responses = [json.loads(stream.readline()) for _ in requests]
+        assert [response["id"] for response in responses] == list(range(200))
+        assert responses[5] == dict(seeded_decode("∴ ✧", 5), id=5)
+        # Requisições enviadas juntas são decodificadas em lotes
+        assert server.stats()["batches"] < len(requests)
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix sockets")
+def test_client_over_unix_socket(tmp_path):
+    path = str(tmp_path / "alien.sock")
+    with running_server(path=path):
+        with DecodeClient(path=path, timeout=10) as client:
+            assert client.request("ping", id=9) == {"id": 9}
+
+def test_worker_pool_gives_the_same_responses():
+    with running_server(workers=1) as (server, port):
+        with DecodeClient(port=port, timeout=30) as client:
+            assert client.interpret("∴ ✧ Ω", seed=7) == dict(seeded_decode("∴ ✧ Ω", 7), id=1)
+
+def test_load_test():
+    with running_server() as (server, port):
+        report = asyncio.run(load_test(port=port, requests=300, connections=3, depth=4, op="mixed"))
+    assert report.requests == 300 and report.errors == 0
+    assert report.latency_p50 <= report.latency_max
@@ -0,0 +1,88 @@
+# Session log (alien_symbolic/session.py): records appended to the JSON Lines file come
+# back in order, filtered by tab, and export streams them as text, JSON Lines or CSV in
+# chunks of any size with the same content.
+# Run from the repository root: python -m pytest -q
+
+import csv
+import io
+import json
+
+import pytest
+
+from alien_symbolic.session import FIELDS, SessionLog, export_records, format_for_path
+
+def record(run, kind, expression, tab="output", source=None, result="ok", phenomenon=None, meaning=None, error=None):
+    return {
+        "timestamp": "2026-01-01 00:00:00", "tab": tab, "run": run, "kind": kind, "source": source,
+        "expression": expression, "result": result, "phenomenon": phenomenon, "meaning": meaning, "error": error,
+    }
+
+RECORDS = [
+    record(1, "expression", "∴ + ◐ = Ψ", phenomenon="Quantum Superposition", meaning="Superposition"),
+    record(2, "signal", "∴", tab="signals", source="Wow!"),
+    record(2, "signal", "✧", tab="signals", source="Wow!", result=None, error="boom"),
+    record(3, "phenomenon", "● ⇌ ✧", tab="phenomena", source="Glow", meaning="light"),
+    record(4, "stream", "Ω", tab="stream", source="sensor"),
+]
+
+def session(tmp_path):
+    log = SessionLog(str(tmp_path / "session.jsonl"))
+    for item in RECORDS:
+        log.append(item)
+    return log
+
+def test_records_round_trip_and_filter(tmp_path):
+    log = session(tmp_path)
+    assert list(log.records()) == RECORDS
+    assert list(log.records("signals")) == RECORDS[1:3]
+    assert log.new_run() == 1 and log.new_run() == 2
+    log.close()
+
+def test_partial_last_line_is_skipped(tmp_path):
+    log = session(tmp_path)
+    log.close()
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write('{"run": 5')
+    reopened = SessionLog(log.path)
+    assert list(reopened.records()) == RECORDS
+    reopened.close()
+
+def test_text_export(tmp_path):
+    log = session(tmp_path)
+    out = io.StringIO()
+    assert log.export(out) == len(RECORDS)
+    text = out.getvalue()
+    assert text.count("---\n") == 4  # Um separador por run
+    assert ">>> Simulating Signal: Wow!" in text
+    assert "Phenomenon Detected: Quantum Superposition" in text
+    assert "Error: boom" in text
+    assert ">>> Phenomenon: Glow" in text and "Meaning: light" in text
+    assert ">>> Streaming: sensor" in text
+    log.close()
+
+def test_jsonl_and_csv_exports(tmp_path):
+    log = session(tmp_path)
+    out = io.StringIO()
+    assert log.export(out, "jsonl", tab="signals") == 2
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == RECORDS[1:3]
+    out = io.StringIO()
+    assert log.export(out, "csv") == len(RECORDS)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row["expression"] for row in rows] == [item["expression"] for item in RECORDS]
+    assert list(rows[0]) == list(FIELDS)
+    log.close()
+
+def test_chunk_size_does_not_change_the_export():
+    records = RECORDS * 7
+    for fmt in ("text", "jsonl", "csv"):
+        whole, chunked = io.StringIO(), io.StringIO()
+        export_records(iter(records), whole, fmt)
+        assert export_records(iter(records), chunked, fmt, chunk_size=2) == len(records)
+        assert chunked.getvalue() == whole.getvalue()
+
+def test_formats():
+    assert format_for_path("out.JSONL") == "jsonl"
+    assert format_for_path("out.csv") == "csv"
+    assert format_for_path("out.txt") == "text"
+    with pytest.raises(ValueError):
+        export_records([], io.StringIO(), "xml")
@@ -0,0 +1,102 @@
+# Streaming ingestion (alien_symbolic/stream.py): windowing over token lines, decoded
+# windows in order, backpressure holding the reader back when the sink is slow, stopping
+# an endless stream, socket sources and errors raised by the source.
+# Run from the repository root: python -m pytest -q
+
+import socket
+import threading
+import time
+
+import pytest
+
+from alien_symbolic import SymbolContext, decode_expression
+from alien_symbolic.stream import StreamPipeline, socket_lines, tokenize, windows
+
+def window_tokens(lines, size=0, step=None):
+    return [window.tokens for window in windows(tokenize(lines), size, step)]
+
+def test_one_window_per_line():
+    assert window_tokens(["∴ → ⧗", "", "Ω"]) == [("∴", "→", "⧗"), ("Ω",)]
+
+def test_windows_across_lines():
+    lines = ["∴ ✧", "⧗ ⬠ Ω", "Ψ"]
+    assert window_tokens(lines, 2) == [("∴", "✧"), ("⧗", "⬠"), ("Ω", "Ψ")]
+    assert window_tokens(lines, 3, 1) == [("∴", "✧", "⧗"), ("✧", "⧗", "⬠"), ("⧗", "⬠", "Ω"), ("⬠", "Ω", "Ψ")]
+    assert window_tokens(lines, 1, 2) == [("∴",), ("⧗",), ("Ω",)]
+    indexes = [window.index for window in windows(tokenize(lines), 3, 1)]
+    assert indexes == [0, 1, 2, 3]
+
+def test_pipeline_decodes_windows_in_order():
+    lines = ["Ψ + ∅", "꩜ → ●", "● ⇌ ◐"] * 20
+    results = list(StreamPipeline(iter(lines)).results())
+    assert [result.window.index for result in results] == list(range(len(lines)))
+    assert [result.record for result in results] == [decode_expression(line, SymbolContext()) for line in lines]
+
+def test_stats():
+    pipeline = StreamPipeline(iter(["Ω ⧗"] * 10))
+    stats = pipeline.run(lambda result: None)
+    assert (stats.windows, stats.tokens) == (10, 20)
+    assert 0 <= stats.latency_p50 <= stats.latency_p95 <= stats.latency_max
+
+def test_slow_sink_holds_the_reader_back():
+    read = 0
+
+    def lines():
+        nonlocal read
+        for _ in range(40):
+            read += 1
+            yield "Ω"
+
+    pipeline = StreamPipeline(lines(), queue_size=1)
+    handled = 0
+    for _ in pipeline.results():
+        handled += 1
+        time.sleep(0.005)
+        # Uma janela em cada fila, uma em cada thread e a que está sendo lida
+        assert read <= handled + 5
+    assert handled == 40
+    assert pipeline.stats().stalls > 0
+
+def test_should_stop_ends_an_endless_stream():
+    def forever():
+        while True:
+            yield "∴ ✧"
+
+    pipeline = StreamPipeline(forever(), queue_size=4)
+    results = []
+    pipeline.run(results.append, should_stop=lambda: len(results) >= 25)
+    assert len(results) == 25 and pipeline.stopped
+    for thread in pipeline._threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+def test_source_errors_are_raised():
+    def broken():
+        yield "Ω"
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        list(StreamPipeline(broken()).results())
+
+def test_socket_source():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+
+    def send():
+        conn, _ = server.accept()
+        with conn:
+            # Linhas partidas entre envios e um caractere de vários bytes dividido
+            data = "∴ → ⧗\r\nΩ\n● ⇌ ◐".encode("utf-8")
+            conn.sendall(data[:2])
+            time.sleep(0.05)
+            conn.sendall(data[2:])
+
+    sender = threading.Thread(target=send)
+    sender.start()
+    try:
+        assert list(socket_lines(f"127.0.0.1:{port}")) == ["∴ → ⧗", "Ω", "● ⇌ ◐"]
+    finally:
+        sender.join(5)
+        server.close()